@@ -0,0 +1,18 @@
+"""
+Headless performance benchmarks for the ggame engine.
+
+The workloads in :mod:`benchmarks.workloads` exercise the engine hot paths
+(sprite extents, collision tests, MathApp visuals, timers, rocket dynamics,
+labels and event routing). Run them from the repository root with::
+
+    $ python3.11 -m benchmarks --save baseline.json
+    $ python3.11 -m benchmarks --compare baseline.json --threshold 0.25
+
+Results are stored as JSON. In compare mode any workload that is slower than
+its baseline by more than the threshold is flagged and the command exits with
+a non-zero status.
+
+Select the null backend to time the game logic without any rendering work::
+
+    $ GGAME_BACKEND=null python3.11 -m benchmarks
+"""
@@ -0,0 +1,151 @@
+"""
+Command line runner for the ggame benchmark suite.
+
+Usage::
+
+    python3.11 -m benchmarks [--list] [--save FILE] [--compare FILE]
+                             [--threshold FRACTION] [--scale FACTOR]
+                             [--repeat N] [name ...]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from benchmarks.workloads import WORKLOADS
+
+
+def timeWorkload(name, scale, repeat):
+    """
+    Time a single workload, returning the list of run times in seconds. Each
+    repetition builds a fresh scene; only the `run` phase is timed. Output
+    printed by the graphics backend is discarded.
+
+    :param str name: Registered workload name.
+    :param float scale: Workload size factor.
+    :param int repeat: Number of timed repetitions.
+    :rtype: list[float]
+    """
+    func, defaultrepeat = WORKLOADS[name]
+    times = []
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        for _ in range(repeat or defaultrepeat):
+            with contextlib.redirect_stdout(devnull):
+                run, teardown = func(scale)
+                try:
+                    start = time.perf_counter()
+                    run()
+                    times.append(time.perf_counter() - start)
+                finally:
+                    teardown()
+    return times
+
+
+def runSuite(names, scale, repeat):
+    """
+    Time each of the named workloads.
+
+    :returns: Dictionary of name -> result dictionary with `best`, `median`
+        and `repeat` entries.
+    """
+    results = {}
+    for name in names:
+        times = timeWorkload(name, scale, repeat)
+        results[name] = {
+            "best": min(times),
+            "median": statistics.median(times),
+            "repeat": len(times),
+        }
+    return results
+
+
+def compareResults(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    :returns: List of (name, best, baseline best or None, ratio or None,
+        regressed) tuples.
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, result["best"], None, None, False))
+            continue
+        ratio = result["best"] / base["best"] if base["best"] else None
+        regressed = ratio is not None and ratio > 1 + threshold
+        rows.append((name, result["best"], base["best"], ratio, regressed))
+    return rows
+
+
+def _report(rows):
+    print(f"{'workload':<20} {'best ms':>10} {'base ms':>10} {'ratio':>7}")
+    for name, best, base, ratio, regressed in rows:
+        basetext = f"{base * 1000:10.2f}" if base is not None else f"{'-':>10}"
+        ratiotext = f"{ratio:7.2f}" if ratio is not None else f"{'-':>7}"
+        flag = "  SLOWER" if regressed else ""
+        print(f"{name:<20} {best * 1000:10.2f} {basetext} {ratiotext}{flag}")
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the selected workloads and save or compare
+    results. Returns the process exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="benchmarks", description="ggame headless benchmark suite"
+    )
+    parser.add_argument("names", nargs="*", help="workloads to run (default all)")
+    parser.add_argument("--list", action="store_true", help="list workloads")
+    parser.add_argument("--save", metavar="FILE", help="save results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare with baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fractional slowdown flagged as a regression (default 0.25)",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="workload size factor")
+    parser.add_argument("--repeat", type=int, default=0, help="repetitions")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (func, _repeat) in WORKLOADS.items():
+            print(f"{name:<20} {func.__doc__.strip().splitlines()[0]}")
+        return 0
+    names = args.names or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(unknown)}")
+
+    results = runSuite(names, args.scale, args.repeat)
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        if saved.get("scale", 1.0) != args.scale:
+            print("warning: baseline was recorded with a different --scale")
+    rows = compareResults(results, baseline, args.threshold)
+    _report(rows)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "scale": args.scale,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
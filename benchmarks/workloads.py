@@ -0,0 +1,590 @@
+"""
+Benchmark workloads for the ggame engine.
+
+Each workload is registered with the :func:`workload` decorator. A workload
+function accepts a `scale` factor (1.0 for the full size workload) and builds
+its scene, returning a pair of callables: `run`, which performs the timed
+work, and `teardown`, which releases everything the workload created. Only
+`run` is timed.
+"""
+
+import os
+import random
+import subprocess
+import sys
+from ggame.asset import RectangleAsset, PolylineAsset, Color, LineStyle
+from ggame.sprite import Sprite
+from ggame.app import App
+from ggame.mathapp import MathApp
+from ggame.point import Point
+from ggame.circle import Circle
+from ggame.label import Label
+from ggame.line import LineSegment
+from ggame.slider import Slider
+from ggame.plot import FunctionPlot
+from ggame.timer import Timer
+from ggame.astro import Planet, Rocket
+from ggame.logic import BoolAND, BoolNAND, BoolNOR, BoolNOT, Circuit
+
+WORKLOADS = {}
+"""
+Dictionary of registered workloads: name -> (function, default repeat count).
+"""
+
+
+def workload(name, repeat=5):
+    """
+    Decorator for registering a benchmark workload function under `name`.
+
+    :param str name: Name used to report and select the workload.
+    :param int repeat: Default number of timed repetitions.
+    """
+
+    def register(func):
+        WORKLOADS[name] = (func, repeat)
+        return func
+
+    return register
+
+
+def _size(count, scale):
+    return max(1, int(count * scale))
+
+
+def _advance(app, seconds):
+    """
+    Step a MathApp as though `seconds` of wall clock time had elapsed.
+    """
+    app._starttime -= seconds  # pylint: disable=protected-access
+    app.step()
+
+
+class _HwKeyEvent:
+    """
+    Stand-in for a system keyboard event.
+    """
+
+    def __init__(self, etype, code):
+        self.type = etype
+        self.keyCode = code
+
+
+class _HwMouseEvent:
+    """
+    Stand-in for a system mouse event.
+    """
+
+    def __init__(self, etype, x, y, delta=0):
+        self.type = etype
+        self.clientX = x
+        self.clientY = y
+        self.deltaY = delta
+
+
+def _destroySprites(sprites):
+    for s in reversed(sprites):
+        s.destroy()
+
+
+@workload("sprite-move")
+def spriteMove(scale):
+    """
+    10k sprites moved and rotated every frame, with extents recomputed.
+    """
+    asset = RectangleAsset(10, 10, LineStyle(1, Color(0, 1)), Color(0xFF0000, 1))
+    sprites = [
+        Sprite(asset, (i % 100 * 10, i // 100 * 10)) for i in range(_size(10000, scale))
+    ]
+
+    def run():
+        for s in sprites:
+            s.x += 1
+            s.y -= 1
+            s.rotation += 0.01
+            s.setExtents()
+
+    return run, lambda: _destroySprites(sprites)
+
+
+@workload("polyline-append")
+def polylineAppend(scale):
+    """
+    A path of thousands of segments, grown a few points at a time.
+    """
+    count = _size(500, scale)
+    points = [
+        [(i * 10 + j, (i * 10 + j) % 97) for j in range(10)] for i in range(count)
+    ]
+    paths = []
+
+    def run():
+        path = PolylineAsset([(0, 0)], LineStyle(1, Color(0, 1)))
+        for chunk in points:
+            path.extend(chunk)
+        paths.append(path)
+
+    def teardown():
+        for path in paths:
+            path.destroy()
+
+    return run, teardown
+
+
+@workload("sprite-collide")
+def spriteCollide(scale):
+    """
+    All-pairs collision tests among a few hundred sprites.
+    """
+    rand = random.Random(1)
+    asset = RectangleAsset(20, 20, LineStyle(1, Color(0, 1)), Color(0xFF0000, 1))
+    sprites = [
+        Sprite(asset, (rand.randint(0, 500), rand.randint(0, 500)))
+        for i in range(_size(400, scale))
+    ]
+
+    def run():
+        for s in sprites:
+            s.collidingWithSprites()
+
+    return run, lambda: _destroySprites(sprites)
+
+
+@workload("mathapp-visuals")
+def mathappVisuals(scale):
+    """
+    1k logic-bound MathApp Point and Circle visuals driven by a shared phase.
+    """
+    phase = [0.0]
+    count = _size(500, scale)
+    visuals = []
+    for i in range(count):
+        p = Point(lambda i=i: (i % 25 * 0.1 + phase[0], i // 25 * 0.1))
+        visuals.append(p)
+        visuals.append(Circle(p, 0.05))
+    app = MathApp()
+
+    def run():
+        for _ in range(10):
+            phase[0] += 0.01
+            _advance(app, 1 / 60)
+
+    def teardown():
+        _destroySprites(visuals)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("construction-graph")
+def constructionGraph(scale):
+    """
+    Hundreds of construction points and segments, with one moving slider.
+    """
+    count = _size(500, scale)
+    slider = Slider((10, 10), 0.1, 1, 0.5, positioning="physical", steps=90)
+    bases = [Point((i % 25 * 0.1, i // 25 * 0.1)) for i in range(count)]
+    visuals = [slider] + bases
+    visuals += [Point(p) for p in bases]
+    visuals += [LineSegment(bases[i - 1], bases[i]) for i in range(1, count)]
+    visuals += [Circle(bases[i], slider) for i in range(0, count, 25)]
+    app = MathApp()
+
+    def run():
+        for frame in range(60):
+            slider.value = 0.1 + frame % 90 / 100
+            _advance(app, 1 / 60)
+
+    def teardown():
+        _destroySprites(visuals)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("point-drag")
+def pointDrag(scale):
+    """
+    A point dragged by the mouse, with dependent segments and circles.
+    """
+    hub = Point((0, 0))
+    hub.movable = True
+    count = _size(100, scale)
+    ends = [Point((i % 10 * 0.2 - 1, i // 10 * 0.2 - 1)) for i in range(count)]
+    visuals = [hub] + ends + [LineSegment(hub, p) for p in ends]
+    visuals += [Circle(hub, p) for p in ends[::10]]
+    app = MathApp()
+    events = [_HwMouseEvent("mousedown", 0.5, 0.5)]
+    for i in range(200):
+        events.append(_HwMouseEvent("mousemove", 0.5 + i % 50 / 1000, 0.5))
+        events.append(_HwMouseEvent("mousemove", 0.5, 0.5))
+    events.append(_HwMouseEvent("mouseup", 0.5, 0.5))
+
+    def run():
+        for e in events:
+            App._mouseEvent(e)  # pylint: disable=protected-access
+            _advance(app, 1 / 60)
+
+    def teardown():
+        _destroySprites(visuals)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("timer-callbacks")
+def timerCallbacks(scale):
+    """
+    One Timer scheduling and firing 10k callbacks.
+    """
+    app = MathApp()
+    timer = Timer()
+    count = _size(10000, scale)
+    fired = [0]
+
+    def callback(_timer):
+        fired[0] += 1
+
+    def run():
+        for i in range(count):
+            timer.callAfter((i % 600) / 60, callback)
+        while fired[0] < count:
+            _advance(app, 1 / 60)
+        fired[0] = 0
+
+    def teardown():
+        timer.destroy()
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("timer-cooldowns")
+def timerCooldowns(scale):
+    """
+    A thousand Timers, each with a periodic cooldown callback, for 600
+    frames.
+    """
+    app = MathApp()
+    rng = random.Random(3)
+    fired = [0]
+
+    def callback(_timer):
+        fired[0] += 1
+
+    timers = [Timer() for i in range(_size(1000, scale))]
+    for timer in timers:
+        timer.callEvery(rng.uniform(0.5, 5), callback)
+
+    def run():
+        for _frame in range(600):
+            _advance(app, 1 / 60)
+
+    def teardown():
+        for timer in timers:
+            timer.destroy()
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("rocket-rk4")
+def rocketRK4(scale):
+    """
+    Rocket dynamics at high time zoom, one integration step per frame.
+    """
+    earth = Planet(viewscale=0.00005)
+    rocket = Rocket(earth, altitude=400000, velocity=7670, timezoom=4, showstatus=False)
+    frames = _size(1000, scale)
+
+    def run():
+        for _ in range(frames):
+            _advance(earth, 1 / 30)
+
+    def teardown():
+        rocket.destroy()
+        Planet.destroy()
+
+    return run, teardown
+
+
+@workload("rocket-trail")
+def rocketTrail(scale):
+    """
+    A rocket on a fast orbit, drawing a long trail.
+    """
+    earth = Planet(viewscale=0.00005)
+    rocket = Rocket(
+        earth,
+        altitude=400000,
+        velocity=7670,
+        timezoom=2,
+        showstatus=False,
+        trail=2000,
+    )
+    frames = _size(1000, scale)
+
+    def run():
+        for _ in range(frames):
+            _advance(earth, 1 / 30)
+
+    def teardown():
+        rocket.destroy()
+        Planet.destroy()
+
+    return run, teardown
+
+
+@workload("logic-circuit")
+def logicCircuit(scale):
+    """
+    A random 2k gate logic circuit with 32 inputs, settled after each of
+    1000 input changes.
+    """
+    rng = random.Random(4)
+    inputs = [False] * 32
+    signals = [lambda i=i: inputs[i] for i in range(len(inputs))]
+    gates = []
+    for _i in range(_size(2000, scale)):
+        gate = rng.choice((BoolAND, BoolNAND, BoolNOR, BoolNOT))()
+        gate.inp = rng.sample(signals[-200:], 1 if isinstance(gate, BoolNOT) else 2)
+        gates.append(gate)
+        signals.append(gate)
+    circuit = Circuit(*gates[-100:])
+
+    def run():
+        for _change in range(1000):
+            i = rng.randrange(len(inputs))
+            inputs[i] = not inputs[i]
+            circuit.settle()
+
+    def teardown():
+        for gate in gates:
+            gate.destroy()
+
+    return run, teardown
+
+
+@workload("label-churn")
+def labelChurn(scale):
+    """
+    Dynamic labels whose text changes every frame.
+    """
+    counter = [0]
+    labels = [
+        Label(
+            (10, 10 + 20 * i),
+            lambda i=i: f"Value {i}: {counter[0] % 97:8.1f}",
+            size=15,
+            positioning="physical",
+            width=250,
+        )
+        for i in range(_size(50, scale))
+    ]
+    app = MathApp()
+
+    def run():
+        for _ in range(100):
+            counter[0] += 1
+            _advance(app, 1 / 60)
+
+    def teardown():
+        _destroySprites(labels)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("key-event-storm")
+def keyEventStorm(scale):
+    """
+    Keyboard events routed to a set of specific and wildcard listeners.
+    """
+    app = App()
+    hits = [0]
+
+    def handler(_event):
+        hits[0] += 1
+
+    handlers = [lambda event, h=handler: h(event) for i in range(10)]
+    for h in handlers:
+        app.listenKeyEvent("keydown", "space", h)
+        app.listenKeyEvent("keydown", "*", h)
+    events = [_HwKeyEvent("keydown", 32 if i % 2 else 65) for i in range(1000)]
+    rounds = _size(10, scale)
+
+    def run():
+        for _ in range(rounds):
+            for e in events:
+                App._keyEvent(e)  # pylint: disable=protected-access
+
+    return run, App.destroy
+
+
+@workload("mouse-event-storm")
+def mouseEventStorm(scale):
+    """
+    Mouse clicks, drags (panning) and wheel events in a MathApp with many
+    selectable points.
+    """
+    points = []
+    for i in range(_size(200, scale)):
+        p = Point((i % 20 * 0.1, i // 20 * 0.1))
+        p.movable = True
+        p.selectable = True
+        points.append(p)
+    app = MathApp()
+    initialscale = MathApp.scale
+    events = []
+    for i in range(200):
+        events.append(_HwMouseEvent("click", i % 100 / 100, i // 100 / 100))
+    events.append(_HwMouseEvent("mousedown", 0.99, 0.99))
+    for i in range(100):
+        events.append(_HwMouseEvent("mousemove", 0.99 - i / 1000, 0.99))
+    events.append(_HwMouseEvent("mouseup", 0.9, 0.99))
+    for i in range(20):
+        events.append(_HwMouseEvent("wheel", 0.5, 0.5, 10 if i % 2 else -10))
+
+    def run():
+        for e in events:
+            App._mouseEvent(e)  # pylint: disable=protected-access
+        MathApp.scale = initialscale
+        app.view_position = (0, 0)
+
+    def teardown():
+        _destroySprites(points)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("pan-zoom")
+def panZoom(scale):
+    """
+    Interactive panning and wheel zooming over a large construction.
+    """
+    count = _size(400, scale)
+    points = [Point((i % 20 * 0.1 - 1, i // 20 * 0.1 - 1)) for i in range(count)]
+    visuals = points + [LineSegment(points[i - 1], points[i]) for i in range(1, count)]
+    visuals += [Circle(p, 0.05) for p in points[::4]]
+    app = MathApp()
+    events = [_HwMouseEvent("mousedown", 0.01, 0.01)]
+    for i in range(100):
+        events.append(_HwMouseEvent("mousemove", 0.01 + i % 20 / 1000, 0.01))
+    events.append(_HwMouseEvent("mouseup", 0.01, 0.01))
+    events += [
+        _HwMouseEvent("wheel", 0.5, 0.5, 10 if i < 10 else -10) for i in range(20)
+    ]
+
+    def run():
+        app.view_position = (0, 0)
+        for e in events:
+            App._mouseEvent(e)  # pylint: disable=protected-access
+            _advance(app, 1 / 60)
+        _advance(app, 1)
+
+    def teardown():
+        _destroySprites(visuals)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("function-plot")
+def functionPlot(scale):
+    """
+    Plots of a vectorized and a scalar function, panned and zoomed.
+    """
+    plots = [
+        FunctionPlot(lambda x: x**3 / 4 - x),
+        FunctionPlot(lambda x: 1 / x if x else float("nan")),
+    ]
+    app = MathApp()
+    events = [_HwMouseEvent("mousedown", 0.5, 0.5)]
+    for i in range(_size(200, scale)):
+        events.append(_HwMouseEvent("mousemove", 0.5 - i / 400, 0.5))
+    events.append(_HwMouseEvent("mouseup", 0.5, 0.5))
+    events += [
+        _HwMouseEvent("wheel", 0.5, 0.5, 10 if i < 5 else -10) for i in range(10)
+    ]
+
+    def run():
+        app.view_position = (0, 0)
+        for e in events:
+            App._mouseEvent(e)  # pylint: disable=protected-access
+            _advance(app, 1 / 60)
+        _advance(app, 1)
+
+    def teardown():
+        _destroySprites(plots)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("planet-surface")
+def planetSurface(scale):
+    """
+    The view panned along, and zoomed close to, a planet sized circle.
+    """
+    app = MathApp(0.01)
+    planet = Circle((0, 0), 6.371e6)
+    frames = _size(300, scale)
+
+    def run():
+        for i in range(frames):
+            app.view_position = (i % 30 * 100, 6.371e6 + i % 7 * 50)
+            _advance(app, 1 / 60)
+
+    def teardown():
+        planet.destroy()
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("hit-test")
+def hitTest(scale):
+    """
+    Clicks and presses over a large diagram of movable, selectable points.
+    """
+    points = []
+    for i in range(_size(2000, scale)):
+        p = Point((i % 50 * 0.02 - 0.5, i // 50 * 0.02 - 0.4))
+        p.movable = True
+        p.selectable = True
+        points.append(p)
+    app = MathApp()
+    app.view_position = (0, 0)
+    rand = random.Random(1)
+    events = []
+    for i in range(500):
+        x, y = rand.uniform(0, app.width), rand.uniform(0, app.height)
+        events.append(_HwMouseEvent("click", x / app.width, y / app.height))
+        events.append(_HwMouseEvent("mousedown", x / app.width, y / app.height))
+        events.append(_HwMouseEvent("mouseup", x / app.width, y / app.height))
+
+    def run():
+        for e in events:
+            App._mouseEvent(e)  # pylint: disable=protected-access
+
+    def teardown():
+        _destroySprites(points)
+        MathApp.destroy()
+
+    return run, teardown
+
+
+@workload("cold-start", repeat=3)
+def coldStart(scale):
+    """
+    Interpreter start-up and import of a headless ggame sprite program.
+    """
+    env = dict(os.environ, GGAME_BACKEND="headless")
+    command = [sys.executable, "-c", "from ggame.sprite import Sprite"]
+    runs = _size(10, scale)
+
+    def run():
+        for _ in range(runs):
+            subprocess.run(command, env=env, check=True)
+
+    return run, lambda: None
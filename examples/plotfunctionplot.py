@@ -0,0 +1,14 @@
+"""
+Example of using MathApp FunctionPlot class.
+"""
+from math import sin
+from ggame.plot import FunctionPlot
+from ggame.slider import Slider
+from ggame.mathapp import MathApp
+
+# a slider for the frequency of the wave
+FREQ = Slider((100, 150), 0.5, 5, 1, positioning="physical")
+# plot y = sin(fx), redrawn whenever the slider is moved
+PLOT = FunctionPlot(lambda x, f: sin(f * x), params=FREQ)
+
+MathApp().run()
@@ -1,11 +1,104 @@
 """
 ggame package defines names that may be imported directly from ggame (legacy)
+
+These names are loaded lazily: importing :mod:`ggame` by itself does not load
+the graphics and sound backend. The backend is loaded the first time one of the
+names below (or any ggame module that uses the backend) is imported.
 """
+
+import os
+import sys
+from importlib import import_module
 from .__version__ import VERSION
-from .asset import ImageAsset, TextAsset, CircleAsset, RectangleAsset
-from .asset import PolygonAsset, LineAsset, EllipseAsset
-from .asset import Frame, Color, LineStyle, BLACK, WHITE, BLACKLINE, WHITELINE
-from .sound import SoundAsset, Sound
-from .sprite import Sprite
-from .app import App
-from .event import KeyEvent, MouseEvent
+
+# typing.TYPE_CHECKING, without the cost of importing typing: the imports
+# below are only seen by static analysis tools
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from .asset import (
+        ImageAsset,
+        TextAsset,
+        CircleAsset,
+        RectangleAsset,
+        PolygonAsset,
+        LineAsset,
+        PolylineAsset,
+        EllipseAsset,
+        Frame,
+        Color,
+        LineStyle,
+        BLACK,
+        WHITE,
+        BLACKLINE,
+        WHITELINE,
+    )
+    from .sound import SoundAsset, Sound
+    from .sprite import Sprite
+    from .app import App
+    from .event import KeyEvent, MouseEvent
+
+_LAZYNAMES = {
+    "ImageAsset": "asset",
+    "TextAsset": "asset",
+    "CircleAsset": "asset",
+    "RectangleAsset": "asset",
+    "PolygonAsset": "asset",
+    "LineAsset": "asset",
+    "PolylineAsset": "asset",
+    "EllipseAsset": "asset",
+    "Frame": "asset",
+    "Color": "asset",
+    "LineStyle": "asset",
+    "BLACK": "asset",
+    "WHITE": "asset",
+    "BLACKLINE": "asset",
+    "WHITELINE": "asset",
+    "SoundAsset": "sound",
+    "Sound": "sound",
+    "Sprite": "sprite",
+    "App": "app",
+    "KeyEvent": "event",
+    "MouseEvent": "event",
+}
+
+BACKENDS = ("browser", "pygame", "headless", "null")
+"""
+Names of the built-in backends that may be selected with :func:`setBackend` or
+the `GGAME_BACKEND` environment variable. Other backends may be registered with
+:mod:`ggame.backend`.
+"""
+
+__all__ = ["VERSION", "BACKENDS", "setBackend", *_LAZYNAMES]
+
+
+def __getattr__(name):
+    modname = _LAZYNAMES.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{modname}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZYNAMES))
+
+
+def setBackend(name):
+    """
+    Select the graphics and sound backend to load, without probing for the
+    others. This is equivalent to setting the `GGAME_BACKEND` environment
+    variable, and must be called before the backend is loaded (i.e. before
+    any ggame class is imported).
+
+    :param str name: One of `'browser'`, `'pygame'`, `'headless'` or `'null'`,
+        or the name of a backend registered with :mod:`ggame.backend`.
+    :returns: None
+    """
+    name = name.strip().lower()
+    if not import_module(".backend", __name__).isBackend(name):
+        raise ValueError(f"Unknown ggame backend: {name!r}")
+    sysdeps = sys.modules.get(f"{__name__}.sysdeps")
+    if sysdeps is not None and sysdeps.BACKEND != name:
+        raise RuntimeError(f"The {sysdeps.BACKEND!r} backend is already loaded")
+    os.environ["GGAME_BACKEND"] = name
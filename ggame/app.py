@@ -92,10 +92,11 @@ class App:
 
     @classmethod
     def _keyEvent(cls, hwevent):
+        # build a new list: extending the registered list would grow it
+        # with the wildcard listeners on every event
         evtlist = App._eventdict.get(
             (hwevent.type, KeyEvent.keys.get(hwevent.keyCode, 0)), []
-        )
-        evtlist.extend(App._eventdict.get((hwevent.type, "*"), []))
+        ) + App._eventdict.get((hwevent.type, "*"), [])
         if evtlist:
             evt = KeyEvent(hwevent)
             cls._routeEvent(evt, evtlist)
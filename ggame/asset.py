@@ -5,6 +5,8 @@ may be used in multiple sprites. Animated assets may be created from any
 image that includes multiple images within it (i.e. a sprite sheet).
 """
 
+from collections import OrderedDict
+from math import isnan
 from ggame.sysdeps import (
     GFX_Rectangle,
     GFX_Texture,
@@ -354,13 +356,47 @@ class _GraphicsAsset(_Asset):
 class _CurveAsset(_GraphicsAsset):
     def __init__(self, line):
         super().__init__()
-        GFX_Graphics.lineStyle(line.width, line.color.color, line.color.alpha)
+        self.line = line
+        self._setStyle(GFX_Graphics)
+
+    def _setStyle(self, gfx):
+        gfx.lineStyle(self.line.width, self.line.color.color, self.line.color.alpha)
+
+    def _draw(self, gfx):
+        """
+        Issue the drawing commands for this shape to a graphics object,
+        returning the graphics object. Overridden by each shape.
+        """
+        return gfx
+
+    def redraw(self):
+        """
+        Redraw the asset into its existing graphics object, after its size or
+        shape attributes (e.g. `radius` or `delta_x`) have been changed. The
+        line and fill styles are unchanged. This is much less costly than
+        creating a new asset.
+
+        :returns: None
+        """
+        gfx = self.gfx
+        visible = gfx.visible
+        x, y = gfx.position.x, gfx.position.y
+        gfx.clear()
+        self._setStyle(gfx)
+        self._draw(gfx)
+        gfx.visible = visible
+        gfx.position.x = x
+        gfx.position.y = y
 
 
 class _ShapeAsset(_CurveAsset):
     def __init__(self, line, fill):
+        self.fill = fill
         super().__init__(line)
-        GFX_Graphics.beginFill(fill.color, fill.alpha)
+
+    def _setStyle(self, gfx):
+        super()._setStyle(gfx)
+        gfx.beginFill(self.fill.color, self.fill.alpha)
 
 
 class RectangleAsset(_ShapeAsset):
@@ -378,10 +414,13 @@ class RectangleAsset(_ShapeAsset):
         super().__init__(line, fill)
         self.width = width
         self.height = height
-        self.gfx = GFX_Graphics.drawRect(0, 0, self.width, self.height).clone()
+        self.gfx = self._draw(GFX_Graphics).clone()
         """The `gfx` property represents the underlying system object."""
         self.gfx.visible = False
 
+    def _draw(self, gfx):
+        return gfx.drawRect(0, 0, self.width, self.height)
+
 
 class CircleAsset(_ShapeAsset):
     """
@@ -396,10 +435,13 @@ class CircleAsset(_ShapeAsset):
     def __init__(self, radius, line=BLACKLINE, fill=BLACK):
         super().__init__(line, fill)
         self.radius = radius
-        self.gfx = GFX_Graphics.drawCircle(0, 0, self.radius).clone()
+        self.gfx = self._draw(GFX_Graphics).clone()
         """The `gfx` property represents the underlying system object."""
         self.gfx.visible = False
 
+    def _draw(self, gfx):
+        return gfx.drawCircle(0, 0, self.radius)
+
 
 class EllipseAsset(_ShapeAsset):
     """
@@ -419,10 +461,13 @@ class EllipseAsset(_ShapeAsset):
         super().__init__(line, fill)
         self.halfw = halfw
         self.halfh = halfh
-        self.gfx = GFX_Graphics.drawEllipse(0, 0, self.halfw, self.halfh).clone()
+        self.gfx = self._draw(GFX_Graphics).clone()
         """The `gfx` property represents the underlying system object."""
         self.gfx.visible = False
 
+    def _draw(self, gfx):
+        return gfx.drawEllipse(0, 0, self.halfw, self.halfh)
+
 
 class PolygonAsset(_ShapeAsset):
     """
@@ -449,15 +494,18 @@ class PolygonAsset(_ShapeAsset):
     def __init__(self, path, line=BLACKLINE, fill=BLACK):
         super().__init__(line, fill)
         self.path = path[:]
+        self.gfx = self._draw(GFX_Graphics).clone()
+        """The `gfx` property represents the underlying system object."""
+        self.gfx.visible = False
+
+    def _draw(self, gfx):
         jpath = []
         # close the path if necessary
         if self.path[0] != self.path[-1]:
             self.path.append(self.path[0])
         for point in self.path:
             jpath.extend(point)
-        self.gfx = GFX_Graphics.drawPolygon(jpath).clone()
-        """The `gfx` property represents the underlying system object."""
-        self.gfx.visible = False
+        return gfx.drawPolygon(jpath)
 
 
 class LineAsset(_CurveAsset):
@@ -491,11 +539,185 @@ class LineAsset(_CurveAsset):
         This attribute represents the `y` parameter supplied during
         instantiation.
         """
-        GFX_Graphics.moveTo(0, 0)
-        self.gfx = GFX_Graphics.lineTo(self.delta_x, self.delta_y).clone()
+        self.gfx = self._draw(GFX_Graphics).clone()
+        """The `gfx` property represents the underlying system object."""
+        self.gfx.visible = False
+
+    def _draw(self, gfx):
+        gfx.moveTo(0, 0)
+        return gfx.lineTo(self.delta_x, self.delta_y)
+
+
+class PolylineAsset(_CurveAsset):
+    """
+    The PolylineAsset is a "virtual" asset that is created on the
+    fly without requiring creation of an image file. A PolylineAsset
+    instance represents a connected series of line segments, drawn in a
+    single graphics object however many segments there are.
+
+    As with the :class:`LineAsset`, the coordinates are relative to the
+    :class:`Sprite` position. A point whose x or y coordinate is NaN
+    (`float("nan")`) is not drawn, and breaks the line in two.
+
+    A path that grows (e.g. a trajectory) should be extended with
+    :meth:`append` or :meth:`extend`, which only draw the new segments.
+
+    :param list path: A list of pixel-coordinate tuples, or an N x 2 NumPy
+        array of pixel coordinates.
+    :param LineStyle line=BLACKLINE: The color and width of the line
+    """
+
+    def __init__(self, path, line=BLACKLINE):
+        super().__init__(line)
+        self.path = self._pointList(path)
+        """The list of (x, y) coordinate tuples in the line."""
+        self.gfx = self._draw(GFX_Graphics).clone()
         """The `gfx` property represents the underlying system object."""
         self.gfx.visible = False
 
+    @staticmethod
+    def _pointList(points):
+        # an array is converted in one call, rather than row by row
+        if hasattr(points, "tolist"):
+            points = points.tolist()
+        return [tuple(point) for point in points]
+
+    @staticmethod
+    def _drawPoints(gfx, start, points):
+        """
+        Draw the line through `points`, continuing from the point `start`
+        (None at the beginning of the path).
+        """
+        pendown = start is not None and not (isnan(start[0]) or isnan(start[1]))
+        if pendown:
+            gfx.moveTo(*start)
+        for x, y in points:
+            if isnan(x) or isnan(y):
+                pendown = False
+            elif pendown:
+                gfx.lineTo(x, y)
+            else:
+                gfx.moveTo(x, y)
+                pendown = True
+        return gfx
+
+    def _draw(self, gfx):
+        return self._drawPoints(gfx, None, self.path)
+
+    def append(self, point):
+        """
+        Add a point to the end of the line. Only the new segment is drawn.
+
+        :param tuple(float,float) point: The pixel coordinates of the point.
+        :returns: None
+        """
+        self.extend((point,))
+
+    def extend(self, points):
+        """
+        Add points to the end of the line. Only the new segments are drawn,
+        into the existing graphics object, so this is much less costly than
+        creating a new asset or calling :meth:`redraw`.
+
+        :param list points: A list of pixel-coordinate tuples, or an N x 2
+            NumPy array of pixel coordinates.
+        :returns: None
+        """
+        points = self._pointList(points)
+        if points:
+            start = self.path[-1] if self.path else None
+            self.path.extend(points)
+            self._setStyle(self.gfx)
+            self._drawPoints(self.gfx, start, points)
+
+
+class TextRenderCache:
+    """
+    A bounded, least recently used pool of rendered text objects. Rendering
+    text is costly in every backend, so the render of a :class:`TextAsset`
+    that is no longer displayed is kept here and reused by the next
+    :class:`TextAsset` with the same text and styling. A single instance is
+    shared by all text assets as :data:`TextAsset.rendercache`.
+
+    :param int maxsize: The maximum number of unused renders kept. When the
+        pool is full, the least recently released render is destroyed.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        """Maximum number of unused renders kept in the cache."""
+        self.hits = 0
+        """Number of text assets that reused a cached render."""
+        self.misses = 0
+        """Number of text assets that required a new render."""
+        self._free = OrderedDict()  # key -> list of unused renders
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def hitrate(self):
+        """
+        Fraction of text asset requests served from the cache (0 if there
+        have been none).
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def acquire(self, key):
+        """
+        Remove and return an unused render for `key`, or None if there is
+        none (the caller then creates it).
+
+        :param tuple key: The text and style key of the render.
+        """
+        try:
+            renders = self._free.get(key)
+        except TypeError:  # unhashable text
+            renders = None
+        if not renders:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._size -= 1
+        gfx = renders.pop()
+        if not renders:
+            del self._free[key]
+        return gfx
+
+    def release(self, key, gfx):
+        """
+        Return a render that is no longer displayed to the cache.
+
+        :param tuple key: The text and style key of the render.
+        :param gfx: The render.
+        """
+        try:
+            self._free.setdefault(key, []).append(gfx)
+        except TypeError:  # unhashable text
+            gfx.destroy()
+            return
+        self._free.move_to_end(key)
+        self._size += 1
+        while self._size > self.maxsize:
+            oldkey, renders = next(iter(self._free.items()))
+            renders.pop(0).destroy()
+            if not renders:
+                del self._free[oldkey]
+            self._size -= 1
+
+    def clear(self):
+        """
+        Destroy all cached renders and reset the statistics.
+        """
+        for renders in self._free.values():
+            for gfx in renders:
+                gfx.destroy()
+        self._free.clear()
+        self._size = 0
+        self.hits = self.misses = 0
+
 
 class TextAsset(_GraphicsAsset):
     """
@@ -521,6 +743,15 @@ class TextAsset(_GraphicsAsset):
 
     .. literalinclude:: ../examples/assettext.py
 
+    Rendered text is shared through :data:`rendercache`: a text asset that
+    has been released reuses its render for the next text asset with the
+    same text, style, width, fill color and alignment. The text is not
+    rendered until the asset is first displayed or measured.
+    """
+
+    rendercache = TextRenderCache()
+    """
+    The :class:`TextRenderCache` shared by all text assets.
     """
 
     def __init__(self, text, **kwargs):
@@ -531,18 +762,54 @@ class TextAsset(_GraphicsAsset):
         width = kwargs.get("width", 100)
         self.fill = kwargs.get("fill", Color(0, 1))
         self.align = kwargs.get("align", "left")
-        self.gfx = GFX_Text(
-            self.text,
-            {
-                "font": self.style,
-                "fill": self.fill.color,
-                "align": self.align,
-                "wordWrap": True,
-                "wordWrapWidth": width,
-            },
-        )
-        self.gfx.alpha = self.fill.alpha
-        self.gfx.visible = False
+        self._width = width
+        self._key = (self.text, self.style, width, self.fill.color, self.align)
+
+    @property
+    def gfx(self):
+        """
+        The rendered text. It is taken from :data:`rendercache`, or created,
+        when it is first needed.
+        """
+        if self.gfxlist[0] is None:
+            gfx = self.rendercache.acquire(self._key)
+            if gfx is None:
+                gfx = GFX_Text(
+                    self.text,
+                    {
+                        "font": self.style,
+                        "fill": self.fill.color,
+                        "align": self.align,
+                        "wordWrap": True,
+                        "wordWrapWidth": self._width,
+                    },
+                )
+            gfx.alpha = self.fill.alpha
+            gfx.visible = False
+            self.gfxlist[0] = gfx
+        return self.gfxlist[0]
+
+    @gfx.setter
+    def gfx(self, value):
+        self.gfxlist[0] = value
+
+    def release(self):
+        """
+        Return the rendered text to :data:`rendercache` for reuse. Call this
+        instead of :meth:`destroy` when the asset, and any sprite displaying
+        it, will no longer be used. The render's position, rotation, scale
+        and anchor are reset, so that its next owner starts untransformed.
+        """
+        gfx = self.gfxlist[0]
+        if gfx is not None:
+            gfx.visible = False
+            gfx.rotation = 0.0
+            for attr, value in (("position", 0), ("anchor", 0), ("scale", 1.0)):
+                point = getattr(gfx, attr, None)
+                if point is not None:
+                    point.x = point.y = value
+            self.rendercache.release(self._key, gfx)
+            self.gfx = None
 
     def clone(self):
         """
@@ -555,7 +822,7 @@ class TextAsset(_GraphicsAsset):
         return type(self)(
             self.text,
             style=self.style,
-            width=self.width,
+            width=self._width,
             fill=self.fill,
             align=self.align,
         )
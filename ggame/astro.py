@@ -1,14 +1,18 @@
+# pylint: disable=too-many-lines
 """
 ggame extensions for modeling spacecraft in planetary orbit
 """
 
-from math import pi, degrees, radians, atan2, sin, cos, sqrt
-from ggame.asset import LineStyle, Color
-from ggame.mathapp import MathApp
+from functools import partial
+from math import pi, degrees, radians, atan2, sin, cos, sqrt, sinh, cosh, asinh
+from ggame.asset import LineStyle, Color, PolylineAsset
+from ggame.mathapp import MathApp, _MathVisual, _numpy
 from ggame.circle import Circle
 from ggame.point import ImagePoint
 from ggame.timer import Timer
 from ggame.label import Label
+from ggame.trail import Trail
+from ggame.gravity import G
 
 
 class Planet(MathApp):
@@ -73,6 +77,94 @@ class Planet(MathApp):
         super().run()
 
 
+# Dormand-Prince 5(4) coefficients: the stages after the first, and the
+# difference between the 5th and 4th order weights of all seven stages (the
+# weights of the 5th order solution are those of the last stage)
+_DOPRI_A = (
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DOPRI_E = (
+    71 / 57600,
+    0,
+    -71 / 16695,
+    71 / 1920,
+    -17253 / 339200,
+    22 / 525,
+    -1 / 40,
+)
+
+
+def _orbit(pos, vel, mu):
+    """
+    Find the elements of the conic orbit through position `pos` with
+    velocity `vel` around a body with gravitational parameter `mu`: (semi
+    major axis, eccentricity, argument of periapsis, direction (1 for
+    counterclockwise, -1 for clockwise), mean motion, mean anomaly). The
+    semi major axis is negative for a hyperbolic orbit.
+    """
+    x, y = pos
+    vx, vy = vel
+    r = sqrt(x * x + y * y)
+    rv = x * vx + y * vy
+    vsq = vx * vx + vy * vy
+    a = 1 / (2 / r - vsq / mu)
+    ex = ((vsq - mu / r) * x - rv * vx) / mu
+    ey = ((vsq - mu / r) * y - rv * vy) / mu
+    e = sqrt(ex * ex + ey * ey)
+    direction = 1 if x * vy - y * vx >= 0 else -1
+    if a > 0:
+        anomaly = atan2(rv / sqrt(mu * a), 1 - r / a)
+        mean = anomaly - e * sin(anomaly)
+        px, py = cos(anomaly) - e, sqrt(1 - e * e) * sin(anomaly)
+    else:
+        anomaly = asinh(rv / (e * sqrt(-mu * a)))
+        mean = e * sinh(anomaly) - anomaly
+        px, py = e - cosh(anomaly), sqrt(e * e - 1) * sinh(anomaly)
+    # the periapsis is found from the true longitude, rather than from the
+    # eccentricity vector, so that the anomaly and the periapsis agree on
+    # nearly circular orbits, where each is mostly rounding error
+    periapsis = atan2(y, x) - direction * atan2(py, px)
+    return a, e, periapsis, direction, sqrt(mu / abs(a) ** 3), mean
+
+
+def _orbitState(orbit):
+    """
+    Find the position and velocity on an orbit (see :func:`_orbit`) by
+    solving Kepler's equation for its mean anomaly with Newton's method.
+    """
+    a, e, periapsis, direction, n, mean = orbit
+    if a > 0:
+        anomaly = mean if e < 0.8 else pi
+        for _ in range(50):
+            delta = (anomaly - e * sin(anomaly) - mean) / (1 - e * cos(anomaly))
+            anomaly -= delta
+            if abs(delta) < 1e-12:
+                break
+        b = a * sqrt(1 - e * e)
+        rate = n / (1 - e * cos(anomaly))
+        px, py = a * (cos(anomaly) - e), b * sin(anomaly)
+        pvx, pvy = -a * sin(anomaly) * rate, b * cos(anomaly) * rate
+    else:
+        anomaly = asinh(mean / e)
+        for _ in range(50):
+            delta = (e * sinh(anomaly) - anomaly - mean) / (e * cosh(anomaly) - 1)
+            anomaly -= delta
+            if abs(delta) < 1e-12:
+                break
+        b = -a * sqrt(e * e - 1)
+        rate = n / (e * cosh(anomaly) - 1)
+        px, py = -a * (e - cosh(anomaly)), b * sinh(anomaly)
+        pvx, pvy = a * sinh(anomaly) * rate, b * cosh(anomaly) * rate
+    c, s = cos(periapsis), sin(periapsis)
+    py, pvy = direction * py, direction * pvy
+    return [c * px - s * py, s * px + c * py], [c * pvx - s * pvy, s * pvx + c * pvy]
+
+
 class Rocket(ImagePoint):
     """
     Rocket is a class for simulating the motion of a projectile through space,
@@ -106,6 +198,27 @@ class Rocket(ImagePoint):
         as the "rotate left" key while controlling the ship. Default is 'left arrow'.
     :param str rightkey: A :class:`ggame.event.KeyEvent` key identifier that will serve
         as the "rotate right" key while controlling the ship. Default is 'right arrow'.
+    :param int trail: Number of positions in a :class:`~ggame.trail.Trail` drawn
+        behind the rocket. Default is zero (no trail).
+    :param str integrator: "rk4" to advance the rocket by a single 4th order
+        Runge-Kutta step per tick (the default), or "rk45" to divide each tick
+        into as many adaptive Dormand-Prince steps as the tolerance requires,
+        which keeps orbits accurate at high time zoom.
+    :param float tolerance: Relative error allowed in each "rk45" step.
+        Default is 1e-9.
+    :param int maxsubsteps: Maximum number of "rk45" steps per tick. Default
+        is 100.
+    :param bool kepler: While the thrust is zero, move the rocket along its
+        orbit by solving Kepler's equation rather than by integrating its
+        motion, so that coasting costs the same at any time zoom and the
+        orbit does not drift. Orbits that meet the planet surface are still
+        integrated. Default is False.
+    :param Gravity gravity: A :class:`~ggame.gravity.Gravity` engine that
+        computes the attraction of several bodies, in place of the planet's
+        alone.
+    :param float prediction: Number of seconds ahead to predict the path of
+        the rocket, drawn as an :class:`OrbitPrediction`. Default is zero (no
+        prediction).
 
     Following parameters may be set as a constant value, or pass in the
     name of a function that will return the value dynamically or the
@@ -228,6 +341,20 @@ class Rocket(ImagePoint):
         if self.heading == self._getheading:  # pylint: disable=comparison-with-callable
             Planet.listenKeyEvent("keydown", leftkey, self._turn)
             Planet.listenKeyEvent("keydown", rightkey, self._turn)
+        self.integrator = kwargs.get("integrator", "rk4")
+        """The integration method: "rk4" or "rk45"."""
+        self.tolerance = kwargs.get("tolerance", 1e-9)
+        """Relative error allowed in each "rk45" step."""
+        self.maxsubsteps = kwargs.get("maxsubsteps", 100)
+        """Maximum number of "rk45" steps per tick."""
+        self._substep = None  # "rk45" step size to try next
+        self.gravity = kwargs.get("gravity", None)
+        """The :class:`~ggame.gravity.Gravity` engine, if any."""
+        self.kepler = kwargs.get("kepler", False)
+        """True to follow the orbit analytically while the thrust is zero."""
+        # while coasting: the position and velocity lists last set, and the
+        # orbital elements they were found from
+        self._coastorbit = None
         self._timer = Timer()
         self.shiptime = 0  # track time on shipboard
         self._timer.callEvery(1 / self.tickrate, self._dynamics)
@@ -239,6 +366,28 @@ class Rocket(ImagePoint):
         # set up status display
         if self._showstatus:
             self.addStatusReport(statuslist, statusfuncs, self._statusselect)
+        self.trail = None
+        """The :class:`~ggame.trail.Trail` drawn behind the rocket, if any."""
+        if kwargs.get("trail", 0):
+            self.trail = Trail(self, capacity=kwargs["trail"])
+        self.prediction = None
+        """The :class:`OrbitPrediction` drawn ahead of the rocket, if any."""
+        if kwargs.get("prediction", 0):
+            self.prediction = OrbitPrediction(self, kwargs["prediction"])
+
+    def destroy(self):
+        """
+        Destroy the rocket, its trail and its orbit prediction.
+
+        :returns: None
+        """
+        if self.trail is not None:
+            self.trail.destroy()
+            self.trail = None
+        if self.prediction is not None:
+            self.prediction.destroy()
+            self.prediction = None
+        super().destroy()
 
     @staticmethod
     def _vadd(v1, v2):
@@ -362,17 +511,69 @@ class Rocket(ImagePoint):
         tick = 10 ** self.timezoom() * (timer.time - self._lasttime)
         self.shiptime = self.shiptime + tick
         self._lasttime = timer.time
+        # the controls are read once, and are constant through the tick
+        controls = (self.heading(), self.thrust(), self.mass())
+        if (
+            self.kepler
+            and self.gravity is None
+            and not controls[1]
+            and self._coast(tick)
+        ):
+            pass
+        elif self.integrator == "rk45":
+            self._rk45(tick, controls)
+        else:
+            self._rk4(tick, controls)
+        self.rotation = controls[0]
+        if self.altitude < 0:
+            self._v_vect = [0, 0]
+            self._a_vect = [0, 0]
+            self.altitude = 0
+
+    def _coast(self, tick):
+        """
+        Advance the unpowered rocket by `tick` seconds along its conic orbit.
+        The orbital elements are kept while the rocket coasts, so the orbit
+        does not drift. Return False, without moving the rocket, if the
+        orbit meets the planet surface or is nearly parabolic.
+        """
+        mu = G * self.planet.mass
+        coast = self._coastorbit
+        if coast is not None and coast[0] is self._xy and coast[1] is self._v_vect:
+            orbit = coast[2]
+        else:
+            orbit = _orbit(self._xy, self._v_vect, mu)
+            a, e = orbit[:2]
+            if abs(e - 1) < 1e-6 or a * (1 - e) < self.planet.radius:
+                self._coastorbit = None
+                return False
+        a, e, periapsis, direction, n, mean = orbit
+        mean += n * tick
+        if a > 0:
+            mean %= 2 * pi
+        orbit = (a, e, periapsis, direction, n, mean)
+        self._xy, self._v_vect = _orbitState(orbit)
+        self._coastorbit = (self._xy, self._v_vect, orbit)
+        r = sqrt(self._xy[0] ** 2 + self._xy[1] ** 2)
+        self._a_vect = [-mu * self._xy[i] / r**3 for i in (0, 1)]
+        return True
+
+    def _rk4(self, tick, controls):
+        """
+        Advance the rocket by a single runge-kutta 4th order step, with the
+        controls (heading, thrust, mass) given.
+        """
         # 4th order runge-kutta method
         # (https://sites.temple.edu/math5061/files/2016/12/final_project.pdf)
         # and http://spiff.rit.edu/richmond/nbody/OrbitRungeKutta4.pdf  (succinct,
         # but with a typo)
-        self._a_vect = k1v = self._ar(self._xy)
+        self._a_vect = k1v = self._ar(self._xy, controls)
         k1r = self._v_vect
-        k2v = self._ar(self._vadd(self._xy, self._vmul(tick / 2, k1r)))
+        k2v = self._ar(self._vadd(self._xy, self._vmul(tick / 2, k1r)), controls)
         k2r = self._vadd(self._v_vect, self._vmul(tick / 2, k1v))
-        k3v = self._ar(self._vadd(self._xy, self._vmul(tick / 2, k2r)))
+        k3v = self._ar(self._vadd(self._xy, self._vmul(tick / 2, k2r)), controls)
         k3r = self._vadd(self._v_vect, self._vmul(tick / 2, k2v))
-        k4v = self._ar(self._vadd(self._xy, self._vmul(tick, k3r)))
+        k4v = self._ar(self._vadd(self._xy, self._vmul(tick, k3r)), controls)
         k4r = self._vadd(self._v_vect, self._vmul(tick, k3v))
         self._v_vect = [
             self._v_vect[i] + tick / 6 * (k1v[i] + 2 * k2v[i] + 2 * k3v[i] + k4v[i])
@@ -382,35 +583,87 @@ class Rocket(ImagePoint):
             self._xy[i] + tick / 6 * (k1r[i] + 2 * k2r[i] + 2 * k3r[i] + k4r[i])
             for i in (0, 1)
         ]
-        if self.altitude < 0:
-            self._v_vect = [0, 0]
-            self._a_vect = [0, 0]
-            self.altitude = 0
+
+    def _rk45(self, tick, controls):
+        """
+        Advance the rocket by `tick` seconds in as many Dormand-Prince 5(4)
+        steps as are needed to keep the estimated error of each step within
+        the tolerance, up to :attr:`maxsubsteps` steps, with the controls
+        (heading, thrust, mass) given.
+        """
+        if tick <= 0:
+            return
+
+        def derivative(state):
+            acc = self._ar(state[:2], controls)
+            return (state[2], state[3], acc[0], acc[1])
+
+        state = (*self._xy, *self._v_vect)
+        k1 = derivative(state)
+        self._a_vect = list(k1[2:])
+        elapsed = 0
+        step = min(self._substep or tick, tick)
+        for attempt in range(self.maxsubsteps):
+            # the last step allowed covers the rest of the tick, whatever
+            # its error
+            final = attempt == self.maxsubsteps - 1
+            h = tick - elapsed if final else min(step, tick - elapsed)
+            ks = [k1]
+            for row in _DOPRI_A:
+                trial = tuple(
+                    state[j] + h * sum(a * k[j] for a, k in zip(row, ks))
+                    for j in range(4)
+                )
+                ks.append(derivative(trial))
+            # the last stage is evaluated at the 5th order solution
+            error = 0
+            for j in range(4):
+                scale = self.tolerance * (1 + max(abs(state[j]), abs(trial[j])))
+                e = h * sum(c * k[j] for c, k in zip(_DOPRI_E, ks))
+                error = max(error, abs(e) / scale)
+            factor = min(5, max(0.2, 0.9 * (error or 1e-10) ** -0.2))
+            if error <= 1 or final:
+                elapsed += h
+                state, k1 = trial, ks[-1]
+                # a step cut short at the end of the tick does not limit
+                # the next one
+                step = h * factor if h == step else max(step, h * factor)
+            else:
+                step = h * factor
+            if elapsed >= tick:
+                break
+        self._substep = step
+        self._xy = list(state[:2])
+        self._v_vect = list(state[2:])
 
     # generic force as a function of position
-    def _fr(self, pos):
+    def _fr(self, pos, controls, gravity=None):
         """
         Compute the net force vector on the rocket, as a function of the
-        position vector.
-        """
-        self.rotation = self.heading()
-        t = self.thrust()
-        g = 6.674e-11
+        position vector and the controls (heading, thrust, mass). `gravity`
+        replaces the rocket's gravity engine, if given.
+        """
+        heading, t, m = controls
+        if gravity is None:
+            gravity = self.gravity
+        if gravity is not None:
+            ag = gravity.acceleration((pos,))[0]
+            return [m * ag[0] + t * cos(heading), m * ag[1] + t * sin(heading)]
         r = Planet.distance((0, 0), pos)
         uvec = (-pos[0] / r, -pos[1] / r)
-        fg = g * self.mass() * self.planet.mass / r**2
+        fg = G * m * self.planet.mass / r**2
         vf = [x * fg for x in uvec]
-        return [vf[0] + t * cos(self.rotation), vf[1] + t * sin(self.rotation)]
+        return [vf[0] + t * cos(heading), vf[1] + t * sin(heading)]
 
     # geric acceleration as a function of position
-    def _ar(self, pos):
+    def _ar(self, pos, controls, gravity=None):
         """
         Compute the acceleration vector of the rocket, as a function of the
-        position vector.
+        position vector and the controls (heading, thrust, mass). `gravity`
+        replaces the rocket's gravity engine, if given.
         """
-        m = self.mass()
-        vf = self._fr(pos)
-        return [vf[i] / m for i in (0, 1)]
+        vf = self._fr(pos, controls, gravity)
+        return [vf[i] / controls[2] for i in (0, 1)]
 
     # add a status reporting function to status display
     def addStatusReport(self, statuslist, statusfuncs, statusselect):
@@ -514,3 +767,510 @@ class Rocket(ImagePoint):
         Report the spaceship distance (radius) from central body center of mass.
         """
         return self.altitude + self.planet.radius
+
+
+_predictionexecutor = False  # shared worker, None if threads are unavailable
+
+
+def _predictionExecutor():
+    """
+    Return the executor that computes orbit predictions in the background,
+    or None if threads are not available (e.g. in the browser), in which
+    case predictions are computed when requested.
+    """
+    global _predictionexecutor  # pylint: disable=global-statement
+    if _predictionexecutor is False:
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor
+
+            _predictionexecutor = ThreadPoolExecutor(1)
+        except (ImportError, RuntimeError):
+            _predictionexecutor = None
+    return _predictionexecutor
+
+
+def _predictPath(accel, state, controls, horizon, count, radius):
+    """
+    Integrate the motion of a rocket from `state` (x, y, vx, vy) with
+    constant `controls`, using acceleration function `accel`, and return
+    `count` + 1 logical positions spread over `horizon` seconds. The path
+    ends early if it meets the planet surface.
+    """
+    x, y, vx, vy = state
+    points = [(x, y)]
+    substeps = 8
+    h = horizon / (count * substeps)
+    for _ in range(count):
+        for _ in range(substeps):
+            a1 = accel((x, y), controls)
+            a2 = accel((x + h / 2 * vx, y + h / 2 * vy), controls)
+            v2 = (vx + h / 2 * a1[0], vy + h / 2 * a1[1])
+            a3 = accel((x + h / 2 * v2[0], y + h / 2 * v2[1]), controls)
+            v3 = (vx + h / 2 * a2[0], vy + h / 2 * a2[1])
+            a4 = accel((x + h * v3[0], y + h * v3[1]), controls)
+            v4 = (vx + h * a3[0], vy + h * a3[1])
+            x += h / 6 * (vx + 2 * v2[0] + 2 * v3[0] + v4[0])
+            y += h / 6 * (vy + 2 * v2[1] + 2 * v3[1] + v4[1])
+            vx += h / 6 * (a1[0] + 2 * a2[0] + 2 * a3[0] + a4[0])
+            vy += h / 6 * (a1[1] + 2 * a2[1] + 2 * a3[1] + a4[1])
+        points.append((x, y))
+        if x * x + y * y < radius * radius:
+            break
+    return points
+
+
+class OrbitPrediction(_MathVisual):
+    """
+    Draw the predicted path of a :class:`Rocket` for some time ahead,
+    assuming that its heading, thrust and mass do not change. This is a
+    subclass of :class:`~ggame.sprite.Sprite` and
+    :class:`~ggame.mathapp._MathVisual` but most of the inherited members
+    are of little use and are not shown in the documentation.
+
+    The prediction is computed in a background thread (where threads are
+    available), so the display is never held up by it, and is only computed
+    again when the heading, thrust or mass of the rocket changes or the
+    rocket reaches the end of the predicted path.
+
+    :param Rocket rocket: The rocket whose path is predicted.
+    :param float horizon: Number of seconds (of ship time) to predict.
+
+    :Optional Keyword Arguments:
+        * **points** (*int*) Number of positions in the predicted path. The
+            default is 200.
+        * **style** (*LineStyle*) Valid :class:`~ggame.asset.LineStyle` object
+
+    Example::
+
+        from ggame.astro import Planet, Rocket
+
+        earth = Planet(viewscale=0.00005)
+        rocket = Rocket(earth, altitude=400000, velocity=8000, prediction=6000)
+        earth.run(rocket)
+    """
+
+    # the path is drawn relative to the logical origin
+    _posinputsdef = ["pos"]
+    _nonposinputsdef = ["version"]
+    _defaultstyle = LineStyle(1, Color(0x00A0FF, 1))
+    _scaledependent = True
+
+    def __init__(self, rocket, horizon, **kwargs):
+        self.rocket = rocket
+        """The rocket whose path is predicted."""
+        self.horizon = horizon
+        """Number of seconds (of ship time) predicted."""
+        self._points = kwargs.get("points", 200)
+        # the published path, and the controls and ship time it is for
+        self._path = []
+        self._version = 0
+        self._key = None
+        self._end = None
+        # the prediction being computed: (future, controls, ship time)
+        self._pending = None
+        kwargs.pop("positioning", None)
+        super().__init__(
+            PolylineAsset([], self._defaultstyle),
+            (0, 0),
+            lambda: self._version,
+            style=kwargs.get("style", self._defaultstyle),
+        )
+        self.touchAsset()
+
+    def positions(self):
+        """
+        Return the logical positions in the predicted path.
+
+        :rtype: list[tuple(float,float)]
+        """
+        return list(self._path)
+
+    @property
+    def pending(self):
+        """
+        True while a prediction is being computed.
+        """
+        return self._pending is not None
+
+    def wait(self, timeout=None):
+        """
+        Wait until the prediction being computed, if any, is published.
+
+        :param float timeout: Maximum number of seconds to wait. The default
+            is to wait until it is done.
+        :returns: None
+        """
+        if self._pending is not None:
+            self._pending[0].exception(timeout)
+            self._publish()
+
+    def _controls(self):
+        rocket = self.rocket
+        return (rocket.heading(), rocket.thrust(), rocket.mass())
+
+    def _request(self, controls):
+        """
+        Start computing the path from the current state of the rocket.
+        """
+        # pylint: disable=protected-access
+        rocket = self.rocket
+        accel = rocket._ar
+        if rocket.gravity is not None:
+            # the engine is updated every frame while the path is computed
+            accel = partial(accel, gravity=rocket.gravity.snapshot())
+        args = (
+            accel,
+            (*rocket._xy, *rocket._v_vect),
+            controls,
+            self.horizon,
+            self._points,
+            rocket.planet.radius,
+        )
+        executor = _predictionExecutor()
+        if executor is None:
+            self._show(_predictPath(*args), controls, rocket.shiptime)
+        else:
+            future = executor.submit(_predictPath, *args)
+            self._pending = (future, controls, rocket.shiptime)
+
+    def _publish(self):
+        """
+        Show the pending prediction, if it is done.
+        """
+        future, controls, start = self._pending
+        if future.done():
+            self._pending = None
+            try:
+                path = future.result()
+            except Exception:
+                return  # dropped: the next step requests it again
+            self._show(path, controls, start)
+
+    def _show(self, path, controls, start):
+        """
+        Show the path predicted with `controls` from ship time `start`.
+        """
+        self._path = path
+        self._key = controls
+        self._end = start + self.horizon
+        self._version += 1
+
+    def step(self):
+        """
+        Show a prediction that is done, and request a new one if the
+        controls have changed or the rocket has reached the end of the path.
+        """
+        if self._pending is not None:
+            self._publish()
+        if self._pending is None:
+            controls = self._controls()
+            if controls != self._key or self.rocket.shiptime >= self._end:
+                self._request(controls)
+        super().step()
+
+    def _pixelPath(self):
+        scale = MathApp.scale
+        return [(x * scale, -y * scale) for x, y in self._path]
+
+    def _buildAsset(self):
+        return PolylineAsset(self._pixelPath(), self._stdinputs.style())
+
+    def _redrawAsset(self):
+        self.asset.path = self._pixelPath()
+        self.asset.redraw()
+        self.position = self._spposinputs.pos  # pylint: disable=no-member
+        return True
+
+    def physicalPointTouching(self, ppos):
+        """
+        This method always returns False.
+        """
+        return False
+
+    def translate(self, pdisp):
+        """
+        This method is not implemented.
+        """
+
+    def destroy(self):
+        """
+        Stop drawing the prediction.
+
+        :returns: None
+        """
+        if self._pending is not None:
+            self._pending[0].cancel()
+            self._pending = None
+        super().destroy()
+
+
+class RocketFleet:
+    """
+    RocketFleet simulates the motion of many rockets at once, with the same
+    physics as :class:`Rocket`: thrust along the heading and gravitational
+    attraction to a single :class:`Planet`. The positions, velocities,
+    headings, masses and thrusts of the rockets are kept in NumPy arrays,
+    and all of the rockets are advanced by one vectorized Runge-Kutta step
+    per tick, so that a fleet or an ensemble of thousands of rockets can be
+    simulated. NumPy is required.
+
+    Required parameters:
+
+    :param Planet planet: Reference to a :class:`Planet` object.
+    :param int count: Number of rockets.
+
+    Optional keyword parameters are supported. The initial state of the
+    rockets may be given as a single value for all of them, or as a
+    sequence (or array) with one value per rocket:
+
+    :param float velocity:  Initial rocket speed. Default is zero.
+    :param float directiond:  Initial rocket direction in degrees. Default is zero.
+    :param float direction:  Initial rocket direction in radians. Default is zero.
+    :param float tanomalyd:  Initial rocket true anomaly in degrees. Default is 90.
+    :param float tanomaly:  Initial rocket true anomaly in radians. Default is pi/2.
+    :param float altitude:  Initial rocket altitude in meters. Default is zero.
+    :param float tickrate: Frequency of fleet dynamics calculations (Hz)
+    :param bool show: Draw the rockets, as short lines pointing along their
+        headings, in a single graphics object. Default is True.
+    :param int size: Length (in pixels) of the line drawn for each rocket.
+        Default is 10.
+    :param LineStyle style: Valid :class:`~ggame.asset.LineStyle` object
+        for the lines drawn.
+    :param Gravity gravity: A :class:`~ggame.gravity.Gravity` engine that
+        computes the attraction of several bodies, in place of the planet's
+        alone.
+
+    Following parameters may be set as a constant value, a sequence with one
+    value per rocket, or the name of a function that will return either,
+    and are read once per tick:
+
+    :param function or float timezoom:  Scale factor for time zoom. Factor =
+        10^timezoom (a single value)
+    :param function or float heading:  Direction to point the rockets in
+        (must be radians)
+    :param function or float mass: Mass of the rockets (must be kg)
+    :param function or float thrust: Thrust of the rockets (must be N)
+
+    Example::
+
+        from random import gauss
+        from ggame.astro import Planet, RocketFleet
+
+        earth = Planet(viewscale=0.00005)
+        fleet = RocketFleet(
+            earth,
+            1000,
+            altitude=400000,
+            velocity=[gauss(7670, 50) for i in range(1000)],
+            timezoom=2,
+        )
+        earth.run()
+    """
+
+    def __init__(self, planet, count, **kwargs):
+        np = _numpy()
+        if np is None:
+            raise ImportError("RocketFleet requires NumPy")
+        self.planet = planet
+        """Reference to an app object of :class:`Planet` class"""
+        self.count = count
+        """Number of rockets in the fleet."""
+        self.tickrate = kwargs.get("tickrate", 30)
+        """Target dynamics calculations per second."""
+        self.timezoom = kwargs.get("timezoom", 0)
+        """Time zoom factor, or a function that returns it."""
+        self.heading = kwargs.get("heading", 0)
+        """Rocket headings (radians), or a function that returns them."""
+        self.mass = kwargs.get("mass", 1)
+        """Rocket masses (kg), or a function that returns them."""
+        self.thrust = kwargs.get("thrust", 0)
+        """Rocket thrusts (N), or a function that returns them."""
+        self.gravity = kwargs.get("gravity", None)
+        """The :class:`~ggame.gravity.Gravity` engine, if any."""
+        initvel = self._array(kwargs.get("velocity", 0))
+        initdir = kwargs.get("direction", None)
+        if initdir is None:
+            initdir = np.radians(self._array(kwargs.get("directiond", 0)))
+        initdir = self._array(initdir)
+        tanomaly = kwargs.get("tanomaly", None)
+        if tanomaly is None:
+            tanomaly = np.radians(self._array(kwargs.get("tanomalyd", 90)))
+        tanomaly = self._array(tanomaly)
+        r = self._array(kwargs.get("altitude", 0)) + planet.radius
+        self.positions = np.column_stack((r * np.cos(tanomaly), r * np.sin(tanomaly)))
+        """N x 2 array of the logical positions of the rockets."""
+        self.velocities = np.column_stack(
+            (initvel * np.cos(initdir), initvel * np.sin(initdir))
+        )
+        """N x 2 array of the velocities of the rockets."""
+        self.accelerations = np.zeros((count, 2))
+        """N x 2 array of the accelerations of the rockets at the last tick."""
+        self.headings = self._array(self._value(self.heading))
+        """Array of the headings of the rockets at the last tick."""
+        self.shiptime = 0
+        """Elapsed simulation time (s)."""
+        self._view = None
+        if kwargs.get("show", True):
+            self._view = _FleetView(self, **kwargs)
+        self._timer = Timer()
+        self._timer.callEvery(1 / self.tickrate, self._dynamics)
+        self._lasttime = self._timer.time
+
+    def __len__(self):
+        return self.count
+
+    def destroy(self):
+        """
+        Stop the simulation and remove the fleet from the display.
+
+        :returns: None
+        """
+        self._timer.destroy()
+        if self._view is not None:
+            self._view.destroy()
+            self._view = None
+
+    @staticmethod
+    def _value(control):
+        """
+        Read a control that may be a constant or a function.
+        """
+        return control() if callable(control) else control
+
+    def _array(self, value):
+        """
+        An array with one element per rocket, from a single value or a
+        sequence.
+        """
+        np = _numpy()
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.count,)).copy()
+
+    def _dynamics(self, timer):
+        """
+        Advance the fleet by the time since the last execution.
+        """
+        tick = 10 ** self._value(self.timezoom) * (timer.time - self._lasttime)
+        self._lasttime = timer.time
+        self.advance(tick)
+
+    def advance(self, tick):
+        """
+        Advance all of the rockets by one 4th order Runge-Kutta step. The
+        controls are read once, at the start of the step.
+
+        :param float tick: Duration of the step (s).
+        :returns: None
+        """
+        np = _numpy()
+        self.shiptime += tick
+        heading = self.headings = self._array(self._value(self.heading))
+        thrust = self._array(self._value(self.thrust))
+        mass = self._array(self._value(self.mass))
+        # the thrust acceleration is constant through the step, and gravity
+        # is independent of the rocket mass
+        athrust = np.column_stack((np.cos(heading), np.sin(heading)))
+        athrust *= (thrust / mass)[:, None]
+        gm = G * self.planet.mass
+
+        def accel(pos):
+            if self.gravity is not None:
+                return athrust + self.gravity.acceleration(pos)
+            r = np.hypot(pos[:, 0], pos[:, 1])
+            return athrust - pos * (gm / r**3)[:, None]
+
+        xy, v = self.positions, self.velocities
+        self.accelerations = k1v = accel(xy)
+        k1r = v
+        k2v = accel(xy + tick / 2 * k1r)
+        k2r = v + tick / 2 * k1v
+        k3v = accel(xy + tick / 2 * k2r)
+        k3r = v + tick / 2 * k2v
+        k4v = accel(xy + tick * k3r)
+        k4r = v + tick * k3v
+        self.velocities = v + tick / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+        self.positions = xy + tick / 6 * (k1r + 2 * k2r + 2 * k3r + k4r)
+        # rockets below the surface are stopped on it
+        r = np.hypot(self.positions[:, 0], self.positions[:, 1])
+        landed = r < self.planet.radius
+        if landed.any():
+            self.positions[landed] *= (self.planet.radius / r[landed])[:, None]
+            self.velocities[landed] = 0
+            self.accelerations[landed] = 0
+
+    @property
+    def altitudes(self):
+        """
+        Report an array of the rocket altitudes above the planet surface in
+        meters.
+        """
+        np = _numpy()
+        return np.hypot(self.positions[:, 0], self.positions[:, 1]) - self.planet.radius
+
+    @property
+    def speeds(self):
+        """
+        Report an array of the rocket speeds in m/s.
+        """
+        np = _numpy()
+        return np.hypot(self.velocities[:, 0], self.velocities[:, 1])
+
+
+class _FleetView(_MathVisual):
+    """
+    Visual that draws every rocket in a :class:`RocketFleet` as a line along
+    its heading, in a single :class:`~ggame.asset.PolylineAsset`.
+    """
+
+    # the lines are drawn relative to the logical origin, and redrawn when
+    # the fleet has moved
+    _posinputsdef = ["pos"]
+    _nonposinputsdef = ["shiptime"]
+    _defaultsize = 10
+    _defaultstyle = LineStyle(1, Color(0xFF0000, 1))
+    _scaledependent = True
+
+    def __init__(self, fleet, **kwargs):
+        self._fleet = fleet
+        kwargs.pop("positioning", None)
+        super().__init__(
+            PolylineAsset([], self._defaultstyle),
+            (0, 0),
+            lambda: fleet.shiptime,
+            size=kwargs.get("size", self._defaultsize),
+            style=kwargs.get("style", self._defaultstyle),
+        )
+        self.touchAsset()
+
+    def _path(self):
+        np = _numpy()
+        fleet = self._fleet
+        scale = MathApp.scale
+        # each line is a start point, an end point and a NaN break
+        path = np.full((fleet.count, 3, 2), np.nan)
+        path[:, 0] = fleet.positions * (scale, -scale)
+        heading = fleet.headings
+        path[:, 1] = path[:, 0] + self._stdinputs.size() * np.column_stack(
+            (np.cos(heading), -np.sin(heading))
+        )
+        return [tuple(p) for p in path.reshape(-1, 2).tolist()]
+
+    def _buildAsset(self):
+        return PolylineAsset(self._path(), self._stdinputs.style())
+
+    def _redrawAsset(self):
+        self.asset.path = self._path()
+        self.asset.redraw()
+        self.position = self._spposinputs.pos  # pylint: disable=no-member
+        return True
+
+    def physicalPointTouching(self, ppos):
+        """
+        This method always returns False.
+        """
+        return False
+
+    def translate(self, pdisp):
+        """
+        This method is not implemented.
+        """
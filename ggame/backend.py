@@ -0,0 +1,172 @@
+"""
+The ggame backend registry connects ggame to the graphics and sound system
+that actually draws sprites and plays sounds.
+
+A backend is a module (or any object) that provides every name listed in
+:data:`INTERFACE`:
+
+* `GFX_Window(width, height, onclose)`: the application window, with `width`,
+  `height` and `renderer.view.getBoundingClientRect()` attributes and `bind`,
+  `unbind`, `add`, `remove`, `animate` and `destroy` methods.
+* `GFX_Sprite(texture)`: a displayed object with `position`, `anchor` and
+  `scale` (each with `x` and `y`), `rotation`, `visible`, `width`, `height`,
+  `texture` and `destroy()`.
+* `GFX_Graphics`: a shared drawing object with `clear`, `lineStyle`,
+  `beginFill`, `drawRect`, `drawCircle`, `drawEllipse`, `drawPolygon`,
+  `moveTo` and `lineTo` methods (each drawing method returns an object with
+  `clone()` and `generateTexture()`).
+* `GFX_Text(text, styledict)`: a displayed text object, which also supports
+  `clone()`.
+* `GFX_Texture(texture, rectangle)` and `GFX_Texture_fromImage(url,
+  crossdomain)`: textures with `width` and `height`.
+* `GFX_Rectangle(x, y, w, h)`: a rectangle used for texture frames.
+* `SND_Sound(url)`: a sound with `load`, `play`, `loop`, `stop`, `getVolume`
+  and `setVolume` methods.
+
+The built-in backends are `'browser'` (Brython and Pixi.js), `'pygame'`,
+`'headless'` (Pillow based, with diagnostic output) and `'null'` (does no
+work at all, for timing game logic). Other packages may add backends with
+:func:`registerBackend` or by declaring an entry point in the
+`ggame.backends` group, whose name is the backend name and whose value is
+the backend module.
+"""
+
+from importlib import import_module
+
+INTERFACE = (
+    "GFX_Window",
+    "GFX_Sprite",
+    "GFX_Graphics",
+    "GFX_Text",
+    "GFX_Texture",
+    "GFX_Texture_fromImage",
+    "GFX_Rectangle",
+    "SND_Sound",
+)
+"""
+Names that every backend must provide.
+"""
+
+ENTRY_POINT_GROUP = "ggame.backends"
+"""
+Entry point group searched for backends provided by other packages.
+"""
+
+
+def _moduleExists(modname):
+    try:
+        import_module(modname)
+    except ImportError:
+        return False
+    return True
+
+
+# name -> [backend, probe]: backend is a module name, module or entry point
+# the headless backend is the fallback when no probe succeeds
+_registry = {
+    "browser": ["ggame.browserdeps", lambda: _moduleExists("browser")],
+    "pygame": ["ggame.pygamedeps", lambda: _moduleExists("pygame")],
+    "headless": ["ggame.headlessdeps", None],
+    "null": ["ggame.nulldeps", None],
+}
+_discovered = False
+
+
+def _discover():
+    global _discovered  # pylint: disable=global-statement
+    if _discovered:
+        return
+    _discovered = True
+    # importlib.metadata is only imported when a non built-in name is needed
+    from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+        entry_points,
+    )
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        name = ep.name.strip().lower()
+        if name not in _registry:
+            _registry[name] = [ep, None]
+
+
+def registerBackend(name, backend, probe=None):
+    """
+    Register a backend so it may be selected by name.
+
+    :param str name: The backend name (case insensitive), as used with
+        :func:`ggame.setBackend` or the `GGAME_BACKEND` environment variable.
+    :param backend: The backend module, or the (importable) name of the module.
+    :param function probe: Optional function that returns True if the backend
+        can be used in this process. Backends with a probe are tried, after
+        the built-in backends, when no backend has been selected explicitly.
+    :returns: None
+    """
+    _registry[name.strip().lower()] = [backend, probe]
+
+
+def availableBackends():
+    """
+    Return the names of all registered backends, including backends declared
+    by installed packages.
+
+    :rtype: list[str]
+    """
+    _discover()
+    return list(_registry)
+
+
+def isBackend(name):
+    """
+    Return True if `name` identifies a registered backend.
+
+    :param str name: The backend name (case insensitive).
+    :rtype: bool
+    """
+    name = name.strip().lower()
+    if name not in _registry:
+        _discover()
+    return name in _registry
+
+
+def probeBackend():
+    """
+    Return the name of the first backend, in registration order, whose probe
+    reports that it can be used, or `'headless'` if there is none.
+
+    :rtype: str
+    """
+    for name, (_backend, probe) in _registry.items():
+        if probe is not None and probe():
+            return name
+    return "headless"
+
+
+def loadBackend(name):
+    """
+    Import a registered backend and confirm that it provides every name in
+    :data:`INTERFACE`.
+
+    :param str name: The backend name (case insensitive).
+    :returns: The backend module or object.
+    """
+    name = name.strip().lower()
+    if not isBackend(name):
+        raise ValueError(f"Unknown ggame backend: {name!r}")
+    backend = _registry[name][0]
+    if isinstance(backend, str):
+        try:
+            backend = import_module(backend)
+        except ImportError:
+            # the ggame modules may be used without the package (as in the
+            # browser), in which case the backends are top-level modules
+            if not backend.startswith("ggame."):
+                raise
+            backend = import_module(backend[len("ggame.") :])
+    elif hasattr(backend, "load") and hasattr(backend, "group"):
+        backend = backend.load()
+    missing = [attr for attr in INTERFACE if not hasattr(backend, attr)]
+    if missing:
+        raise ImportError(
+            f"ggame backend {name!r} is not usable here (missing "
+            f"{', '.join(missing)})"
+        )
+    return backend
@@ -0,0 +1,112 @@
+"""
+The clip module clips circles to a rectangle (normally the window, in
+physical screen coordinates), so that circles much larger than the window
+(such as a planet's surface) can be drawn as polygons that only cover the
+visible area.
+
+Rectangles are given as tuples `(xmin, ymin, xmax, ymax)` and polygons as
+sequences of (x, y) vertex tuples.
+"""
+
+from functools import lru_cache
+from math import acos, atan2, ceil, cos, pi, sin, sqrt
+
+_TWOPI = 2 * pi
+
+
+def _edgeCrossings(center, radius, start, end):
+    """
+    Points where an axis aligned edge from `start` to `end` crosses a
+    circle, in order along the edge, with True for points where the edge
+    enters the circle.
+    """
+    axis = 0 if start[1] == end[1] else 1  # the axis the edge runs along
+    offset = abs(start[1 - axis] - center[1 - axis])
+    if offset >= radius:
+        return []
+    # (r - d)(r + d) rather than r*r - d*d, for very large circles
+    half = sqrt((radius - offset) * (radius + offset))
+    lo, hi = sorted((start[axis], end[axis]))
+    crossings = []
+    for value in (center[axis] - half, center[axis] + half):
+        if lo < value < hi:
+            point = [0, 0]
+            point[axis] = value
+            point[1 - axis] = start[1 - axis]
+            entering = (value - center[axis]) * (end[axis] - start[axis]) < 0
+            crossings.append((abs(value - start[axis]), tuple(point), entering))
+    crossings.sort()
+    return [(point, entering) for _distance, point, entering in crossings]
+
+
+@lru_cache(maxsize=64)
+def clipCircle(center, radius, rect, tolerance=0.5):
+    """
+    Clip a (filled) circle to a rectangle. The parts of the circle boundary
+    inside the rectangle are approximated by straight segments. Results are
+    cached, so clipping the same circle to the same rectangle again (e.g. on
+    the next frame) costs nothing.
+
+    :param tuple(float,float) center: The circle center (x, y).
+    :param float radius: The circle radius.
+    :param tuple(float,float,float,float) rect: The clipping rectangle,
+        (xmin, ymin, xmax, ymax).
+    :param float tolerance: Largest distance between the circle and the
+        segments that approximate it.
+    :rtype: tuple
+    :returns: The vertices of the part of the circle inside the rectangle,
+        as a tuple of (x, y) tuples, an empty tuple if the circle and
+        rectangle do not overlap, or None if the circle is entirely inside
+        the rectangle (and need not be clipped).
+    """
+    cx, cy = center
+    xmin, ymin, xmax, ymax = rect
+    if xmin <= cx - radius and cx + radius <= xmax:
+        if ymin <= cy - radius and cy + radius <= ymax:
+            return None
+    corners = ((xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax))
+    # the rectangle boundary, in order, as (point, kind) pairs where kind is
+    # True for an entry into the circle, False for an exit and None for a
+    # corner inside it
+    nodes = []
+    for i, corner in enumerate(corners):
+        if (corner[0] - cx) ** 2 + (corner[1] - cy) ** 2 <= radius * radius:
+            nodes.append((corner, None))
+        nodes.extend(_edgeCrossings(center, radius, corner, corners[(i + 1) % 4]))
+    entries = [i for i, (_point, kind) in enumerate(nodes) if kind]
+    if not entries:
+        # no crossings: the rectangle is inside the circle, or they are
+        # separate
+        return tuple(point for point, _kind in nodes)
+    # walk the boundary from an entry, following the circle from each exit
+    # to the next entry
+    nodes = nodes[entries[0] :] + nodes[: entries[0]]
+    step = min(2 * acos(max(-1.0, 1 - tolerance / radius)), pi / 8)
+    result = []
+    exitangle = None
+    for point, kind in nodes:
+        if kind and exitangle is not None:
+            result.extend(_arc(center, radius, exitangle, point, step))
+        result.append(point)
+        if kind is False:
+            exitangle = atan2(point[1] - cy, point[0] - cx)
+    result.extend(_arc(center, radius, exitangle, nodes[0][0], step))
+    return tuple(result)
+
+
+def _arc(center, radius, startangle, end, step):
+    """
+    Points on a circle between the angle `startangle` and the point `end`
+    (in the direction of increasing angle), no more than `step` radians
+    apart.
+    """
+    cx, cy = center
+    span = (atan2(end[1] - cy, end[0] - cx) - startangle) % _TWOPI
+    count = ceil(span / step)
+    return [
+        (
+            cx + radius * cos(startangle + span * i / count),
+            cy + radius * sin(startangle + span * i / count),
+        )
+        for i in range(1, count)
+    ]
@@ -0,0 +1,236 @@
+"""
+The gravity module computes the gravitational acceleration due to many
+bodies (planets, moons, asteroids), for :class:`~ggame.astro.Rocket` and
+:class:`~ggame.astro.RocketFleet`. NumPy is required.
+
+With few bodies, the attraction of each body is summed directly. With many,
+the bodies are grouped in a Barnes-Hut quadtree: a group of bodies that is
+far enough from a point attracts it as a single body at the group's center
+of mass, so the cost for each point grows with the logarithm of the number
+of bodies rather than with the number of bodies.
+"""
+
+from copy import copy
+
+from ggame.mathapp import _MathDynamic, _numpy
+
+G = 6.674e-11
+"""The gravitational constant (m³/kg/s²)."""
+
+
+class Body:
+    """
+    A point mass that attracts rockets, such as a moon. Any object with a
+    `mass` attribute (in kg) may be used as a body by a :class:`Gravity`
+    engine; its position is its `xyposition` attribute, which may be a
+    function, or the origin if it has none (as for a
+    :class:`~ggame.astro.Planet`).
+
+    :param float mass: Mass of the body in kg.
+    :param tuple(float,float) xyposition: Logical position of the body in
+        meters, or a function that returns it. Default is the origin.
+    """
+
+    def __init__(self, mass, xyposition=(0, 0)):
+        self.mass = mass
+        """Mass of the body in kg."""
+        self.xyposition = xyposition
+        """Position of the body in meters, or a function that returns it."""
+
+
+class Gravity(_MathDynamic):
+    """
+    Gravity engine that computes the net gravitational acceleration due to
+    a set of bodies at any number of points. The positions and masses of
+    the bodies are read when the engine is created, once per frame while a
+    :class:`~ggame.mathapp.MathApp` is running, and whenever :meth:`update`
+    is called.
+
+    :param list bodies: The attracting bodies (see :class:`Body`).
+
+    :Optional Keyword Arguments:
+        * **theta** (*float*) Barnes-Hut opening angle: a group of bodies
+            is treated as one when its width divided by its distance is less
+            than this. Zero makes the result exact. The default is 0.5.
+        * **threshold** (*int*) Number of bodies above which the Barnes-Hut
+            quadtree is used. The default is 64.
+
+    Example::
+
+        from ggame.astro import Planet, Rocket
+        from ggame.gravity import Body, Gravity
+
+        earth = Planet(viewscale=0.00002)
+        moon = Body(7.342e22, (0, -3.844e8))
+        rocket = Rocket(
+            earth,
+            altitude=400000,
+            velocity=7670,
+            gravity=Gravity([earth, moon]),
+        )
+        earth.run(rocket)
+    """
+
+    # deepest quadtree level: bodies closer together than this many halvings
+    # of the root square share a leaf
+    _MAXDEPTH = 32
+
+    def __init__(self, bodies, **kwargs):
+        super().__init__()
+        if _numpy() is None:
+            raise ImportError("Gravity requires NumPy")
+        self.bodies = list(bodies)
+        """The attracting bodies."""
+        self.theta = kwargs.get("theta", 0.5)
+        """Barnes-Hut opening angle."""
+        self.threshold = kwargs.get("threshold", 64)
+        """Number of bodies above which the quadtree is used."""
+        self._masses = self._positions = None
+        # the quadtree, as arrays with one element per node: total mass,
+        # center of mass, width, the indices of the four children (-1 for
+        # none) and whether the node is a leaf
+        self._tree = None
+        self.update()
+        self._setDynamic()
+
+    def step(self):
+        """
+        Read the bodies once per frame.
+        """
+        self.update()
+
+    def update(self):
+        """
+        Read the positions and masses of the bodies, after any of them have
+        moved.
+
+        :returns: None
+        """
+        np = _numpy()
+        positions = []
+        for body in self.bodies:
+            pos = getattr(body, "xyposition", (0, 0))
+            positions.append(pos() if callable(pos) else pos)
+        self._positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self._masses = np.array([body.mass for body in self.bodies], dtype=float)
+        self._tree = None
+        if len(self.bodies) > self.threshold:
+            self._tree = self._build()
+
+    def snapshot(self):
+        """
+        Return a copy of the engine with the current positions and masses
+        of the bodies. The copy is not updated when the bodies move, so it
+        may be used in another thread while the engine itself is updated.
+
+        :rtype: Gravity
+        """
+        # update replaces the arrays rather than changing them, so the copy
+        # may share them
+        return copy(self)
+
+    def _build(self):
+        """
+        Build the quadtree of the bodies.
+        """
+        np = _numpy()
+        positions, masses = self._positions, self._masses
+        low, high = positions.min(axis=0), positions.max(axis=0)
+        nodes = []  # [mass, x, y, width, children, leaf]
+        # squares to fill in: (body indices, center, width, depth, and the
+        # parent node and quadrant)
+        width = max(high - low) or 1.0
+        stack = [(np.arange(len(masses)), (low + high) / 2, width, 0, None)]
+        while stack:
+            indices, center, width, depth, parent = stack.pop()
+            mass = masses[indices].sum()
+            # bodies at the same position share a leaf at exactly that
+            # position, so that they do not attract a point there
+            if (positions[indices] == positions[indices[0]]).all():
+                com, leaf = positions[indices[0]], True
+            else:
+                com = (positions[indices] * masses[indices, None]).sum(axis=0) / mass
+                leaf = depth >= self._MAXDEPTH
+            node = len(nodes)
+            nodes.append([mass, com[0], com[1], width, [-1] * 4, leaf])
+            if parent is not None:
+                nodes[parent[0]][4][parent[1]] = node
+            if leaf:
+                continue
+            east = positions[indices, 0] >= center[0]
+            north = positions[indices, 1] >= center[1]
+            for quadrant, mask in enumerate(
+                (~east & ~north, east & ~north, ~east & north, east & north)
+            ):
+                if mask.any():
+                    offset = (
+                        (0.25 if quadrant & 1 else -0.25) * width,
+                        (0.25 if quadrant & 2 else -0.25) * width,
+                    )
+                    stack.append(
+                        (
+                            indices[mask],
+                            center + offset,
+                            width / 2,
+                            depth + 1,
+                            (node, quadrant),
+                        )
+                    )
+        return (
+            np.array([n[0] for n in nodes]),
+            np.array([(n[1], n[2]) for n in nodes]),
+            np.array([n[3] for n in nodes]),
+            np.array([n[4] for n in nodes], dtype=int),
+            np.array([n[5] for n in nodes], dtype=bool),
+        )
+
+    def acceleration(self, points):
+        """
+        Compute the gravitational acceleration at each of a number of
+        points. A body at exactly the same position as a point does not
+        attract it.
+
+        :param points: Logical positions in meters, as an N x 2 NumPy array
+            or a sequence of (x, y) pairs.
+        :rtype: numpy.ndarray
+        :returns: An N x 2 array of accelerations in m/s².
+        """
+        np = _numpy()
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        if self._tree is None:
+            return self._attraction(
+                self._positions[None, :, :] - points[:, None, :],
+                self._masses[None, :],
+            ).sum(axis=1)
+        masses, coms, widths, children, leaves = self._tree
+        result = np.zeros_like(points)
+        # pairs of points and the tree nodes that remain to be considered
+        pointindex = np.arange(len(points))
+        nodeindex = np.zeros(len(points), dtype=int)
+        while len(pointindex):
+            delta = coms[nodeindex] - points[pointindex]
+            far = (
+                widths[nodeindex] ** 2 < self.theta**2 * (delta**2).sum(axis=1)
+            ) | leaves[nodeindex]
+            np.add.at(
+                result,
+                pointindex[far],
+                self._attraction(delta[far], masses[nodeindex[far]]),
+            )
+            near = ~far
+            quadrants = children[nodeindex[near]].ravel()
+            exists = quadrants >= 0
+            pointindex = np.repeat(pointindex[near], 4)[exists]
+            nodeindex = quadrants[exists]
+        return result
+
+    @staticmethod
+    def _attraction(delta, masses):
+        """
+        The accelerations toward masses at the displacements `delta`.
+        """
+        np = _numpy()
+        rsq = (delta**2).sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(rsq > 0, G * masses / (rsq * np.sqrt(rsq)), 0)
+        return delta * np.expand_dims(factor, -1)
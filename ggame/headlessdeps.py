@@ -239,6 +239,7 @@ if module_exists("PIL"):
     class _GFX_Graphics(object):
         def __init__(self):
             self.clear()
+            self.scale = vector(1.0, 1.0)
 
         def clear(self):
             self.cleared = True
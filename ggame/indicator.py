@@ -77,6 +77,10 @@ class ImageIndicator(_MathVisual):
         x, y = ppos
         return self.xmin <= x <= self.xmax and self.ymin <= y <= self.ymax
 
+    def _physicalBounds(self):
+        self.setExtents()
+        return (self.xmin, self.ymin, self.xmax, self.ymax)
+
     def translate(self, pdisp):
         pass
 
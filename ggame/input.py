@@ -81,6 +81,7 @@ class InputNumeric(Label):
         self._val = 0
         self._updateText(True)
         self.touchAsset()
+        self._notifyChanged()
         MathApp.listenKeyEvent("keypress", "*", self.processEvent)
 
     def unselect(self):
@@ -88,6 +89,7 @@ class InputNumeric(Label):
         self._val = self._savedval
         self._updateText()
         self.touchAsset()
+        self._notifyChanged()
         try:
             MathApp.unlistenKeyEvent("keypress", "*", self.processEvent)
         except ValueError:
@@ -38,6 +38,9 @@ class InputImageButton(ImagePoint):
 
     """
 
+    # the button state is only updated when it is called
+    _reportschanges = False
+
     def __init__(self, url, callback, *args, **kwargs):
         super().__init__(url, *args, **kwargs)
         self.center = (0, 0)
@@ -106,6 +109,7 @@ class InputImageToggle(ImagePoint):
         if self.togglestate == len(self.statelist):
             self.togglestate = 0
         self.setImage(self.togglestate)
+        self._notifyChanged()
         self.unselect()
 
     def __call__(self):
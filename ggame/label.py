@@ -40,6 +40,7 @@ class Label(_MathVisual):
 
     _posinputsdef = ["pos"]
     _nonposinputsdef = ["text"]
+    _reportschanges = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -59,6 +60,9 @@ class Label(_MathVisual):
             fill=self._stdinputs.color(),
         )
 
+    def _canTranslate(self):
+        return True
+
     def __call__(self):
         return self._nposinputs.text()  # pylint: disable=no-member
 
@@ -71,5 +75,9 @@ class Label(_MathVisual):
             and ppos[1] <= _ppos[1] + self._sstdinputs.size
         )
 
+    def _physicalBounds(self):
+        x, y = self._spposinputs.pos
+        return (x, y, x + self._sstdinputs.width, y + self._sstdinputs.size)
+
     def translate(self, pdisp):
         pass
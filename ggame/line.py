@@ -56,6 +56,23 @@ class LineSegment(_MathVisual):
         self.position = start
         return LineAsset(end[0] - start[0], end[1] - start[1], self._stdinputs.style())
 
+    def _canTranslate(self):
+        return True
+
+    def _canScale(self):
+        return True
+
+    def _redrawAsset(self):
+        # pylint: disable=no-member
+        start = self._pposinputs.pos
+        end = self._pposinputs.end
+        # pylint: enable=no-member
+        self.asset.delta_x = end[0] - start[0]
+        self.asset.delta_y = end[1] - start[1]
+        self.asset.redraw()
+        self.position = start
+        return True
+
     def physicalPointTouching(self, ppos):
         """
         This method always returns False.
@@ -1,9 +1,13 @@
+# pylint: disable=too-many-lines
 """
 These MathApp-based digital logic classes are experimental.
 """
 
 from abc import ABCMeta, abstractmethod
-from ggame.mathapp import _MathDynamic
+from functools import partial, reduce
+from heapq import heappop, heappush
+from operator import and_, or_
+from ggame.mathapp import MathApp, _MathDynamic
 
 
 # decorator for _getvalue or any value handler that may experience recursion
@@ -23,6 +27,31 @@ def _recursiontrap(handler):
     return trapmagic
 
 
+def _state(value):
+    """
+    Interpret a value as a logic state: True (or 1), False (or 0) or None
+    (an open input).
+    """
+    if value in (True,):
+        return True
+    if value in (False,):
+        return False
+    return None
+
+
+def _epoch():
+    """
+    The key under which device outputs are cached: outputs computed while
+    the MathApp objects are stepped are reused until the next frame, or
+    until an input reports a change, the inputs of a device are set or a
+    clock ticks. None (nothing is cached) between frames.
+    """
+    # pylint: disable=protected-access
+    if MathApp._frame is None:
+        return None
+    return MathApp._frame, MathApp._changes, _BoolDevice._generation
+
+
 class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
     """
     Base class for boolean objects.
@@ -36,7 +65,17 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
         * **namedinputs**  (*list[str]*) List of input names.
     """
 
+    # the Circuit the device has been compiled into, if any
+    _circuit = None
+    # number of times the inputs or the clocked state of any device have
+    # changed, and the epoch and value of the cached output (see _epoch)
+    _generation = 0
+    _cacheepoch = None
+    _cachevalue = None
+
     def __init__(self, mininputqty, **kwargs):
+        self._enable = None
+        self._input = None
         self.inp = [None] * mininputqty
         self.enable = True
         namedinputs = kwargs.get("namedinputs", [])
@@ -45,8 +84,6 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
         self.lastget = False
         self.resetval = False
         self.firsttime = True
-        self._enable = None
-        self._input = None
         super().__init__()
 
     @property
@@ -58,10 +95,14 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
 
     @inp.setter
     def inp(self, val):
+        self._unlink(*(self._input or ()))
         try:
             self._input = [self.eval(v) for v in list(val)]
         except TypeError:
             self._input = [self.eval(val)]
+        _BoolDevice._generation += 1
+        if self._circuit is not None:
+            self._circuit.invalidate()
 
     # Enable attribute controls the "tri-state" of output
     @property
@@ -73,6 +114,7 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
 
     @enable.setter
     def enable(self, val):
+        self._unlink(self._enable)
         self._enable = self.eval(val)
 
     @abstractmethod
@@ -80,6 +122,42 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
     def _getvalue(self):
         return None
 
+    @abstractmethod
+    def _evaluate(self, states):
+        """
+        Compute the output from the states of the inputs returned by
+        :meth:`_fanin`, given as an iterable.
+        """
+        return None
+
+    def _fanin(self):
+        """
+        The input references the output depends on.
+        """
+        return self._input
+
+    def _sampled(self):
+        """
+        The input references sampled when a clock ticks, for clocked
+        devices.
+        """
+        return []
+
+    def _bitEvaluator(self):
+        """
+        The function that computes the output for many input vectors at
+        once, from the bit plane of each input returned by :meth:`_fanin`
+        (an int with a bit set for each vector in which the input is True)
+        and an int with a bit set for every vector. The gates provide it as
+        a static `_evaluateBits` method of bitwise operations on whole
+        planes; any other device is evaluated one vector at a time with
+        :meth:`_evaluate`.
+        """
+        evaluate = getattr(self, "_evaluateBits", None)
+        if evaluate is None:
+            return partial(_vectorBits, self._evaluate)
+        return evaluate
+
     @staticmethod
     def _inputState(value):
         """
@@ -89,20 +167,24 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
             inputs = [] + value
         except TypeError:
             inputs = [value]
-        scalars = [v() for v in inputs]
-        ones = scalars.count(True) + scalars.count(1)
-        zeros = scalars.count(False) + scalars.count(0)
-        if ones > 0 and zeros > 0:
+        states = {_state(v()) for v in inputs}
+        states.discard(None)
+        if len(states) > 1:
             raise ValueError("Conflicting inputs found")
-        if ones > 0:
-            return True
-        if zeros > 0:
-            return False
-        return None
+        return states.pop() if states else None
 
     def __call__(self):
         if self.enable:
-            return self._getvalue()
+            if self._circuit is not None:
+                return self._circuit.value(self)
+            # a device feeding many others is evaluated once per frame
+            epoch = _epoch()
+            if epoch is None:
+                return self._getvalue()
+            if epoch != self._cacheepoch:
+                self._cachevalue = self._getvalue()
+                self._cacheepoch = epoch
+            return self._cachevalue
         return None
 
     def getinput(self, inputname):
@@ -120,7 +202,11 @@ class _BoolDevice(_MathDynamic, metaclass=ABCMeta):
         :param str inputname: Name to assign.
         :param function reference: Callable object or function connected to input.
         """
+        self._unlink(self._indict.get(inputname))
         self._indict[inputname] = self.eval(reference)
+        _BoolDevice._generation += 1
+        if self._circuit is not None:
+            self._circuit.invalidate()
 
 
 class _BoolOneInput(_BoolDevice):
@@ -131,9 +217,12 @@ class _BoolOneInput(_BoolDevice):
     def __init__(self, *args, **kwargs):
         super().__init__(1, *args, **kwargs)
 
-    @abstractmethod
-    @_recursiontrap  # MUST use with any implementation that may recurse!
+    @_recursiontrap
     def _getvalue(self):
+        return self._evaluate(self._inputState(v) for v in self._fanin())
+
+    @abstractmethod
+    def _evaluate(self, states):
         return None
 
 
@@ -145,9 +234,12 @@ class _BoolMultiInput(_BoolDevice):
     def __init__(self, *args, **kwargs):
         super().__init__(2, *args, **kwargs)
 
-    @abstractmethod
-    @_recursiontrap  # MUST use with any implementation that may recurse!
+    @_recursiontrap
     def _getvalue(self):
+        return self._evaluate(self._inputState(v) for v in self._fanin())
+
+    @abstractmethod
+    def _evaluate(self, states):
         return None
 
 
@@ -156,52 +248,64 @@ class BoolNOT(_BoolOneInput):
     Logical NOT boolean gate.
     """
 
-    @_recursiontrap
-    def _getvalue(self):
-        inval = self._inputState(self.inp[0])
+    def _evaluate(self, states):
+        inval = next(iter(states))
         if inval is None:
             return True  # equivalent to an "open" input
         return not inval
 
+    @staticmethod
+    def _evaluateBits(planes, ones):
+        return ones ^ planes[0]
+
 
 class BoolAND(_BoolMultiInput):
     """
     Logical AND boolean gate. Multiple inputs.
     """
 
-    @_recursiontrap
-    def _getvalue(self):
-        for v in self._input:
-            if not self._inputState(v):
+    def _evaluate(self, states):
+        for state in states:
+            if not state:
                 return False
         return True
 
+    @staticmethod
+    def _evaluateBits(planes, ones):
+        return reduce(and_, planes)
+
 
 class BoolNOR(_BoolMultiInput):
     """
     Logical NOR boolean gate. Multiple inputs.
     """
 
-    @_recursiontrap
-    def _getvalue(self):
-        for v in self._input:
-            if self._inputState(v):
+    def _evaluate(self, states):
+        for state in states:
+            if state:
                 return False
         return True
 
+    @staticmethod
+    def _evaluateBits(planes, ones):
+        return ones ^ reduce(or_, planes)
+
 
 class BoolNAND(_BoolMultiInput):
     """
     Logical NAND boolean gate. Multiple inputs.
     """
 
-    @_recursiontrap
-    def _getvalue(self):
-        for v in self._input:
-            if not self._inputState(v):
+    def _evaluate(self, states):
+        for state in states:
+            if not state:
                 return True
         return False
 
+    @staticmethod
+    def _evaluateBits(planes, ones):
+        return ones ^ reduce(and_, planes)
+
 
 class BoolSRFF(_BoolOneInput):
     """
@@ -223,23 +327,776 @@ class BoolSRFF(_BoolOneInput):
     def setinput(self, inputname, reference):
         super().setinput(inputname, reference)
         if inputname == "R":
-            self.ic1.In = reference, self.ic2
+            self.ic1.inp = reference, self.ic2
         elif inputname == "S":
-            self.ic2.In = reference, self.ic1
+            self.ic2.inp = reference, self.ic1
 
     def _getvalue(self):
         return self.ic1()
 
-    # pylint: disable=invalid-name
+    def _fanin(self):
+        return [self.ic1]
+
+    def _evaluate(self, states):
+        return next(iter(states))
+
+    @staticmethod
+    def _evaluateBits(planes, ones):
+        return planes[0]
+
+    # pylint: disable-next=invalid-name
     def q_(self):
         """
         Report value of Q_ output.
         """
         return self.ic2()
 
-    # pylint: disable=invalid-name
+    # pylint: disable-next=invalid-name
     def q(self):
         """
         Report value of Q output.
         """
         return self._getvalue()
+
+
+def _vectorBits(evaluate, planes, ones):
+    """
+    The bit plane of a device output, computed one vector at a time with
+    the device's `_evaluate` method.
+    """
+    result = 0
+    for vector in range(ones.bit_length()):
+        bit = 1 << vector
+        if evaluate(bool(plane & bit) for plane in planes):
+            result |= bit
+    return result
+
+
+def _constantBits(state, planes, ones):  # pylint: disable=unused-argument
+    """
+    The bit plane of a device output that does not change between vectors.
+    """
+    return ones if state else 0
+
+
+class Clock:
+    """
+    A clock domain: a set of clocked devices (such as :class:`BoolDFF`)
+    that change state together when the clock ticks. Each tick samples the
+    inputs of all of the devices before any of them changes state.
+
+    A clock does not tick by itself. Call :meth:`tick` (from a button or a
+    :class:`~ggame.timer.Timer`, for example), or run a circuit for many
+    cycles with :meth:`Circuit.run`.
+
+    Example::
+
+        from ggame.logic import BoolCounter, Clock
+
+        clock = Clock()
+        counter = BoolCounter(4, clock)
+        for i in range(5):
+            clock.tick()
+        print(counter.value())  # 5
+    """
+
+    def __init__(self):
+        self._devices = []
+        self.cycles = 0
+        """
+        The number of times the clock has ticked.
+        """
+
+    def tick(self):
+        """
+        Sample the inputs of all of the devices in the clock domain, then
+        load the new states.
+
+        :returns: None
+        """
+        # pylint: disable=protected-access
+        states = [
+            device._next([device._inputState(v) for v in device._sampled()])
+            for device in self._devices
+        ]
+        for device, state in zip(self._devices, states):
+            device._load(state)
+        self.cycles += 1
+
+
+class _BoolClocked(_BoolDevice):
+    """
+    Base class for clocked devices, whose output is a state that only
+    changes when their clock ticks.
+
+    :param Clock clock: The clock domain of the device.
+    :param int mininputqty: The minimum number of inputs possible.
+
+    :Optional Keyword Arguments:
+
+        * **initial**  (*bool*) Initial state. The default is False.
+    """
+
+    def __init__(self, clock, mininputqty, **kwargs):
+        self._state = bool(kwargs.pop("initial", False))
+        self.clock = clock
+        super().__init__(mininputqty, **kwargs)
+        clock._devices.append(self)  # pylint: disable=protected-access
+
+    def destroy(self):
+        # pylint: disable-next=protected-access
+        self.clock._devices = [d for d in self.clock._devices if d is not self]
+        super().destroy()
+
+    def _getvalue(self):
+        return self._state
+
+    def _fanin(self):
+        return []
+
+    def _sampled(self):
+        return self._input
+
+    def _evaluate(self, states):
+        return self._state
+
+    def _evaluateBits(self, planes, ones):
+        return _constantBits(self._state, planes, ones)
+
+    def _bitEvaluator(self):
+        # a function that does not refer to the device, for other processes
+        return partial(_constantBits, self._state)
+
+    @abstractmethod
+    def _next(self, states):
+        """
+        Compute the next state from the states of the inputs returned by
+        :meth:`_sampled`, given as a list.
+        """
+        return None
+
+    def _load(self, state):
+        """
+        Change to the state computed when the clock ticked.
+        """
+        if state != self._state:
+            self._state = state
+            _BoolDevice._generation += 1
+            if self._circuit is not None:
+                self._circuit._clocked(self)  # pylint: disable=protected-access
+
+
+class BoolDFF(_BoolClocked):
+    """
+    D (data) flip-flop: when the clock ticks, the output becomes the state
+    of the input (an open input is False).
+
+    :param Clock clock: The clock domain of the flip-flop.
+
+    :Optional Keyword Arguments:
+
+        * **initial**  (*bool*) Initial state. The default is False.
+    """
+
+    def __init__(self, clock, **kwargs):
+        super().__init__(clock, 1, **kwargs)
+
+    def _next(self, states):
+        return bool(states[0])
+
+
+class BoolTFF(_BoolClocked):
+    """
+    T (toggle) flip-flop: when the clock ticks, the output is inverted if
+    all of the inputs are True. Multiple inputs.
+
+    :param Clock clock: The clock domain of the flip-flop.
+
+    :Optional Keyword Arguments:
+
+        * **initial**  (*bool*) Initial state. The default is False.
+    """
+
+    def __init__(self, clock, **kwargs):
+        super().__init__(clock, 2, **kwargs)
+
+    def _next(self, states):
+        return self._state != all(states)
+
+
+class BoolRegister:
+    """
+    Multiple-bit register of :class:`BoolDFF` flip-flops, loaded with the
+    states of its inputs when the clock ticks.
+
+    :param int width: Number of bits.
+    :param Clock clock: The clock domain of the register.
+
+    :Optional Keyword Arguments:
+
+        * **initial**  (*int*) Initial value. The default is 0.
+    """
+
+    _flipflop = BoolDFF
+
+    def __init__(self, width, clock, **kwargs):
+        initial = kwargs.get("initial", 0)
+        self.q = [self._flipflop(clock, initial=initial >> i & 1) for i in range(width)]
+        """
+        The flip-flops, least significant bit first.
+        """
+
+    @property
+    def inp(self):
+        """
+        Report the list of input references, least significant bit first.
+        """
+        return [bit.inp[0] for bit in self.q]
+
+    @inp.setter
+    def inp(self, val):
+        for bit, reference in zip(self.q, val):
+            bit.inp = reference
+
+    def value(self):
+        """
+        Report the value of the register.
+
+        :rtype: int
+        """
+        return sum(1 << i for i, bit in enumerate(self.q) if bit())
+
+    def destroy(self):
+        """
+        Destroy the flip-flops.
+        """
+        for bit in self.q:
+            bit.destroy()
+
+
+class BoolCounter(BoolRegister):
+    """
+    Multiple-bit binary counter of :class:`BoolTFF` flip-flops, which counts
+    up each time the clock ticks while its input is True. The input is True
+    by default.
+
+    :param int width: Number of bits.
+    :param Clock clock: The clock domain of the counter.
+
+    :Optional Keyword Arguments:
+
+        * **initial**  (*int*) Initial value. The default is 0.
+    """
+
+    _flipflop = BoolTFF
+
+    def __init__(self, width, clock, **kwargs):
+        super().__init__(width, clock, **kwargs)
+        self.inp = True
+
+    @property
+    def inp(self):
+        """
+        Report the count enable input reference.
+        """
+        return self.q[0].inp[0]
+
+    @inp.setter
+    def inp(self, val):
+        # each bit toggles when the counter is enabled and all of the lower
+        # bits are True
+        for i, bit in enumerate(self.q):
+            bit.inp = [val] + self.q[:i]
+
+
+def _plane(bit, count):
+    """
+    The bit plane of input `bit` over `count` (a power of two) input
+    vectors, where vector v has input k set to bit k of v.
+    """
+    block = 1 << bit
+    if block >= count:
+        return 0
+    period = (1 << (2 * block)) - 1
+    return (((1 << block) - 1) << block) * (((1 << count) - 1) // period)
+
+
+def _simulate(program, planes, ones, outputs):
+    """
+    Run a compiled circuit program on the bit planes of its primary inputs,
+    returning the bit planes of the `outputs` (indices into the values).
+    """
+    values = list(planes)
+    for evaluate, operands in program:
+        values.append(evaluate([values[i] for i in operands], ones))
+    return [values[i] for i in outputs]
+
+
+def _simulateShard(program, constants, inputs, freebits, shard, outputs):
+    """
+    Run a compiled circuit program on the 2**freebits input vectors of a
+    shard of the input space, in which the inputs after the first
+    `freebits` are fixed to the bits of the shard number, and the primary
+    inputs that are not varied keep their `constants` states.
+    """
+    count = 1 << freebits
+    ones = (1 << count) - 1
+    planes = [ones if state else 0 for state in constants]
+    for k, i in enumerate(inputs):
+        if k < freebits:
+            planes[i] = _plane(k, count)
+        else:
+            planes[i] = ones if shard >> (k - freebits) & 1 else 0
+    return _simulate(program, planes, ones, outputs)
+
+
+class Circuit:
+    """
+    A compiled netlist of logic devices. The devices are found by following
+    the inputs of the given output devices back to the primary inputs
+    (buttons, toggles, functions and anything else that is not a logic
+    device), and are sorted into levels, so that each device comes after
+    the devices that feed it (except around feedback loops, as in a
+    :class:`BoolSRFF`).
+
+    Once a device is part of a circuit, calling it settles the circuit: the
+    primary inputs are read once, and only the devices downstream of an
+    input that changed are evaluated, in level order, each at most once
+    (devices in a feedback loop are evaluated again until the loop is
+    stable). Changing the inputs of a device in the circuit recompiles it.
+
+    The outputs of clocked devices (such as :class:`BoolDFF`) only change
+    when their :class:`Clock` ticks, and :meth:`run` ticks a clock many
+    times without waiting for MathApp frames.
+
+    :param \\*outputs: The logic devices whose outputs are used.
+
+    Example::
+
+        from ggame.logic import BoolAND, BoolNOT, Circuit
+        from ggame.inputpoint import MetalToggle
+        from ggame.indicator import LEDIndicator
+        from ggame.mathapp import MathApp
+
+        t1 = MetalToggle(1, (0, 0))
+        t2 = MetalToggle(1, (0, 0.3))
+        and1 = BoolAND()
+        and1.inp = t1, t2
+        not1 = BoolNOT()
+        not1.inp = and1
+        Circuit(not1)
+        LEDIndicator((0.5, 0.15), not1)
+
+        MathApp().run()
+    """
+
+    # pylint: disable=protected-access
+
+    # limit on evaluations per device in one settle, for feedback loops that
+    # never become stable
+    _MAXEVALUATIONS = 16
+
+    def __init__(self, *outputs):
+        self._outputs = outputs
+        # the devices (each after the devices that feed it, except around
+        # feedback loops) and the primary inputs
+        self._devices = []
+        self._index = {}
+        self._primaries = []
+        # inputs of each device: (True, device index) or (False, primary
+        # index), and the devices fed by each device and primary input
+        self._fanins = []
+        self._fanouts = []
+        self._primaryfanouts = []
+        self._levels = []
+        # the current device outputs and primary input states
+        self._values = []
+        self._primarystates = []
+        # clocked devices whose state has changed since the last settle
+        self._ticked = []
+        self._compiled = False
+        # True while reading the primary inputs, which may themselves use
+        # devices in the circuit
+        self._settling = False
+        self.compile()
+
+    def invalidate(self):
+        """
+        Mark the circuit as needing to be compiled again, e.g. after the
+        inputs of one of its devices have changed. This is done
+        automatically when inputs are set with
+        :attr:`~ggame.logic._BoolDevice.inp` or
+        :meth:`~ggame.logic._BoolDevice.setinput`.
+
+        :returns: None
+        """
+        self._compiled = False
+
+    def _discover(self):
+        """
+        Find the devices and primary inputs of the circuit, returning the
+        devices in depth first post order (inputs before the devices they
+        feed, ignoring feedback) and the primary inputs. The devices that
+        feed clocked devices are part of the circuit, but the other inputs
+        of clocked devices are only read when their clock ticks, so they are
+        not primary inputs.
+        """
+
+        def sources(device):
+            yield from ((source, True) for source in device._fanin())
+            yield from ((source, False) for source in device._sampled())
+
+        order, primaries, seen = [], {}, set()
+        for output in self._outputs:
+            if id(output) in seen:
+                continue
+            seen.add(id(output))
+            stack = [(output, sources(output))]
+            while stack:
+                device, fanin = stack[-1]
+                for source, combinational in fanin:
+                    if isinstance(source, _BoolDevice):
+                        if id(source) not in seen:
+                            seen.add(id(source))
+                            stack.append((source, sources(source)))
+                            break
+                    elif combinational:
+                        primaries.setdefault(id(source), source)
+                else:
+                    stack.pop()
+                    order.append(device)
+        return order, list(primaries.values())
+
+    def compile(self):
+        """
+        Find and levelize the devices of the circuit and settle it. This is
+        done automatically when the circuit is created, and when it is next
+        used after being invalidated.
+
+        :returns: None
+        """
+        for device in self._devices:
+            device._circuit = None
+        devices, primaries = self._discover()
+        index = {id(device): i for i, device in enumerate(devices)}
+        primaryindex = {id(source): i for i, source in enumerate(primaries)}
+        self._fanins = []
+        self._fanouts = [[] for _ in devices]
+        self._primaryfanouts = [[] for _ in primaries]
+        self._levels = []
+        for i, device in enumerate(devices):
+            fanin, level = [], 0
+            for source in device._fanin():
+                if isinstance(source, _BoolDevice):
+                    j = index[id(source)]
+                    fanin.append((True, j))
+                    self._fanouts[j].append(i)
+                    if j < i:  # not feedback
+                        level = max(level, self._levels[j] + 1)
+                else:
+                    j = primaryindex[id(source)]
+                    fanin.append((False, j))
+                    self._primaryfanouts[j].append(i)
+            self._fanins.append(fanin)
+            self._levels.append(level)
+            device._circuit = self
+        self._devices = devices
+        self._index = index
+        self._primaries = primaries
+        self._values = [None] * len(devices)
+        self._primarystates = [_BoolDevice._inputState(source) for source in primaries]
+        self._ticked = []
+        self._compiled = True
+        self._propagate(range(len(devices)))
+
+    def _propagate(self, pending):
+        """
+        Evaluate the devices in `pending` and, in level order, the devices
+        downstream of any whose output changes.
+        """
+        levels, values, devices = self._levels, self._values, self._devices
+        queue = []
+        queued = set()
+        for i in pending:
+            if i not in queued:
+                queued.add(i)
+                heappush(queue, (levels[i], i))
+        evaluations = {}
+        while queue:
+            _level, i = heappop(queue)
+            queued.discard(i)
+            evaluations[i] = evaluations.get(i, 0) + 1
+            if evaluations[i] > self._MAXEVALUATIONS:
+                continue
+            states = [
+                _state(values[j]) if isdevice else self._primarystates[j]
+                for isdevice, j in self._fanins[i]
+            ]
+            value = devices[i]._evaluate(states)
+            if value != values[i]:
+                values[i] = value
+                for j in self._fanouts[i]:
+                    if j not in queued:
+                        queued.add(j)
+                        heappush(queue, (levels[j], j))
+
+    def settle(self):
+        """
+        Read the primary inputs and bring the device outputs up to date.
+
+        :returns: None
+        """
+        if self._settling:
+            return
+        self._settling = True
+        try:
+            if not self._compiled:
+                self.compile()
+                return
+            pending, self._ticked = self._ticked, []
+            states = self._primarystates
+            for i, source in enumerate(self._primaries):
+                state = _BoolDevice._inputState(source)
+                if state is not states[i]:
+                    states[i] = state
+                    pending.extend(self._primaryfanouts[i])
+            if pending:
+                self._propagate(pending)
+        finally:
+            self._settling = False
+
+    def _clocked(self, device):
+        """
+        Note that the state of a clocked device has changed, so its output
+        is propagated when the circuit is next settled.
+        """
+        if self._compiled:
+            self._ticked.append(self._index[id(device)])
+
+    def run(self, cycles, clock, waveform=None):
+        """
+        Run the circuit for a number of clock cycles, settling it after
+        each tick of the clock, without waiting for MathApp frames.
+
+        :param int cycles: The number of times to tick the clock.
+        :param Clock clock: The clock of the clocked devices to step.
+        :param Waveform waveform: Optional waveform that records its signals
+            once per cycle, before the clock ticks.
+        :returns: None
+        """
+        for _ in range(cycles):
+            self.settle()
+            if waveform is not None:
+                waveform.sample()
+            clock.tick()
+        self.settle()
+
+    def value(self, device):
+        """
+        Settle the circuit and return the output of one of its devices.
+
+        :param device: A logic device in the circuit.
+        :returns: The output of the device (True, False or None).
+        """
+        self.settle()
+        return self._values[self._index[id(device)]]
+
+    def _program(self):
+        """
+        The circuit as a program for :func:`_simulate`: a list of (bit
+        evaluation function, operand indices) for the devices in order,
+        where operands 0 to P-1 are the P primary inputs and the following
+        operands are the devices.
+        """
+        self.settle()
+        count = len(self._primaries)
+        program = []
+        for i, device in enumerate(self._devices):
+            operands = []
+            for isdevice, j in self._fanins[i]:
+                if isdevice and j >= i:
+                    raise ValueError("Circuit has feedback (it is not combinational)")
+                operands.append(count + j if isdevice else j)
+            program.append((device._bitEvaluator(), operands))
+        return program
+
+    def truthTable(self, inputs=None, processes=1):
+        """
+        Compute the outputs of the circuit for every combination of the
+        values of some of its primary inputs (the others keep their current
+        values). All the combinations are evaluated together: each signal
+        is represented by an int with one bit per combination, so each
+        device is evaluated with a single bitwise operation. The circuit
+        must be combinational (without feedback).
+
+        Combination number v sets input k to bit k of v, so the output for
+        combination v is bit v of the output's int::
+
+            table = circuit.truthTable([a, b])
+            value = bool(table[0] >> 0b10 & 1)  # first output, a=0 b=1
+
+        :param list inputs: The primary inputs (the same objects or
+            functions given as device inputs) to vary. The default is all of
+            the primary inputs, in the order they were found.
+        :param int processes: Number of processes to split the work
+            between, for large numbers of inputs. The default is 1 (all the
+            work is done in this process).
+        :rtype: list[int]
+        :returns: For each output device given when the circuit was created,
+            an int with a bit set for each combination of the inputs where
+            the output is True.
+        """
+        program = self._program()
+        primaryindex = {id(source): i for i, source in enumerate(self._primaries)}
+        if inputs is None:
+            inputs = self._primaries
+        inputs = [primaryindex[id(source)] for source in inputs]
+        constants = [bool(state) for state in self._primarystates]
+        count = len(self._primaries)
+        outputs = [count + self._index[id(output)] for output in self._outputs]
+        # split the input space into shards by fixing the last inputs
+        fixedbits = 0
+        while 1 << fixedbits < processes and fixedbits < len(inputs):
+            fixedbits += 1
+        freebits = len(inputs) - fixedbits
+        args = (program, constants, inputs, freebits)
+        if fixedbits:
+            # pylint: disable-next=import-outside-toplevel
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(processes) as executor:
+                futures = [
+                    executor.submit(_simulateShard, *args, shard, outputs)
+                    for shard in range(1 << fixedbits)
+                ]
+                shards = [future.result() for future in futures]
+        else:
+            shards = [_simulateShard(*args, 0, outputs)]
+        width = 1 << freebits
+        return [
+            sum(shard[i] << (width * s) for s, shard in enumerate(shards))
+            for i in range(len(outputs))
+        ]
+
+    def equivalent(self, other, inputs=None, otherinputs=None, processes=1):
+        """
+        Check whether two circuits compute the same outputs for every
+        combination of the values of their inputs, by comparing their
+        truth tables (see :meth:`truthTable`).
+
+        :param Circuit other: The circuit to compare with. It must have the
+            same number of outputs.
+        :param list inputs: The primary inputs of this circuit to vary. The
+            default is all of them, in the order they were found.
+        :param list otherinputs: The corresponding primary inputs of the
+            other circuit. The default is the same as **inputs**, for
+            circuits that share their inputs.
+        :param int processes: Number of processes to split the work
+            between.
+        :rtype: bool
+        :returns: True if the circuits are equivalent.
+        """
+        if inputs is None:
+            inputs = self._primaries
+        if otherinputs is None:
+            otherinputs = inputs
+        if len(inputs) != len(otherinputs):
+            raise ValueError("Circuits must have the same number of inputs")
+        return self.truthTable(inputs, processes) == other.truthTable(
+            otherinputs, processes
+        )
+
+
+class Waveform:
+    """
+    A record of the states of some signals (logic devices, inputs or
+    functions), sampled once per clock cycle by :meth:`Circuit.run` or
+    whenever :meth:`sample` is called. Each state is stored in one byte.
+
+    :param signals: The signals to record: a dictionary of names and
+        signals, or a list of (name, signal) pairs.
+
+    Example::
+
+        from ggame.logic import BoolCounter, Circuit, Clock, Waveform
+
+        clock = Clock()
+        counter = BoolCounter(2, clock)
+        circuit = Circuit(*counter.q)
+        waveform = Waveform({"q0": counter.q[0], "q1": counter.q[1]})
+        circuit.run(8, clock, waveform)
+        print(waveform.vcd())
+    """
+
+    # stored codes of False, True and None (an open input or a disabled
+    # device) and their VCD values
+    _CODES = {False: 0, True: 1, None: 2}
+    _VCDVALUES = "01z"
+
+    def __init__(self, signals):
+        if isinstance(signals, dict):
+            signals = signals.items()
+        self._names = []
+        self._signals = []
+        for name, signal in signals:
+            self._names.append(name)
+            self._signals.append(signal)
+        self._samples = [bytearray() for _ in self._signals]
+
+    def sample(self):
+        """
+        Record the current state of each signal.
+
+        :returns: None
+        """
+        codes = self._CODES
+        for signal, samples in zip(self._signals, self._samples):
+            # pylint: disable-next=protected-access
+            samples.append(codes[_BoolDevice._inputState(signal)])
+
+    def __len__(self):
+        return len(self._samples[0]) if self._samples else 0
+
+    def __getitem__(self, name):
+        """
+        The recorded states (True, False or None) of the signal with a given
+        name.
+        """
+        states = (False, True, None)
+        return [states[code] for code in self._samples[self._names.index(name)]]
+
+    def vcd(self, timescale="1 ns", module="circuit"):
+        """
+        Export the recorded states in Value Change Dump format, as used by
+        waveform viewers such as GTKWave. Sample n is at time n.
+
+        :param str timescale: The duration of one sample.
+        :param str module: The name of the scope that contains the signals.
+        :rtype: str
+        :returns: The contents of a VCD file.
+        """
+        codes = []
+        for i in range(len(self._names)):
+            code = ""
+            i += 1
+            while i:
+                i, digit = divmod(i - 1, 94)
+                code += chr(33 + digit)
+            codes.append(code)
+        lines = [f"$timescale {timescale} $end", f"$scope module {module} $end"]
+        for code, name in zip(codes, self._names):
+            lines.append(f"$var wire 1 {code} {name} $end")
+        lines += ["$upscope $end", "$enddefinitions $end"]
+        values = self._VCDVALUES
+        last = [None] * len(self._names)
+        for time in range(len(self)):
+            changes = []
+            for i, samples in enumerate(self._samples):
+                if samples[time] != last[i]:
+                    last[i] = samples[time]
+                    changes.append(values[samples[time]] + codes[i])
+            if time == 0:
+                lines += ["#0", "$dumpvars"] + changes + ["$end"]
+            elif changes:
+                lines += [f"#{time}"] + changes
+        return "\n".join(lines) + "\n"
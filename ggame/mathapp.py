@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 """
 These mathematics and geometry extensions subclass the :class:`~ggame.app.App`
 and :class:`~ggame.sprite.Sprite` classes to create a framework for building
@@ -13,12 +14,32 @@ from abc import ABCMeta, abstractmethod
 from time import time
 from math import sqrt
 from collections import namedtuple
+from operator import methodcaller
 from ggame.sprite import Sprite
-from ggame.asset import Color, LineStyle, ImageAsset
+from ggame.asset import Color, LineStyle, ImageAsset, TextAsset
 from ggame.app import App
+from ggame.spatial import SpatialGrid
 
+_np = False  # numpy module, None if unavailable, False until first needed
 
-class MathApp(App):
+
+def _numpy():
+    """
+    Return the numpy module, or None if it is not installed. NumPy is
+    optional, and is only imported the first time it is needed.
+    """
+    global _np  # pylint: disable=global-statement
+    if _np is False:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+class MathApp(App):  # pylint: disable=too-many-public-methods
     """
     MathApp is a subclass of the ggame :class:`~ggame.app.App` class. It
     incorporates the following extensions:
@@ -38,19 +59,41 @@ class MathApp(App):
     scale = _DEFAULTSCALE  # pixels per unit
     _xcenter = 0  # center of screen in units
     _ycenter = 0
+    # cached view transform: (scale, xcenter, ycenter, half window width,
+    # half window height, window); the window is None if there is none
+    _NOVIEW = (0, 0, 0, 0, 0, None)
+    _view = _NOVIEW
     _mathVisualList = []
     _mathDynamicList = []
     _mathMovableList = []
     _mathSelectableList = []
     _mathStrokableList = []
+    # spatial indexes of the movable, selectable and strokable objects, for
+    # finding the objects under the mouse
+    _mathMovableIndex = SpatialGrid(methodcaller("_physicalBounds"))
+    _mathSelectableIndex = SpatialGrid(methodcaller("_physicalBounds"))
+    _mathStrokableIndex = SpatialGrid(methodcaller("_physicalBounds"))
     _viewNotificationList = []
     time = 0
+    zoomdebounce = 0.25
+    """
+    Time (in seconds) without a further zoom before visuals are redrawn at the
+    new scale. Until then, a zoom is shown by scaling the existing assets.
+    """
+    _zoomtime = None  # time of the last zoom, if visuals still show a preview
+    # number of the frame whose objects are being stepped (None between
+    # steps), and the number of value changes reported to other objects; values
+    # computed during a frame may be cached until either changes
+    _frame = None
+    _framecount = 0
+    _changes = 0
 
     def __init__(self, scale=_DEFAULTSCALE):
         MathApp.time = 0
         self._starttime = time()
         super().__init__()
         MathApp.scale = scale  # pixels per unit
+        self._updateView()
         # register event callbacks
         self.listenMouseEvent("click", self._handleMouseClick)
         self.listenMouseEvent("mousedown", self._handleMouseDown)
@@ -69,17 +112,76 @@ class MathApp(App):
         """
         The step method overrides :func:`~ggame.app.App.step` in the
         :class:`~ggame.app.App` class, executing step functions in all
-        objects subclassed from :class:`_MathDynamic`.
+        objects subclassed from :class:`_MathDynamic` whose inputs may have
+        changed.
         """
         MathApp.time = time() - self._starttime
-        for spr in self._mathDynamicList:
-            spr.step()
+        # pylint: disable=protected-access
+        if (
+            MathApp._zoomtime is not None
+            and MathApp.time - MathApp._zoomtime >= MathApp.zoomdebounce
+        ):
+            MathApp._zoomtime = None
+            for obj in self._mathVisualList:
+                obj._endZoomPreview()
+        MathApp._framecount += 1
+        MathApp._frame = MathApp._framecount
+        try:
+            for spr in self._mathDynamicList:
+                # objects whose inputs are all change-reporting sources only
+                # need a step when one of those sources has changed
+                if spr._stale or spr._polled or not spr._tracked:
+                    spr._stale = False
+                    spr.step()
+        finally:
+            MathApp._frame = None
+        # pylint: enable=protected-access
 
     def _touchAllVisuals(self):
         # touch all visual object assets to use scaling
         for obj in self._mathVisualList:
             obj.touchAsset(True)
 
+    def _panAllVisuals(self):
+        # a pan moves each visual; only assets clipped to the window are
+        # rebuilt
+        for obj in self._mathVisualList:
+            obj._viewChanged()  # pylint: disable=protected-access
+
+    def _zoomAllVisuals(self, ratio):
+        # visuals that are drawn to scale are scaled now and redrawn once
+        # zooming has stopped for zoomdebounce seconds (see step)
+        for obj in self._mathVisualList:
+            obj._previewZoom(ratio)  # pylint: disable=protected-access
+        MathApp._zoomtime = time() - self._starttime
+
+    @classmethod
+    def _updateView(cls):
+        """
+        Recompute the cached view transform. Called whenever the view is
+        panned or zoomed, or the window is created or destroyed.
+        """
+        try:
+            MathApp._view = (
+                MathApp.scale,
+                MathApp._xcenter,
+                MathApp._ycenter,
+                App.win.width / 2,
+                App.win.height / 2,
+                App.win,
+            )
+        except AttributeError:
+            MathApp._view = MathApp._NOVIEW
+        return MathApp._view
+
+    @classmethod
+    def _currentView(cls):
+        view = MathApp._view
+        # scale is a public attribute, so it may be assigned directly
+        if view[0] != MathApp.scale or view[5] is not App.win:
+            view = cls._updateView()
+        return view
+
     @classmethod
     def logicalToPhysical(cls, lp):
         """
@@ -92,22 +194,16 @@ class MathApp(App):
 
         :returns: Physical screen coordinates (x, y)
         """
-
-        def xxform(xvalue, xscale, xcenter, physwidth):
-            """X transform"""
-            return int((xvalue - xcenter) * xscale + physwidth / 2)
-
-        def yxform(yvalue, yscale, ycenter, physheight):
-            """Y transform"""
-            return int(physheight / 2 - (yvalue - ycenter) * yscale)
-
-        try:
-            return (
-                xxform(lp[0], cls.scale, cls._xcenter, cls.win.width),
-                yxform(lp[1], cls.scale, cls._ycenter, cls.win.height),
-            )
-        except AttributeError:
+        view = MathApp._view
+        if view[0] != MathApp.scale or view[5] is not App.win:
+            view = cls._updateView()
+        if view[5] is None:
             return lp
+        scale, xcenter, ycenter, halfwidth, halfheight, _win = view
+        return (
+            int((lp[0] - xcenter) * scale + halfwidth),
+            int(halfheight - (lp[1] - ycenter) * scale),
+        )
 
     @classmethod
     def physicalToLogical(cls, pp):
@@ -121,22 +217,76 @@ class MathApp(App):
 
         :returns: Logical screen coordinates (x, y)
         """
+        view = MathApp._view
+        if view[0] != MathApp.scale or view[5] is not App.win:
+            view = cls._updateView()
+        if view[5] is None:
+            return pp
+        scale, xcenter, ycenter, halfwidth, halfheight, _win = view
+        return (
+            (pp[0] - halfwidth) / scale + xcenter,
+            (halfheight - pp[1]) / scale + ycenter,
+        )
 
-        def xxform(xvalue, xscale, xcenter, physwidth):
-            """X transform"""
-            return (xvalue - physwidth / 2) / xscale + xcenter
-
-        def yxform(yvalue, yscale, ycenter, physheight):
-            """Y transform"""
-            return (physheight / 2 - yvalue) / yscale + ycenter
+    @classmethod
+    def logicalToPhysicalArray(cls, points):
+        """
+        Transform many points from logical to physical space in one call.
+        The result is the same as calling :meth:`logicalToPhysical` for each
+        point.
+
+        :param points: Logical coordinates, as an N x 2 NumPy array or a
+            sequence of (x, y) pairs.
+
+        :rtype: numpy.ndarray
+
+        :returns: An N x 2 integer array of physical coordinates, or a list
+            of (x, y) tuples if NumPy is not installed.
+        """
+        view = cls._currentView()
+        if view[5] is None:
+            return points
+        np = _numpy()
+        if np is None:
+            return [cls.logicalToPhysical(p) for p in points]
+        scale, xcenter, ycenter, halfwidth, halfheight, _win = view
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        return np.column_stack(
+            (
+                (points[:, 0] - xcenter) * scale + halfwidth,
+                halfheight - (points[:, 1] - ycenter) * scale,
+            )
+        ).astype(int)
 
-        try:
-            return (
-                xxform(pp[0], cls.scale, cls._xcenter, cls.win.width),
-                yxform(pp[1], cls.scale, cls._ycenter, cls.win.height),
+    @classmethod
+    def physicalToLogicalArray(cls, points):
+        """
+        Transform many points from physical to logical space in one call.
+        The result is the same as calling :meth:`physicalToLogical` for each
+        point.
+
+        :param points: Physical coordinates, as an N x 2 NumPy array or a
+            sequence of (x, y) pairs.
+
+        :rtype: numpy.ndarray
+
+        :returns: An N x 2 array of logical coordinates, or a list of (x, y)
+            tuples if NumPy is not installed.
+        """
+        view = cls._currentView()
+        if view[5] is None:
+            return points
+        np = _numpy()
+        if np is None:
+            return [cls.physicalToLogical(p) for p in points]
+        scale, xcenter, ycenter, halfwidth, halfheight, _win = view
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        return np.column_stack(
+            (
+                (points[:, 0] - halfwidth) / scale + xcenter,
+                (halfheight - points[:, 1]) / scale + ycenter,
             )
-        except AttributeError:
-            return pp
+        )
 
     @classmethod
     def translateLogicalToPhysical(cls, pp):
@@ -151,19 +301,8 @@ class MathApp(App):
 
         :returns: Physical screen translation ordered pair (delta x, delta y)
         """
-
-        def xxform(xvalue, xscale):
-            """X transform"""
-            return xvalue * xscale
-
-        def yxform(yvalue, yscale):
-            """Y transform"""
-            return -yvalue * yscale
-
-        try:
-            return (xxform(pp[0], cls.scale), yxform(pp[1], cls.scale))
-        except AttributeError:
-            return pp
+        scale = MathApp.scale
+        return (pp[0] * scale, -pp[1] * scale)
 
     @classmethod
     def translatePhysicalToLogical(cls, pp):
@@ -178,23 +317,12 @@ class MathApp(App):
 
         :returns: Logical screen translation ordered pair (delta x, delta y)
         """
-
-        def xxform(xvalue, xscale):
-            """X transform"""
-            return xvalue / xscale
-
-        def yxform(yvalue, yscale):
-            """Y transform"""
-            return -yvalue / yscale
-
-        try:
-            return (xxform(pp[0], cls.scale), yxform(pp[1], cls.scale))
-        except AttributeError:
-            return pp
+        scale = MathApp.scale
+        return (pp[0] / scale, -pp[1] / scale)
 
     def _handleMouseClick(self, event):
         found = False
-        for obj in self._mathSelectableList:
+        for obj in self._mathSelectableIndex.query((event.x, event.y)):
             if obj.physicalPointTouching((event.x, event.y)):
                 found = True
                 if not obj.selected:
@@ -208,19 +336,19 @@ class MathApp(App):
         self._mousedown = True
         self._mouse_captured_object = None
         self._mouse_stroked_object = None
-        for obj in self._mathSelectableList:
+        for obj in self._mathSelectableIndex.query((event.x, event.y)):
             if obj.physicalPointTouching((event.x, event.y)):
                 obj.mousedown()
                 self._mouse_down_object = obj
                 break
-        for obj in self._mathMovableList:
+        for obj in self._mathMovableIndex.query((event.x, event.y)):
             if obj.physicalPointTouching((event.x, event.y)) and not (
                 obj.strokable and obj.canstroke((event.x, event.y))
             ):
                 self._mouse_captured_object = obj
                 break
         if not self._mouse_captured_object:
-            for obj in self._mathStrokableList:
+            for obj in self._mathStrokableIndex.query((event.x, event.y)):
                 if obj.canstroke((event.x, event.y)):
                     self._mouse_stroked_object = obj
                     break
@@ -252,7 +380,8 @@ class MathApp(App):
                 lmove = self.translatePhysicalToLogical((dx, dy))
                 MathApp._xcenter -= lmove[0]
                 MathApp._ycenter -= lmove[1]
-                self._touchAllVisuals()
+                self._updateView()
+                self._panAllVisuals()
                 self._viewNotify("translate")
 
     def _handleMouseWheel(self, event):
@@ -263,7 +392,8 @@ class MathApp(App):
         elif zoomfactor < 0.8:
             zoomfactor = 0.8
         MathApp.scale *= zoomfactor
-        self._touchAllVisuals()
+        self._updateView()
+        self._zoomAllVisuals(zoomfactor)
         self._viewNotify("zoom")
 
     @property
@@ -277,7 +407,8 @@ class MathApp(App):
     @view_position.setter
     def view_position(self, pos):
         MathApp._xcenter, MathApp._ycenter = pos
-        self._touchAllVisuals()
+        self._updateView()
+        self._panAllVisuals()
         self._viewNotify("translate")
 
     @classmethod
@@ -376,6 +507,7 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj not in cls._mathMovableList:
             cls._mathMovableList.append(obj)
+            cls._mathMovableIndex.add(obj)
 
     @classmethod
     def removeMovable(cls, obj):
@@ -387,6 +519,7 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj in cls._mathMovableList:
             cls._mathMovableList.remove(obj)
+            cls._mathMovableIndex.remove(obj)
 
     @classmethod
     def addSelectable(cls, obj):
@@ -398,6 +531,7 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj not in cls._mathSelectableList:
             cls._mathSelectableList.append(obj)
+            cls._mathSelectableIndex.add(obj)
 
     @classmethod
     def removeSelectable(cls, obj):
@@ -409,6 +543,7 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj in cls._mathSelectableList:
             cls._mathSelectableList.remove(obj)
+            cls._mathSelectableIndex.remove(obj)
 
     @classmethod
     def addStrokable(cls, obj):
@@ -420,6 +555,7 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj not in cls._mathStrokableList:
             cls._mathStrokableList.append(obj)
+            cls._mathStrokableIndex.add(obj)
 
     @classmethod
     def removeStrokable(cls, obj):
@@ -431,6 +567,17 @@ class MathApp(App):
         """
         if isinstance(obj, _MathVisual) and obj in cls._mathStrokableList:
             cls._mathStrokableList.remove(obj)
+            cls._mathStrokableIndex.remove(obj)
+
+    @classmethod
+    def _invalidateBounds(cls, obj):
+        """
+        Mark the screen bounds of a visual object as out of date in the
+        spatial indexes, after its asset has been updated.
+        """
+        cls._mathMovableIndex.invalidate(obj)
+        cls._mathSelectableIndex.invalidate(obj)
+        cls._mathStrokableIndex.invalidate(obj)
 
     @classmethod
     def destroy(cls):
@@ -444,10 +591,30 @@ class MathApp(App):
         MathApp._mathMovableList = []
         MathApp._mathSelectableList = []
         MathApp._mathStrokableList = []
+        MathApp._mathMovableIndex.clear()
+        MathApp._mathSelectableIndex.clear()
+        MathApp._mathStrokableIndex.clear()
         MathApp._viewNotificationList = []
+        MathApp._view = MathApp._NOVIEW
+        MathApp._zoomtime = None
 
 
 class _MathDynamic(metaclass=ABCMeta):
+    # True if the class calls _notifyChanged whenever the value it returns
+    # when called may have changed. Inputs that are instances of such a
+    # class are tracked rather than evaluated every frame.
+    _reportschanges = False
+    # dependency graph: tracked inputs and the objects that use this one
+    _sources = ()
+    _sinks = ()
+    # True if any input must be evaluated every frame
+    _polled = False
+    # True if any input has been tracked: the object then only needs a step
+    # when a tracked source changes, even once none are left
+    _tracked = False
+    # True if a tracked input has changed since the last step
+    _stale = False
+
     def __init__(self):
         self._dynamic = False  # not switched on, by default!
 
@@ -456,6 +623,10 @@ class _MathDynamic(metaclass=ABCMeta):
         Destroy resources, if any and remove from global lists.
         """
         MathApp.removeDynamic(self)
+        for source in self._sources:
+            # pylint: disable-next=protected-access
+            source._sinks = tuple(s for s in source._sinks if s is not self)
+        self._sources = ()
 
     def step(self):
         """
@@ -473,20 +644,59 @@ class _MathDynamic(metaclass=ABCMeta):
         :returns: A function that can be called to retrieve the value passed
             in.
         """
+        # pylint: disable=protected-access
+        if isinstance(val, _MathDynamic) and val._reportschanges:
+            # a source appears once for each input it is used for
+            if val not in self._sources:
+                val._sinks += (self,)
+            self._sources += (val,)
+            self._tracked = True
+            self._setDynamic()  # steps when val reports a change
+            return val
         if callable(val):
+            self._polled = True
             self._setDynamic()  # dynamically defined .. must step
             return val
         return lambda: val
 
+    def _unlink(self, *vals):
+        """
+        Stop tracking inputs (returned by :meth:`eval`) that have been
+        replaced, so that a change of a source that is no longer used does
+        not step this object.
+        """
+        for val in vals:
+            if val in self._sources:
+                i = self._sources.index(val)
+                self._sources = self._sources[:i] + self._sources[i + 1 :]
+                if val not in self._sources:
+                    # pylint: disable-next=protected-access
+                    val._sinks = tuple(s for s in val._sinks if s is not self)
+
     def _setDynamic(self):
         MathApp.addDynamic(self)
         self._dynamic = True
 
+    def _notifyChanged(self):
+        """
+        Inform the objects that use this one as an input that its value
+        has changed, so they are stepped on the next frame.
+        """
+        if self._sinks:
+            MathApp._changes += 1
+        for sink in self._sinks:
+            sink._stale = True  # pylint: disable=protected-access
+
 
 class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
     """
     Abstract Base Class for all visual, potentially dynamic objects.
 
+    Inputs that are themselves change-reporting objects (points, labels,
+    sliders, timers and the like) are not evaluated every frame: the visual
+    is only stepped when one of them reports a change, unless some other
+    input is a plain function.
+
     :param Asset asset: A valid ggame asset object.
 
     :param list args: A list of required positional or non-positional arguments
@@ -512,6 +722,12 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
     _defaultwidth = 200
     _defaultcolor = Color(0, 1)
     _defaultstyle = LineStyle(1, Color(0, 1))
+    # scale applied to the asset to preview a zoom
+    _zoompreview = 1
+    # True if the asset depends on the view scale other than through the
+    # physical positions, and the view scale when the inputs were saved
+    _scaledependent = False
+    _sscale = None
 
     def __init__(self, asset, *args, **kwargs):
         MathApp.addVisual(self)
@@ -564,6 +780,8 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
         self._spposinputs = self._pi(*self._pposinputs)
         self._snposinputs = self._npi(*[0] * len(self._nposinputs))
         self._sstdinputs = self._si(*[0] * len(self._stdinputs))
+        # the inputs have not been saved yet
+        self._stale = True
 
     def step(self):
         self.touchAsset()
@@ -575,6 +793,7 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
             self._snposinputs,
             self._sstdinputs,
         ) = inputs
+        self._sscale = MathApp.scale
 
     def _getInputs(self):
         self._getPhysicalInputs()
@@ -608,11 +827,14 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
             self._spposinputs != saved[1]
             or self._snposinputs != saved[2]
             or self._sstdinputs != saved[3]
+            or self._scaledependent
+            and self._sscale != MathApp.scale
         )
 
     def destroy(self):
         MathApp.removeVisual(self)
         MathApp.removeMovable(self)
+        MathApp.removeSelectable(self)
         MathApp.removeStrokable(self)
         _MathDynamic.destroy(self)
         Sprite.destroy(self)
@@ -622,7 +844,10 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
             visible = self.gfx.visible
             if MathApp.win is not None:
                 MathApp.win.remove(self.gfx)
-                self.gfx.destroy()
+                if not isinstance(self.asset, TextAsset):
+                    self.gfx.destroy()
+            if isinstance(self.asset, TextAsset):
+                self.asset.release()  # keep the render for reuse
             self.asset = asset
             self.gfx = self.asset.gfx
             self.gfx.visible = visible
@@ -772,6 +997,16 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
         This method is intended to be overridden.
         """
 
+    def _physicalBounds(self):
+        """
+        Override to return the physical screen bounds of the area where
+        :meth:`physicalPointTouching` may return True, as a tuple
+        (xmin, ymin, xmax, ymax), so that mouse events are only tested
+        against nearby objects. The default, None, means the object is
+        tested for every mouse event.
+        """
+        return None
+
     def canStroke(self, ppos):
         """
         Can the object respond to beginning a stroke action at the given
@@ -789,12 +1024,121 @@ class _MathVisual(Sprite, _MathDynamic, metaclass=ABCMeta):
         Check to see if an asset needs to be updated it and if so (or forced)
         call the :func:`_updateAsset` method.
         """
-        inputs = self._getInputs()
+        self._applyInputs(self._getInputs(), force)
+
+    def _applyInputs(self, inputs, force=False):
         changed = self._inputsChanged(inputs)
-        if changed:
+        saved = (self._spposinputs, self._snposinputs, self._sstdinputs)
+        # objects that use this one as an input see its logical inputs: a
+        # sub-pixel move changes them, while a pan or zoom does not (and
+        # updates every visual anyway)
+        logicalchanged = inputs[0] != self._sposinputs or inputs[2] != self._snposinputs
+        if changed or logicalchanged:
             self._saveInputs(inputs)
-        if changed or force:
-            self._updateAsset(self._buildAsset())
+            if logicalchanged:
+                self._notifyChanged()
+        if force or changed:
+            if self._zoompreview != 1:
+                self._zoompreview = 1
+                self.scale = 1
+            if force or not self._updateInPlace(*saved):
+                self._updateAsset(self._buildAsset())
+            MathApp._invalidateBounds(self)  # pylint: disable=protected-access
+
+    def _updateInPlace(self, spposinputs, snposinputs, sstdinputs):
+        """
+        Show a change of inputs without building a new asset, if possible:
+        by moving the existing asset when it has only been translated, or by
+        redrawing it when only its geometry has changed. A change of size,
+        width, color or style always builds a new asset.
+
+        :returns: True if the change has been shown, False otherwise.
+        """
+        if sstdinputs != self._sstdinputs:
+            return False
+        if snposinputs == self._snposinputs and self._canTranslate():
+            pos = self._spposinputs
+            dx = pos[0][0] - spposinputs[0][0]
+            dy = pos[0][1] - spposinputs[0][1]
+            if all(
+                (p[0] - s[0], p[1] - s[1]) == (dx, dy) for p, s in zip(pos, spposinputs)
+            ):
+                self.position = pos[0]
+                return True
+        return self._redrawAsset()
+
+    def _previewZoom(self, ratio):
+        """
+        Show a change of the view scale by `ratio`. A visual that can be
+        scaled is moved and scaled without being redrawn (if the backend can
+        scale its graphics); others are updated immediately.
+        """
+        if not (
+            self._positioning == "logical"
+            and hasattr(self.gfx, "scale")
+            and self._canScale()
+        ):
+            self._viewChanged()
+            return
+        self._zoompreview *= ratio
+        self.scale = self._zoompreview
+        self._getPhysicalInputs()
+        self.position = self._pposinputs[0]
+
+    def _viewChanged(self):
+        """
+        Update the asset after a pan or zoom of the view.
+        """
+        if self._stale or self._polled:
+            self.touchAsset()
+        elif self._positioning == "logical":
+            # the inputs are unchanged since they were saved, so only their
+            # physical positions need to be found again
+            # pylint: disable=attribute-defined-outside-init
+            self._pposinputs = self._pi(
+                *[MathApp.logicalToPhysical(pval) for pval in self._sposinputs]
+            )
+            self._applyInputs(
+                (
+                    self._sposinputs,
+                    self._pposinputs,
+                    self._snposinputs,
+                    self._sstdinputs,
+                )
+            )
+
+    def _endZoomPreview(self):
+        """
+        Redraw a visual that is showing a zoom preview at the current scale.
+        """
+        if self._zoompreview != 1:
+            self._zoompreview = 1
+            self.scale = 1
+            self.touchAsset()
+
+    def _canTranslate(self):
+        """
+        Override to return True if moving the existing asset is enough to
+        show a translation of all positional inputs.
+        """
+        return False
+
+    def _canScale(self):
+        """
+        Override to return True if the asset is drawn to the view scale, so
+        that scaling the existing asset shows a zoom until it is redrawn.
+        """
+        return False
+
+    def _redrawAsset(self):
+        """
+        Override to redraw the existing asset for the current (saved) inputs,
+        when the standard inputs are unchanged.
+
+        :returns: True if the asset was redrawn, False if a new asset must be
+            built.
+        """
+        return False
 
     @abstractmethod
     def _buildAsset(self):
@@ -0,0 +1,290 @@
+# pylint: skip-file
+
+# NULL BACKEND: nothing is drawn, played or printed. Intended for timing and
+# testing game logic without any rendering cost.
+
+import os
+import struct
+
+
+class vector(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __getitem__(self, key):
+        return (self.x, self.y)[key]
+
+
+class _DisplayObject(object):
+    def __init__(self):
+        self.visible = True
+        self.alpha = 1
+        self.rotation = 0.0
+        self.pos = vector(0, 0)
+        self.anch = vector(0, 0)
+        self.scal = vector(1.0, 1.0)
+
+    @property
+    def position(self):
+        return self.pos
+
+    @position.setter
+    def position(self, value):
+        self.pos.x = value[0]
+        self.pos.y = value[1]
+
+    @property
+    def anchor(self):
+        return self.anch
+
+    @anchor.setter
+    def anchor(self, value):
+        self.anch.x = value[0]
+        self.anch.y = value[1]
+
+    @property
+    def scale(self):
+        return self.scal
+
+    @scale.setter
+    def scale(self, value):
+        self.scal.x = value[0]
+        self.scal.y = value[1]
+
+    def destroy(self, *args):
+        pass
+
+
+class GFX_Rectangle(object):
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.width = w
+        self.height = h
+
+
+def _imageSize(path):
+    # Read the pixel size from a PNG, GIF or JPEG header without decoding
+    if not os.path.exists(path):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+    try:
+        with open(path, "rb") as f:
+            head = f.read(26)
+            if head[:8] == b"\x89PNG\r\n\x1a\n":
+                return struct.unpack(">II", head[16:24])
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+            if head[:2] == b"\xff\xd8":
+                f.seek(2)
+                while True:
+                    marker, size = struct.unpack(">HH", f.read(4))
+                    if 0xFFC0 <= marker <= 0xFFCF and marker not in (
+                        0xFFC4,
+                        0xFFC8,
+                        0xFFCC,
+                    ):
+                        h, w = struct.unpack(">xHH", f.read(5))
+                        return w, h
+                    f.seek(size - 2, 1)
+    except (OSError, struct.error):
+        pass
+    return 0, 0
+
+
+class _Texture(object):
+    def __init__(self, img="", crossdomain=False, width=0, height=0):
+        self.name = img
+        if img:
+            width, height = _imageSize(img)
+        self.basewidth = self.width = width
+        self.baseheight = self.height = height
+        self.baserect = GFX_Rectangle(0, 0, width, height)
+        self.framerect = self.baserect
+
+    @classmethod
+    def fromTexture(cls, texture, frame):
+        inst = cls(width=texture.basewidth, height=texture.baseheight)
+        inst.name = texture.name
+        inst.framerect = frame
+        inst.width = frame.width
+        inst.height = frame.height
+        return inst
+
+    def destroy(self, *args):
+        pass
+
+
+GFX_Texture = _Texture.fromTexture
+
+GFX_Texture_fromImage = _Texture
+
+
+class GFX_Sprite(_DisplayObject):
+    def __init__(self, texture):
+        super().__init__()
+        self.texture = texture
+        self.width = texture.width
+        self.height = texture.height
+
+
+class _GFX_Graphics(_DisplayObject):
+    def __init__(self):
+        super().__init__()
+        self.width = 0
+        self.height = 0
+        self._x = self._y = 0
+
+    def clear(self):
+        self.width = self.height = 0
+        self._x = self._y = 0
+
+    def clone(self):
+        clone = type(self)()
+        clone.width = self.width
+        clone.height = self.height
+        return clone
+
+    def lineStyle(self, width, color, alpha):
+        pass
+
+    def beginFill(self, color, alpha):
+        pass
+
+    def drawRect(self, x, y, w, h):
+        self.width = w
+        self.height = h
+        return self
+
+    def drawCircle(self, x, y, radius):
+        self.width = self.height = radius * 2
+        return self
+
+    def drawEllipse(self, x, y, hw, hh):
+        self.width = hw * 2
+        self.height = hh * 2
+        return self
+
+    def drawPolygon(self, jpath):
+        xs = jpath[0::2]
+        ys = jpath[1::2]
+        self.width = max(xs) - min(xs)
+        self.height = max(ys) - min(ys)
+        return self
+
+    def moveTo(self, x, y):
+        self._x = x
+        self._y = y
+        return self
+
+    def lineTo(self, x, y):
+        self.width = abs(x - self._x)
+        self.height = abs(y - self._y)
+        return self
+
+    def generateTexture(self):
+        return _Texture(width=self.width, height=self.height)
+
+
+GFX_Graphics = _GFX_Graphics()
+
+
+class GFX_Text(_DisplayObject):
+    def __init__(self, text, styledict):
+        super().__init__()
+        self.text = text
+        self.styledict = styledict
+        self.width = 0
+        self.height = 0
+
+    def clone(self):
+        return type(self)(self.text, self.styledict)
+
+
+class _SND_all(object):
+    def stop(self):
+        pass
+
+
+class _SND(object):
+    def __init__(self):
+        self.all = _SND_all
+
+
+SND = _SND()
+
+
+class SND_Sound(object):
+    def __init__(self, url):
+        self.url = url
+        self.volume = 100
+
+    def load(self):
+        pass
+
+    def play(self):
+        pass
+
+    def loop(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def getVolume(self):
+        return self.volume
+
+    def setVolume(self, vol):
+        self.volume = vol
+
+
+class _ClientRect(object):
+    left = 0
+    top = 0
+    width = 1
+    height = 1
+
+
+class _View(object):
+    def getBoundingClientRect(self):
+        return _ClientRect()
+
+
+class _Renderer(object):
+    def __init__(self):
+        self.view = _View()
+
+
+class GFX_Window(object):
+    frames = 10
+    """Number of frames animated by a call to `animate` before it returns."""
+
+    def __init__(self, width, height, onclose):
+        self.width = width if width > 0 else 100
+        self.height = height if height > 0 else 100
+        self.renderer = _Renderer()
+        self.onclose = onclose
+        self._events = {}
+        self._stage = []
+        self._frame = 0
+
+    def bind(self, evtspec, callback):
+        self._events[evtspec] = callback
+
+    def unbind(self, evtspec):
+        self._events.pop(evtspec, None)
+
+    def add(self, obj):
+        self._stage.append(obj)
+
+    def remove(self, obj):
+        self._stage.remove(obj)
+
+    def animate(self, stepcallback):
+        if self._frame < self.frames:
+            self._frame += 1
+            stepcallback("dummy")
+
+    def destroy(self):
+        self._stage = []
+        self._events = {}
@@ -0,0 +1,270 @@
+"""
+Function plot objects for MathApp applications
+"""
+
+from bisect import bisect_left, bisect_right
+from math import ceil, floor, isfinite, isnan
+from ggame.mathapp import MathApp, _MathVisual, _numpy
+from ggame.asset import PolylineAsset
+
+_NAN = float("nan")
+
+
+class FunctionPlot(_MathVisual):
+    """
+    Create a plot of a function, y = f(x), on the screen. This is a subclass
+    of :class:`~ggame.sprite.Sprite` and
+    :class:`~ggame.mathapp._MathVisual` but most of the inherited members are
+    of little use and are not shown in the documentation.
+
+    The function is sampled across the visible part of the x axis (and a
+    margin on either side), more densely where its curvature is high, and
+    the samples are drawn as a single
+    :class:`~ggame.asset.PolylineAsset`. If the function accepts a NumPy
+    array of x values (and NumPy is installed) it is called once for many
+    samples; otherwise it is called for each sample. Samples are kept until
+    the view is zoomed or the parameter changes, so panning the view only
+    samples the function on the newly exposed part of the x axis.
+
+    Values that the function cannot compute (raising a `TypeError`,
+    `ValueError` or `ArithmeticError`, or returning NaN or infinity) are
+    left out of the plot, as are vertical jumps larger than the window.
+
+    :param function func: The function to plot. It is called with an x value
+        (or array of x values), followed by the value of the **params**
+        input, if one is given.
+
+    :param \\**kwargs:
+        See below
+
+    :Optional Keyword Arguments:
+        * **params** Parameter passed to the function, which may be a
+            literal value, or a reference to any object or function that
+            returns or evaluates to a value (e.g. a
+            :class:`~ggame.slider.Slider`). The plot is redrawn when its
+            value changes.
+        * **xmin** (*float*) Smallest x value to plot (logical units)
+        * **xmax** (*float*) Largest x value to plot (logical units)
+        * **tolerance** (*float*) Largest distance (in pixels) between the
+            plot and the function between samples. The default is 0.5.
+        * **style** (*LineStyle*) Valid :class:`~ggame.asset.LineStyle` object
+
+    Example:
+
+    .. literalinclude:: ../examples/plotfunctionplot.py
+
+    """
+
+    # the plot is drawn relative to the logical origin
+    _posinputsdef = ["pos"]
+    _nonposinputsdef = ["params"]
+    _scaledependent = True
+    # spacing of the initial samples, in pixels, and the number of times an
+    # interval between samples may be halved to follow the function
+    _SAMPLESPACING = 8
+    _MAXDEPTH = 5
+
+    def __init__(self, func, **kwargs):
+        self._func = func
+        self._domain = (kwargs.get("xmin"), kwargs.get("xmax"))
+        self._tolerance = kwargs.get("tolerance", 0.5)
+        # None until the function has been tried with an array
+        self._vectorized = None
+        # sorted sample lists, the x range they cover and the (scale,
+        # params) they were found for
+        self._xs = []
+        self._ys = []
+        self._covered = None
+        self._samplekey = None
+        kwargs.pop("positioning", None)
+        super().__init__(
+            PolylineAsset([], self._defaultstyle),
+            (0, 0),
+            kwargs.get("params"),
+            **kwargs,
+        )
+        self.touchAsset()
+
+    def _sampleRange(self, margin):
+        """
+        The visible range of x, widened by `margin` window widths on either
+        side and limited to the domain, or None if it is empty.
+        """
+        view = MathApp._currentView()  # pylint: disable=protected-access
+        if view[5] is None:
+            return None
+        scale, xcenter, _ycenter, halfwidth, _halfheight, _win = view
+        halfspan = halfwidth / scale * (1 + 2 * margin)
+        xmin, xmax = self._domain
+        lo = xcenter - halfspan if xmin is None else max(xmin, xcenter - halfspan)
+        hi = xcenter + halfspan if xmax is None else min(xmax, xcenter + halfspan)
+        return (lo, hi) if lo <= hi else None
+
+    def _evaluate(self, xs):
+        """
+        Evaluate the function at each of `xs`, returning a list of floats
+        (NaN where there is no finite value).
+        """
+        params = self._snposinputs.params  # pylint: disable=no-member
+        args = () if params is None else (params,)
+        np = _numpy()
+        if np is not None and self._vectorized is not False:
+            try:
+                with np.errstate(all="ignore"):
+                    ys = np.asarray(self._func(np.asarray(xs), *args), dtype=float)
+                    ys = np.where(np.isfinite(ys), ys, _NAN) + np.zeros(len(xs))
+                self._vectorized = True
+                return ys.tolist()
+            except (TypeError, ValueError, ArithmeticError):
+                self._vectorized = False
+        ys = []
+        for x in xs:
+            try:
+                y = float(self._func(x, *args))
+            except (TypeError, ValueError, ArithmeticError):
+                y = _NAN
+            ys.append(y if isfinite(y) else _NAN)
+        return ys
+
+    def _grid(self, lo, hi):
+        """
+        Initial sample points covering [lo, hi]. Points are multiples of the
+        sample spacing, so that grids for neighbouring ranges line up.
+        """
+        spacing = self._SAMPLESPACING / MathApp.scale
+        xs = [k * spacing for k in range(floor(lo / spacing), ceil(hi / spacing) + 1)]
+        xmin, xmax = self._domain
+        if xmin is not None and xs[0] < xmin:
+            xs = [xmin] + [x for x in xs if x > xmin]
+        if xmax is not None and xs[-1] > xmax:
+            xs = [x for x in xs if x < xmax] + [xmax]
+        return xs
+
+    def _sample(self, lo, hi):
+        """
+        Sample the function adaptively over [lo, hi], returning the lists
+        of x and y values.
+        """
+        xs = self._grid(lo, hi)
+        ys = self._evaluate(xs)
+        tolerance = self._tolerance / MathApp.scale
+        # indices of the intervals that may need more samples
+        pending = list(range(len(xs) - 1))
+        for _depth in range(self._MAXDEPTH):
+            if not pending:
+                break
+            mids = [(xs[i] + xs[i + 1]) / 2 for i in pending]
+            split = {}
+            for i, xmid, ymid in zip(pending, mids, self._evaluate(mids)):
+                y0, y1 = ys[i], ys[i + 1]
+                nans = isnan(y0) + isnan(ymid) + isnan(y1)
+                if nans != 3 and (nans or not abs(ymid - (y0 + y1) / 2) <= tolerance):
+                    split[i] = (xmid, ymid)
+            newxs, newys, pending = [], [], []
+            for i, x in enumerate(xs):
+                newxs.append(x)
+                newys.append(ys[i])
+                if i in split:
+                    pending.extend((len(newxs) - 1, len(newxs)))
+                    newxs.append(split[i][0])
+                    newys.append(split[i][1])
+            xs, ys = newxs, newys
+        # intervals that are still not resolved, with a jump of more than a
+        # window height, are discontinuities
+        jump = MathApp.height / MathApp.scale
+        for i in reversed(pending):
+            if abs(ys[i + 1] - ys[i]) > jump:
+                xs.insert(i + 1, (xs[i] + xs[i + 1]) / 2)
+                ys.insert(i + 1, _NAN)
+        return xs, ys
+
+    def _samplesCover(self):
+        span = self._sampleRange(0)
+        return (
+            self._samplekey == (MathApp.scale, self._snposinputs.params)
+            and self._covered is not None
+            and span is not None
+            and self._covered[0] <= span[0]
+            and span[1] <= self._covered[1]
+        )
+
+    def _updateSamples(self):
+        """
+        Sample the function over the visible range and a margin of half a
+        window on either side, re-using the existing samples if possible.
+        """
+        span = self._sampleRange(0.5)
+        key = (MathApp.scale, self._snposinputs.params)
+        if span is None:
+            self._xs, self._ys, self._covered = [], [], None
+            return
+        lo, hi = span
+        covered = self._covered
+        if (
+            key != self._samplekey
+            or covered is None
+            or hi < covered[0]
+            or lo > covered[1]
+        ):
+            self._xs, self._ys = self._sample(lo, hi)
+        else:
+            # extend the samples at either end
+            if lo < covered[0]:
+                xs, ys = self._sample(lo, covered[0])
+                end = bisect_left(xs, covered[0])
+                self._xs[:0] = xs[:end]
+                self._ys[:0] = ys[:end]
+            if hi > covered[1]:
+                xs, ys = self._sample(covered[1], hi)
+                start = bisect_right(xs, covered[1])
+                self._xs.extend(xs[start:])
+                self._ys.extend(ys[start:])
+            # forget samples more than a window beyond the visible range
+            far = self._sampleRange(1)
+            if far is not None:
+                self._trim(*far)
+        self._samplekey = key
+        self._covered = (self._xs[0], self._xs[-1])
+
+    def _trim(self, lo, hi):
+        # cut only at grid points, so the samples can be extended later
+        spacing = self._SAMPLESPACING / MathApp.scale
+        start = bisect_left(self._xs, floor(lo / spacing) * spacing)
+        stop = bisect_right(self._xs, ceil(hi / spacing) * spacing)
+        if start > 0 or stop < len(self._xs):
+            del self._xs[stop:]
+            del self._xs[:start]
+            del self._ys[stop:]
+            del self._ys[:start]
+
+    def _path(self):
+        scale = MathApp.scale
+        return [(x * scale, -y * scale) for x, y in zip(self._xs, self._ys)]
+
+    def _buildAsset(self):
+        self._updateSamples()
+        return PolylineAsset(self._path(), self._stdinputs.style())
+
+    def _canTranslate(self):
+        return self._samplesCover()
+
+    def _canScale(self):
+        return True
+
+    def _redrawAsset(self):
+        self._updateSamples()
+        self.asset.path = self._path()
+        self.asset.redraw()
+        self.position = self._spposinputs.pos  # pylint: disable=no-member
+        return True
+
+    def physicalPointTouching(self, ppos):
+        """
+        This method always returns False.
+        """
+        return False
+
+    def translate(self, pdisp):
+        """
+        This method is not implemented.
+        """
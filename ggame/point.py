@@ -16,6 +16,7 @@ class _Point(_MathVisual, metaclass=ABCMeta):
 
     _posinputsdef = ["pos"]
     _nonposinputsdef = []
+    _reportschanges = True
 
     def __init__(self, asset, *args, **kwargs):
         super().__init__(asset, *args, **kwargs)
@@ -44,6 +45,11 @@ class _Point(_MathVisual, metaclass=ABCMeta):
             < self._sstdinputs.size
         )
 
+    def _physicalBounds(self):
+        x, y = self._pposinputs.pos  # pylint: disable=no-member
+        size = self._sstdinputs.size
+        return (x - size, y - size, x + size, y + size)
+
     def translate(self, pdisp):
         """
         Perform necessary processing in response to being moved by the mouse/UI.
@@ -54,6 +60,7 @@ class _Point(_MathVisual, metaclass=ABCMeta):
         """
         ldisp = MathApp.translatePhysicalToLogical(pdisp)
         pos = self._posinputs.pos()
+        self._unlink(self._posinputs.pos)
         self._posinputs = self._posinputs._replace(
             pos=self.eval((pos[0] + ldisp[0], pos[1] + ldisp[1]))
         )
@@ -116,6 +123,9 @@ class Point(_Point):
             self._stdinputs.size(), self._stdinputs.style(), self._stdinputs.color()
         )
 
+    def _canTranslate(self):
+        return True
+
 
 class ImagePoint(_Point):
     """
@@ -164,3 +174,7 @@ class ImagePoint(_Point):
         self.setExtents()  # ensure xmin, xmax are correct
         x, y = ppos
         return self.xmax >= x >= self.xmin and self.ymax >= y >= self.ymin
+
+    def _physicalBounds(self):
+        self.setExtents()
+        return (self.xmin, self.ymin, self.xmax, self.ymax)
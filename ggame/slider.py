@@ -51,6 +51,7 @@ class Slider(_MathVisual):
 
     _posinputsdef = ["pos"]
     _nonposinputsdef = ["minval", "maxval", "initial"]
+    _reportschanges = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(RectangleAsset(1, 1), *args, **kwargs)
@@ -127,6 +128,7 @@ class Slider(_MathVisual):
     def _setval(self, val):
         minval = self._nposinputs.minval()  # pylint: disable=no-member
         maxval = self._nposinputs.maxval()  # pylint: disable=no-member
+        oldval = self._val
         if val <= minval:
             self._val = minval
         elif val >= maxval:
@@ -137,6 +139,8 @@ class Slider(_MathVisual):
                 + minval
             )
         self._setThumb()
+        if self._val != oldval:
+            self._notifyChanged()
 
     def increment(self, step):
         """
@@ -181,8 +185,11 @@ class Slider(_MathVisual):
         self.increment(self._step)
 
     def _moveCenter(self, _event):
+        oldval = self._val
         self._val = (self._snposinputs.minval + self._snposinputs.maxval) / 2
         self._setThumb()
+        if self._val != oldval:
+            self._notifyChanged()
 
     def canstroke(self, ppos):
         """
@@ -223,6 +230,11 @@ class Slider(_MathVisual):
             and ppos[1] <= _ppos[1] + self._sstdinputs.size
         )
 
+    def _physicalBounds(self):
+        # the thumb may extend two pixels past the right end
+        x, y = self._spposinputs.pos
+        return (x, y, x + self._sstdinputs.width + 2, y + self._sstdinputs.size)
+
     def physicalPointTouchingThumb(self, ppos):
         """
         Determine if a physical screen location is touching the slider "thumb".
@@ -0,0 +1,151 @@
+"""
+The spatial module provides a uniform grid index of objects' screen bounds,
+used by :class:`~ggame.mathapp.MathApp` to find the objects that may be under
+the mouse without testing every one of them.
+"""
+
+from math import floor
+
+
+class SpatialGrid:
+    """
+    A uniform grid of rectangular bounds, for quickly finding the objects
+    whose bounds contain a point.
+
+    Bounds are not read when an object is added: they are computed (with
+    `boundsfunc`) the next time the grid is queried after the object is
+    added or invalidated. Objects are returned in the order they were added.
+
+    :param function boundsfunc: Function that accepts an object and returns
+        its bounds as a tuple `(xmin, ymin, xmax, ymax)`, or None if the
+        object has no known bounds (it is then returned by every query).
+    :param int cellsize: Width and height of each grid cell.
+    """
+
+    # objects whose bounds span more cells than this are kept with the
+    # unbounded objects rather than filling the grid
+    _MAXCELLS = 256
+
+    def __init__(self, boundsfunc, cellsize=64):
+        self.boundsfunc = boundsfunc
+        self.cellsize = cellsize
+        self._cells = {}  # (column, row) -> set of objects
+        self._items = {}  # object -> [order, bounds, cells]
+        self._unbounded = set()
+        self._dirty = set()
+        self._order = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, obj):
+        return obj in self._items
+
+    def add(self, obj):
+        """
+        Add an object to the grid. Adding an object that is already in the
+        grid has no effect.
+
+        :param object obj: The object to add.
+        :returns: None
+        """
+        if obj not in self._items:
+            self._order += 1
+            self._items[obj] = [self._order, None, ()]
+            self._dirty.add(obj)
+
+    def remove(self, obj):
+        """
+        Remove an object from the grid, if present.
+
+        :param object obj: The object to remove.
+        :returns: None
+        """
+        item = self._items.pop(obj, None)
+        if item is not None:
+            self._unbin(obj, item)
+            self._dirty.discard(obj)
+
+    def invalidate(self, obj=None):
+        """
+        Mark the bounds of an object (or of every object) as out of date,
+        so they are computed again before the next query.
+
+        :param object obj: The object whose bounds have changed, or None if
+            all bounds have changed.
+        :returns: None
+        """
+        if obj is None:
+            self._dirty.update(self._items)
+        elif obj in self._items:
+            self._dirty.add(obj)
+
+    def clear(self):
+        """
+        Remove all objects from the grid.
+
+        :returns: None
+        """
+        self._cells.clear()
+        self._items.clear()
+        self._unbounded.clear()
+        self._dirty.clear()
+
+    def query(self, pos):
+        """
+        Find the objects whose bounds contain a point.
+
+        :param tuple(float,float) pos: The point (x, y).
+        :rtype: list
+        :returns: The objects whose bounds contain `pos` (or which have no
+            bounds), in the order they were added.
+        """
+        if self._dirty:
+            self._refresh()
+        x, y = pos
+        cell = self._cells.get((floor(x / self.cellsize), floor(y / self.cellsize)), ())
+        items = self._items
+        found = [
+            obj
+            for obj in cell
+            if items[obj][1][0] <= x <= items[obj][1][2]
+            and items[obj][1][1] <= y <= items[obj][1][3]
+        ]
+        found.extend(self._unbounded)
+        if len(found) > 1:
+            found.sort(key=lambda obj: items[obj][0])
+        return found
+
+    def _refresh(self):
+        for obj in self._dirty:
+            item = self._items[obj]
+            self._unbin(obj, item)
+            bounds = self.boundsfunc(obj)
+            item[1] = bounds
+            size = self.cellsize
+            if bounds is None or not (
+                (bounds[2] - bounds[0] + size) * (bounds[3] - bounds[1] + size)
+                <= self._MAXCELLS * size * size
+            ):
+                self._unbounded.add(obj)
+                continue
+            cells = tuple(
+                (column, row)
+                for column in range(
+                    floor(bounds[0] / size), floor(bounds[2] / size) + 1
+                )
+                for row in range(floor(bounds[1] / size), floor(bounds[3] / size) + 1)
+            )
+            item[2] = cells
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(obj)
+        self._dirty.clear()
+
+    def _unbin(self, obj, item):
+        self._unbounded.discard(obj)
+        for cell in item[2]:
+            members = self._cells[cell]
+            members.discard(obj)
+            if not members:
+                del self._cells[cell]
+        item[2] = ()
@@ -12,6 +12,7 @@ from ggame.asset import (
     EllipseAsset,
     TextAsset,
     LineAsset,
+    PolylineAsset,
 )
 from ggame.app import App
 
@@ -72,7 +73,15 @@ class Sprite(object):  # pylint: disable=too-many-public-methods
                 self.gfx = None
                 raise
         elif isinstance(
-            asset, (RectangleAsset, CircleAsset, EllipseAsset, PolygonAsset, LineAsset)
+            asset,
+            (
+                RectangleAsset,
+                CircleAsset,
+                EllipseAsset,
+                PolygonAsset,
+                LineAsset,
+                PolylineAsset,
+            ),
         ):
             self.asset = asset
             self.gfx = GFX_Sprite(asset.gfx.generateTexture())
@@ -81,7 +90,7 @@ class Sprite(object):  # pylint: disable=too-many-public-methods
             self.gfx = self.asset.gfx  # gfx is PIXI Text (from Sprite)
             self.gfx.visible = True
         if not edgedef:
-            self.edgedef = asset
+            self.edgedef = self.asset
         else:
             self.edgedef = edgedef
         self.xmin = self.xmax = self.ymin = self.ymax = 0
@@ -121,6 +130,20 @@ class Sprite(object):  # pylint: disable=too-many-public-methods
             xpoints = [x - xmin for x in xpoints]
             ypoints = [y - ymin for y in ypoints]
             self._basevertices = list(zip(xpoints, ypoints))
+        elif assettype is PolylineAsset:
+            # the bounding box of the drawn points
+            points = [
+                (x, y)
+                for x, y in self.edgedef.path
+                if not (math.isnan(x) or math.isnan(y))
+            ]
+            if points:
+                xpoints, ypoints = zip(*points)
+                w = max(xpoints) - min(xpoints)
+                h = max(ypoints) - min(ypoints)
+                self._basevertices = [(0, 0), (0, h), (w, h), (w, 0)]
+            else:
+                self._basevertices = [(0, 0)]
         elif assettype is EllipseAsset:
             w = self.edgedef.halfw * 2
             h = self.edgedef.halfh * 2
@@ -576,6 +599,9 @@ class Sprite(object):  # pylint: disable=too-many-public-methods
         """
         try:
             App.remove(self)
-            self.gfx.destroy()
+            if isinstance(self.asset, TextAsset):
+                self.asset.release()  # a private copy: keep the render for reuse
+            else:
+                self.gfx.destroy()
         except ValueError:
             pass
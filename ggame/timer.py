@@ -1,17 +1,246 @@
 """
 MathApp class for creating periodic and timed callbacks.
+
+The callbacks of all timers are kept in a single hierarchical timing wheel,
+which is stepped once per frame. Its cost depends on the number of callbacks
+that fall due, not on the number of timers.
 """
 
+from itertools import count
+from math import floor
 from ggame.mathapp import MathApp, _MathDynamic
 
 
+class TimerHandle:
+    """
+    A callback scheduled by a :class:`Timer`. Handles are returned by
+    :func:`~ggame.timer.Timer.callAfter`, :func:`~ggame.timer.Timer.callAt`
+    and :func:`~ggame.timer.Timer.callEvery`, and are not created directly.
+    """
+
+    __slots__ = ("time", "period", "callback", "_cancelled", "_timer", "_seq")
+
+    def __init__(self, timer, calltime, period, callback):
+        #: The timer time (in seconds) of the next call
+        self.time = calltime
+        #: The period (in seconds) of a periodic callback, or None
+        self.period = period
+        #: The callback function
+        self.callback = callback
+        self._cancelled = False
+        self._timer = timer
+        # the sequence number of the handle's current entry in the wheel
+        self._seq = None
+
+    def cancel(self):
+        """
+        Cancel the callback, so that it is not called again. Cancelling a
+        callback that has already been cancelled, or a single callback that
+        has already been called, does nothing.
+
+        :returns: None
+        """
+        if not self._cancelled:
+            self._cancelled = True
+            self._timer._handles.discard(self)  # pylint: disable=protected-access
+
+    @property
+    def cancelled(self):
+        """
+        True if the callback has been cancelled.
+        """
+        return self._cancelled
+
+
+class _TimerWheel(_MathDynamic):
+    """
+    Hierarchical timing wheel holding the callbacks of all timers, as
+    entries (deadline, sequence, handle). Deadlines are in MathApp time and
+    are bucketed in ticks of a millisecond: level 0 of the wheel has a slot
+    for each tick of the current block of 256 ticks, level 1 a slot for each
+    block of 256 ticks in the current block of 256*256 ticks, and so on. When
+    the wheel reaches the start of a block, the entries of the block's slot
+    move down to the level below. Entries too far ahead for the top level
+    wait in an overflow list.
+
+    An entry is stale, and is dropped when reached, if its handle has been
+    cancelled or rescheduled (given a new sequence number).
+    """
+
+    _TICKS = 1000  # ticks per second
+    _BITS = 8
+    _MASK = (1 << _BITS) - 1
+    _LEVELS = 3
+
+    def __init__(self):
+        super().__init__()
+        self._sequence = count()
+        # the dynamic object list of the app the wheel is stepped by
+        self._dynamics = None
+        self._slots = self._counts = self._overflow = self._ready = None
+        self._tick = 0
+        self._restart(0)
+
+    def _restart(self, tick):
+        """
+        Empty the wheel, setting its current tick.
+        """
+        self._slots = [[[] for _ in range(self._MASK + 1)] for _ in range(self._LEVELS)]
+        self._counts = [0] * self._LEVELS
+        self._overflow = []
+        # entries whose tick has been reached
+        self._ready = []
+        self._tick = tick
+
+    def _entries(self):
+        entries = self._overflow + self._ready
+        for level in self._slots:
+            for slot in level:
+                entries.extend(slot)
+        return entries
+
+    def attach(self):
+        """
+        Make sure the wheel is stepped by the current app. The callbacks of
+        an app that has been destroyed are discarded.
+        """
+        # pylint: disable-next=protected-access
+        dynamics = MathApp._mathDynamicList
+        if self._dynamics is not dynamics:
+            if self._dynamics is not None:
+                for _deadline, _seq, handle in self._entries():
+                    handle.cancel()
+            self._dynamics = dynamics
+            self._restart(floor(MathApp.time * self._TICKS))
+            MathApp.addDynamic(self)
+
+    def schedule(self, handle, deadline):
+        """
+        Add an entry calling `handle` at `deadline` (MathApp time),
+        replacing any entry it already has.
+        """
+        self.attach()
+        handle._seq = seq = next(self._sequence)  # pylint: disable=protected-access
+        self._place((deadline, seq, handle))
+
+    def _place(self, entry):
+        due = floor(entry[0] * self._TICKS)
+        tick = self._tick
+        if due <= tick:
+            self._ready.append(entry)
+            return
+        # the level is that of the highest block digit due and tick differ in
+        level = ((due ^ tick).bit_length() - 1) // self._BITS
+        if level < self._LEVELS:
+            shift = self._BITS * level
+            self._slots[level][(due >> shift) & self._MASK].append(entry)
+            self._counts[level] += 1
+        else:
+            self._overflow.append(entry)
+
+    def _cascade(self):
+        """
+        Move the entries of the slots whose blocks start at the current tick
+        down to the levels below.
+        """
+        tick = self._tick
+        # the highest level whose block starts here moves down first
+        top = 1
+        while top < self._LEVELS and not (tick >> (self._BITS * top)) & self._MASK:
+            top += 1
+        moving = []
+        if top == self._LEVELS:
+            moving, self._overflow = self._overflow, []
+            top -= 1
+        for level in range(top, 0, -1):
+            index = (tick >> (self._BITS * level)) & self._MASK
+            slot = self._slots[level][index]
+            if slot:
+                self._slots[level][index] = []
+                self._counts[level] -= len(slot)
+                moving.extend(slot)
+            for entry in moving:
+                self._place(entry)
+            moving = []
+
+    def _expire(self, start, stop):
+        """
+        Collect the entries of level 0 slots `start` to `stop` (inclusive).
+        """
+        slots = self._slots[0]
+        for index in range(start, stop + 1):
+            slot = slots[index]
+            if slot:
+                slots[index] = []
+                self._counts[0] -= len(slot)
+                self._ready.extend(slot)
+
+    def _advance(self, target):
+        """
+        Advance the wheel to tick `target`, skipping blocks of ticks in which
+        no entries can fall due.
+        """
+        if target < self._tick:
+            # the app clock has gone back: start again from the new time
+            entries = self._entries()
+            self._restart(target)
+            for entry in entries:
+                self._place(entry)
+            return
+        while self._tick < target:
+            level = 0
+            while level < self._LEVELS and not self._counts[level]:
+                level += 1
+            # the last tick before the next block of this level starts
+            shift = self._BITS * max(level, 1)
+            last = (((self._tick >> shift) + 1) << shift) - 1
+            if not level:
+                self._expire(
+                    (self._tick + 1) & self._MASK, min(target, last) & self._MASK
+                )
+            elif level == self._LEVELS and not self._overflow:
+                last = target
+            if last >= target:
+                self._tick = target
+                return
+            self._tick = last + 1
+            self._cascade()
+            self._expire(0, 0)
+
+    def step(self):
+        now = MathApp.time
+        self._advance(floor(now * self._TICKS))
+        if not self._ready:
+            return
+        due, waiting = [], []
+        for entry in self._ready:
+            _deadline, seq, handle = entry
+            # pylint: disable-next=protected-access
+            if handle._seq == seq and not handle._cancelled:
+                (due if entry[0] <= now else waiting).append(entry)
+        self._ready = waiting
+        # callbacks due in the same step are called together, in order
+        due.sort()
+        for _deadline, _seq, handle in due:
+            handle._timer._fired(handle)  # pylint: disable=protected-access
+        for _deadline, _seq, handle in due:
+            # a callback may cancel another that is due in the same step
+            if not handle._cancelled:  # pylint: disable=protected-access
+                handle.callback(handle._timer)  # pylint: disable=protected-access
+
+
+_WHEEL = _TimerWheel()
+
+
 class Timer(_MathDynamic):
     """
     The Timer class instantiates an object whose basic function is to report
     the number of seconds since its creation by calling the object as a
     function with an empty argument list.
 
-    The Timer class accepts no arguments during creation.
+    The Timer class accepts no arguments during creation. Timers are cheap:
+    the callbacks of all timers are scheduled together, and a timer is only
+    stepped by the app if other objects use it as an input.
 
     Example of use:
 
@@ -19,13 +248,30 @@ class Timer(_MathDynamic):
 
     """
 
+    _reportschanges = True
+
     def __init__(self):
         super().__init__()
-        self._once = []
-        self._callbacks = {}
+        # handles of the callbacks that have not finished
+        self._handles = set()
+        self._sinklist = ()
         self._time = 0
         self.reset()
-        MathApp.addDynamic(self)  # always dynamically defined
+        _WHEEL.attach()
+
+    # the timer is only stepped (to report changes of its time) while it
+    # has sinks
+    @property
+    def _sinks(self):
+        return self._sinklist
+
+    @_sinks.setter
+    def _sinks(self, sinks):
+        self._sinklist = sinks
+        if sinks:
+            MathApp.addDynamic(self)
+        else:
+            MathApp.removeDynamic(self)
 
     def reset(self):
         """
@@ -35,6 +281,8 @@ class Timer(_MathDynamic):
         :returns: None
         """
         self._reset = MathApp.time
+        for handle in self._handles:
+            _WHEEL.schedule(handle, self._reset + handle.time)
 
     @property
     def time(self):
@@ -42,31 +290,46 @@ class Timer(_MathDynamic):
         Attribute is always updated with the number of seconds since the
         timer was created.
         """
-        return self._time
+        return MathApp.time - self._reset
 
     @time.setter
     def time(self, value):
         pass
 
     def step(self):
-        nexttimers = []
-        calllist = []
-        self._time = MathApp.time - self._reset
-        while self._once and self._once[0][0] <= MathApp.time:
-            tickinfo = self._once.pop(0)
-            if tickinfo[1]:  # periodic?
-                nexttimers.append(
-                    (tickinfo[1], self._callbacks[tickinfo][0])
-                )  # delay, callback
-            calllist.append(
-                self._callbacks[tickinfo].pop(0)
-            )  # remove callback and queue it
-            if not self._callbacks[tickinfo]:  # if the callback list is empty
-                del self._callbacks[tickinfo]  # remove the dictionary entry altogether
-        for tickadd in nexttimers:
-            self.callAfter(tickadd[0], tickadd[1], True)  # keep it going
-        for call in calllist:
-            call(self)
+        now = self.time
+        if now != self._time:
+            self._time = now
+            self._notifyChanged()
+
+    def destroy(self):
+        """
+        Stop the timer, cancelling all of its callbacks.
+
+        :returns: None
+        """
+        for handle in list(self._handles):
+            handle.cancel()
+        super().destroy()
+
+    def _schedule(self, handle):
+        self._handles.add(handle)
+        _WHEEL.schedule(handle, self._reset + handle.time)
+        return handle
+
+    def _fired(self, handle):
+        """
+        Reschedule a handle that is about to be called, or forget it if it
+        is not periodic.
+        """
+        if handle.period:
+            # the next call is a whole number of periods after this one,
+            # skipping any periods that have already passed
+            missed = floor((self.time - handle.time) / handle.period)
+            handle.time += handle.period * (missed + 1)
+            _WHEEL.schedule(handle, self._reset + handle.time)
+        else:
+            self._handles.discard(handle)
 
     def callAfter(self, delay, callback, periodic=False):
         """
@@ -80,14 +343,11 @@ class Timer(_MathDynamic):
             expiration
         :param boolean periodic: Set True if the callback function should
             be executed periodically
-        :returns: None
+        :rtype: TimerHandle
+        :returns: A handle that may be used to cancel the callback
         """
-        key = (self._time + delay, delay if periodic else 0)
-        self._once.append(key)
-        callbacklist = self._callbacks.get(key, [])
-        callbacklist.append(callback)
-        self._callbacks[key] = callbacklist
-        self._once.sort()
+        period = delay if periodic else None
+        return self._schedule(TimerHandle(self, self.time + delay, period, callback))
 
     def callAt(self, calltime, callback):
         """
@@ -98,23 +358,27 @@ class Timer(_MathDynamic):
         :param float time: The time to wait since timer creation or reset
             before calling the callback function.
         :param function callback: The callback function to call
-        :returns: None
+        :rtype: TimerHandle
+        :returns: A handle that may be used to cancel the callback
         """
-        self.callAfter(calltime - self._time, callback)
+        return self._schedule(TimerHandle(self, calltime, None, callback))
 
     def callEvery(self, period, callback):
         """
         Set a callback to occur periodically. The callback
         function should accept a single parameter which will be a reference
-        to the timer object that called it.
+        to the timer object that called it. Calls follow a fixed schedule,
+        once every period from the first, so they do not drift later if the
+        app is slow to step; periods that are missed altogether are skipped.
 
         :param float period: The number of seconds to wait before each
             execution of the callback function
         :param function callback: The callback function to call on timer
             expiration
-        :returns: None
+        :rtype: TimerHandle
+        :returns: A handle that may be used to cancel the callback
         """
-        self.callAfter(period, callback, True)
+        return self.callAfter(period, callback, True)
 
     def __call__(self):
-        return self._time
+        return self.time
@@ -0,0 +1,171 @@
+"""
+Trail objects for MathApp applications
+"""
+
+from ggame.mathapp import MathApp, _MathVisual, _numpy
+from ggame.asset import PolylineAsset, Color, LineStyle
+
+
+class Trail(_MathVisual):
+    """
+    Create a trail that follows a moving point (e.g. a
+    :class:`~ggame.astro.Rocket`) on the screen. This is a subclass of
+    :class:`~ggame.sprite.Sprite` and
+    :class:`~ggame.mathapp._MathVisual` but most of the inherited members are
+    of little use and are not shown in the documentation.
+
+    The most recent positions of the point are kept in a buffer of fixed
+    capacity (a NumPy array, if NumPy is installed), so the memory used by
+    the trail does not grow however long the point moves. A position is
+    only added when the point has moved by more than a few pixels at the
+    current view scale, and the trail is drawn as a single
+    :class:`~ggame.asset.PolylineAsset`.
+
+    :param \\*args:
+        See below
+    :param \\**kwargs:
+        See below
+
+    :Required Arguments:
+        * **source** (*tuple(float,float)*) The point to follow: a reference
+            to any object (e.g. a :class:`~ggame.point.Point`) or function
+            that returns or evaluates to a tuple of floats.
+
+    :Optional Keyword Arguments:
+        * **capacity** (*int*) Number of positions kept in the trail. The
+            default is 1000.
+        * **threshold** (*float*) Distance (in pixels) the point must move
+            before a position is added. The default is 2.
+        * **style** (*LineStyle*) Valid :class:`~ggame.asset.LineStyle` object
+
+    Example::
+
+        from ggame.point import Point
+        from ggame.trail import Trail
+        from ggame.mathapp import MathApp
+
+        p1 = Point((0,0))
+        p1.movable = True
+        t = Trail(p1)
+
+        MathApp().run()
+    """
+
+    # the trail is drawn relative to the logical origin
+    _posinputsdef = ["pos"]
+    _defaultstyle = LineStyle(1, Color(0x808080, 1))
+    _scaledependent = True
+
+    def __init__(self, source, **kwargs):
+        self._capacity = kwargs.get("capacity", 1000)
+        self._threshold = kwargs.get("threshold", 2)
+        # ring buffer of logical positions: the next slot to fill, the
+        # number of positions held and the last position added
+        np = _numpy()
+        if np is not None:
+            self._buffer = np.empty((self._capacity, 2))
+        else:
+            self._buffer = [None] * self._capacity
+        self._next = 0
+        self._count = 0
+        self._last = None
+        # positions added to the drawn path since it was last drawn in full;
+        # old positions are left in the path until this reaches the slack
+        self._added = 0
+        self._slack = max(1, self._capacity // 8)
+        # the view scale the path was drawn at
+        self._drawnscale = None
+        kwargs.pop("positioning", None)
+        super().__init__(PolylineAsset([], self._defaultstyle), (0, 0), **kwargs)
+        self._source = self.eval(source)
+        self.touchAsset()
+
+    def clear(self):
+        """
+        Remove all positions from the trail.
+
+        :returns: None
+        """
+        self._next = self._count = 0
+        self._last = None
+        self.touchAsset(True)
+
+    def positions(self):
+        """
+        Return the logical positions in the trail, oldest first.
+
+        :rtype: list[tuple(float,float)]
+        """
+        positions = self._ordered()
+        if hasattr(positions, "tolist"):
+            positions = positions.tolist()
+        return [tuple(pos) for pos in positions]
+
+    def _ordered(self):
+        buffer, start = self._buffer, self._next
+        if self._count < self._capacity:
+            return buffer[: self._count]
+        np = _numpy()
+        if np is not None:
+            return np.concatenate((buffer[start:], buffer[:start]))
+        return buffer[start:] + buffer[:start]
+
+    def _path(self):
+        scale = self._drawnscale = MathApp.scale
+        positions = self._ordered()
+        if _numpy() is not None:
+            return [tuple(p) for p in (positions * (scale, -scale)).tolist()]
+        return [(x * scale, -y * scale) for x, y in positions]
+
+    def step(self):
+        """
+        Add the current position of the source, if it has moved far enough,
+        and update the trail.
+        """
+        pos = self._source()
+        last = self._last
+        if (
+            last is not None
+            and ((pos[0] - last[0]) ** 2 + (pos[1] - last[1]) ** 2) * MathApp.scale**2
+            <= self._threshold**2
+        ):
+            return
+        self._buffer[self._next] = self._last = (pos[0], pos[1])
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+        if self._added >= self._slack and self._zoompreview == 1:
+            self._redrawAsset()
+        else:
+            # drawn to the scale of the rest of the path, which may be
+            # showing a zoom preview
+            scale = self._drawnscale
+            self.asset.append((pos[0] * scale, -pos[1] * scale))
+            self._added += 1
+
+    def _buildAsset(self):
+        self._added = 0
+        return PolylineAsset(self._path(), self._stdinputs.style())
+
+    def _canTranslate(self):
+        return self._drawnscale == MathApp.scale
+
+    def _canScale(self):
+        return True
+
+    def _redrawAsset(self):
+        self._added = 0
+        self.asset.path = self._path()
+        self.asset.redraw()
+        self.position = self._spposinputs.pos  # pylint: disable=no-member
+        return True
+
+    def physicalPointTouching(self, ppos):
+        """
+        This method always returns False.
+        """
+        return False
+
+    def translate(self, pdisp):
+        """
+        This method is not implemented.
+        """
@@ -18,7 +18,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/BrythonServer/ggame",
-    packages=setuptools.find_packages(exclude=["examples*"]),
+    packages=setuptools.find_packages(exclude=["examples*", "benchmarks*"]),
     python_requires='>=3.11',
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -1,5 +1,8 @@
+import os
+import subprocess
+import sys
 import unittest
-from ggame import App, KeyEvent, MouseEvent
+from ggame import App, KeyEvent, MouseEvent, backend, nulldeps
 
 
 class keyevent(object):
@@ -44,6 +47,85 @@ class TestAppMethods(unittest.TestCase):
         # and destroy it
         a3.destroy()
 
+    def test_wildcardkeys(self):
+        a4 = App(100, 100)
+        a4.listenKeyEvent(KeyEvent.keydown, "space", self.spacehandler)
+        a4.listenKeyEvent(KeyEvent.keydown, "*", self.spacehandler)
+        key = keyevent("keydown", 32)
+        for i in range(3):
+            a4._keyEvent(key)
+        # specific and wildcard listeners each see every event, once
+        self.assertEqual(self.keyevtx, 6)
+        self.assertEqual(len(App._eventdict[("keydown", "space")]), 1)
+        a4.destroy()
+
+    def test_lazyimport(self):
+        # importing ggame alone must not load a backend
+        env = dict(os.environ, GGAME_BACKEND="headless")
+        code = (
+            "import sys, ggame\n"
+            "assert 'ggame.sysdeps' not in sys.modules\n"
+            "from ggame import Sprite\n"
+            "print(sys.modules['ggame.sysdeps'].BACKEND)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        self.assertEqual(out.stdout.strip(), "headless")
+
+    def test_modulebackend(self):
+        # the ggame modules used without the package load top-level backends
+        env = dict(os.environ, GGAME_BACKEND="null")
+        code = (
+            "import sys\n"
+            "sys.path.insert(0, {!r})\n"
+            "import sysdeps\n"
+            "print(sysdeps._module.__name__)\n"
+        ).format(os.path.dirname(backend.__file__))
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        self.assertEqual(out.stdout.strip(), "nulldeps", out.stderr)
+
+    def test_nullbackend(self):
+        # the null backend runs a complete program without any output
+        env = dict(os.environ, GGAME_BACKEND="null")
+        code = (
+            "from ggame.asset import ImageAsset, RectangleAsset, TextAsset\n"
+            "from ggame.sprite import Sprite\n"
+            "from ggame.app import App\n"
+            "image = Sprite(ImageAsset('bunny.png'), (10, 10))\n"
+            "rect = Sprite(RectangleAsset(20, 30), (50, 50))\n"
+            "text = Sprite(TextAsset('hello'), (0, 0))\n"
+            "app = App(100, 100)\n"
+            "app.run()\n"
+            "assert (image.width, image.height) == (71, 100)\n"
+            "assert (rect.width, rect.height) == (20, 30)\n"
+            "app.destroy()\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        self.assertEqual(out.returncode, 0, out.stderr)
+        self.assertEqual(out.stdout, "")
+
+    def test_registerbackend(self):
+        self.assertIn("null", backend.availableBackends())
+        self.assertTrue(backend.isBackend("Headless"))
+        self.assertFalse(backend.isBackend("nosuchbackend"))
+        self.assertRaises(ValueError, backend.loadBackend, "nosuchbackend")
+        # a registered backend must provide the complete interface
+        for name in ("incomplete", "nullcopy"):
+            self.addCleanup(backend._registry.pop, name, None)
+        backend.registerBackend("incomplete", "ggame.event")
+        self.assertRaises(ImportError, backend.loadBackend, "incomplete")
+        backend.registerBackend("nullcopy", backend.loadBackend("null"))
+        self.assertIs(backend.loadBackend("nullcopy"), nulldeps)
+
     def spacehandler(self, event):
         self.assertEqual(type(event), KeyEvent)
         self.keyevtx += 1
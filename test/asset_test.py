@@ -1,6 +1,12 @@
 import unittest
 from ggame import ImageAsset, Frame, Color, LineStyle, RectangleAsset
 from ggame import CircleAsset, EllipseAsset, PolygonAsset, LineAsset, TextAsset
+from ggame import PolylineAsset
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestImageAssetMethods(unittest.TestCase):
@@ -78,6 +84,56 @@ class TestImageAssetMethods(unittest.TestCase):
         self.assertEqual(p.gfx.jpath[4], 15)
         self.assertEqual(p.gfx.visible, False)
 
+    def test_polylineasset(self):
+        nan = float("nan")
+        p = PolylineAsset(
+            [(0, 0), (10, 5), (nan, 0), (20, 0), (30, 10)],
+            LineStyle(2, Color(0x112233, 0.5)),
+        )
+        self.assertEqual(p.gfx.visible, False)
+        self.assertEqual((p.gfx.x, p.gfx.y), (20, 0))
+        self.assertEqual((p.gfx.xto, p.gfx.yto), (30, 10))
+        # appended points are drawn from the end of the line
+        gfx = p.gfx
+        segments = []
+        lineto = gfx.lineTo
+        gfx.lineTo = lambda x, y: segments.append((x, y)) or lineto(x, y)
+        p.append((40, 20))
+        p.extend([(nan, nan), (50, 0), (60, 5)])
+        self.assertIs(p.gfx, gfx)
+        self.assertEqual(segments, [(40, 20), (60, 5)])
+        self.assertEqual(p.path[-2:], [(50, 0), (60, 5)])
+        self.assertEqual(len(p.path), 9)
+        self.assertEqual(gfx.color, 0x112233)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_polylinearray(self):
+        p = PolylineAsset(numpy.array([[0.0, 0.0], [10.0, 5.0]]))
+        self.assertEqual(p.path, [(0, 0), (10, 5)])
+        p.extend(numpy.array([[20.0, 0.0], [numpy.nan, 0.0], [30.0, 10.0]]))
+        self.assertEqual(p.path[2], (20, 0))
+        self.assertEqual((p.gfx.x, p.gfx.y), (30, 10))
+        self.assertEqual((p.gfx.xto, p.gfx.yto), (20, 0))
+
+    def test_redraw(self):
+        l = LineAsset(60, 70, LineStyle(5, Color(0x224466, 0.7)))
+        gfx = l.gfx
+        gfx.visible = True
+        gfx.position.x = 12
+        l.delta_x, l.delta_y = 30, 40
+        l.redraw()
+        self.assertIs(l.gfx, gfx)
+        self.assertEqual((gfx.xto, gfx.yto), (30, 40))
+        self.assertEqual(gfx.color, 0x224466)
+        self.assertEqual(gfx.visible, True)
+        self.assertEqual(gfx.position.x, 12)
+        c = CircleAsset(30, LineStyle(3, Color(0x112233, 0.5)), Color(0x223344, 0.6))
+        c.radius = 20
+        c.redraw()
+        self.assertEqual(c.gfx.radius, 20)
+        self.assertEqual(c.gfx.fillcolor, 0x223344)
+        self.assertEqual(c.gfx.visible, False)
+
     def test_textasset(self):
         t = TextAsset(
             "sample text",
@@ -91,6 +147,34 @@ class TestImageAssetMethods(unittest.TestCase):
         self.assertEqual(t.gfx.styledict["fill"], 0x123456)
         self.assertEqual(t.gfx.alpha, 1.0)
 
+    def test_textrendercache(self):
+        cache = TextAsset.rendercache
+        cache.clear()
+        t1 = TextAsset("cached", style="20px Arial", width=200)
+        gfx = t1.gfx
+        t1.release()
+        self.assertEqual(len(cache), 1)
+        # same text and style: the render is reused
+        t2 = TextAsset("cached", style="20px Arial", width=200)
+        self.assertIs(t2.gfx, gfx)
+        self.assertEqual(t2.gfx.visible, False)
+        # different wrap width or fill color: a new render
+        t3 = TextAsset("cached", style="20px Arial", width=100)
+        self.assertIsNot(t3.gfx, gfx)
+        t2.release()
+        t4 = TextAsset("cached", style="20px Arial", width=200, fill=Color(0xFF, 1))
+        self.assertIsNot(t4.gfx, gfx)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(cache.hitrate, 0.25)
+        # the least recently released render is evicted first
+        cache.maxsize = 2
+        t3.release()
+        t4.release()
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(TextAsset("cached", style="20px Arial", width=200).gfx, gfx)
+        cache.maxsize = 256
+        cache.clear()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,9 @@
 import unittest
-from ggame.astro import Rocket, Planet
+from ggame import astro
+from ggame.astro import Rocket, RocketFleet, Planet, _orbit, _orbitState
+from ggame.gravity import Body, Gravity
+from types import SimpleNamespace
+from math import pi, sin, cos
 import time
 
 
@@ -8,7 +12,7 @@ class TestAstroMethods(unittest.TestCase):
         earth = Planet(viewscale=0.00005)
         earth.run()
 
-        rocket1 = Rocket(earth, altitude=400000, velocity=7670, timezoom=2)
+        rocket1 = Rocket(earth, altitude=400000, velocity=7670, timezoom=2, trail=100)
         rocket2 = Rocket(
             earth, altitude=440000, velocity=7670, timezoom=2, statuspos=[300, 10]
         )
@@ -17,6 +21,274 @@ class TestAstroMethods(unittest.TestCase):
             time.sleep(1 / 60)
             earth.step()
 
+        self.assertGreater(len(rocket1.trail.positions()), 1)
+        rocket1.destroy()
+        Planet.destroy()
+
+    def test_fleet(self):
+        earth = Planet(viewscale=0.00005)
+        earth.run()
+        heading = lambda: 0.5
+        rocket = Rocket(
+            earth, altitude=400000, velocity=7670, thrust=100, heading=heading
+        )
+        fleet = RocketFleet(
+            earth,
+            3,
+            altitude=400000,
+            velocity=[7670, 7670, 0],
+            thrust=[100, 100, 0],
+            heading=heading,
+        )
+        # one step of each gives the same state
+        rocket._lasttime = 0
+        rocket._dynamics(SimpleNamespace(time=10))
+        fleet.advance(10)
+        for i in (0, 1):
+            self.assertAlmostEqual(fleet.positions[0][i], rocket.xyposition[i], 3)
+            self.assertAlmostEqual(fleet.velocities[1][i], rocket._v_vect[i], 6)
+        # the rocket without velocity or thrust has fallen back to the surface
+        for i in range(100):
+            fleet.advance(10)
+        self.assertAlmostEqual(fleet.altitudes[2], 0)
+        self.assertEqual(fleet.speeds[2], 0)
+        self.assertGreater(fleet.speeds[0], 7000)
+        for i in range(10):
+            time.sleep(1 / 60)
+            earth.step()
+        self.assertGreater(fleet.shiptime, 1000)
+        fleet.destroy()
+        rocket.destroy()
+        Planet.destroy()
+
+    def test_rk45(self):
+        earth = Planet(viewscale=0.00005)
+        r0 = earth.radius + 400000
+        v0 = (6.674e-11 * earth.mass / r0) ** 0.5
+        errors = {}
+        for integrator in ("rk4", "rk45"):
+            rocket = Rocket(
+                earth,
+                altitude=400000,
+                velocity=v0,
+                directiond=180,
+                integrator=integrator,
+            )
+            # a circular orbit, in ticks of a few minutes
+            rocket._lasttime = 0
+            for i in range(1, 31):
+                rocket._dynamics(SimpleNamespace(time=i * 333))
+            errors[integrator] = abs(rocket.r - r0)
+            rocket.destroy()
+        self.assertGreater(errors["rk4"], 1000)
+        self.assertLess(errors["rk45"], 1)
+        Planet.destroy()
+
+    def test_kepler(self):
+        earth = Planet(viewscale=0.00005)
+        thrust = [0]
+        rocket = Rocket(
+            earth,
+            altitude=400000,
+            velocity=8000,
+            directiond=180,
+            kepler=True,
+            thrust=lambda: thrust[0],
+        )
+        reference = Rocket(
+            earth,
+            altitude=400000,
+            velocity=8000,
+            directiond=180,
+            integrator="rk45",
+            tolerance=1e-12,
+            maxsubsteps=10000,
+        )
+        rocket._lasttime = reference._lasttime = 0
+        for i in range(1, 51):
+            rocket._dynamics(SimpleNamespace(time=i * 100))
+            reference._dynamics(SimpleNamespace(time=i * 100))
+        self.assertIsNotNone(rocket._coastorbit)
+        for i in (0, 1):
+            self.assertAlmostEqual(rocket.xyposition[i], reference.xyposition[i], 2)
+            self.assertAlmostEqual(rocket._v_vect[i], reference._v_vect[i], 5)
+        # a very long coast stays on the same orbit
+        rocket._dynamics(SimpleNamespace(time=5000 + 1e8))
+        rocket._dynamics(SimpleNamespace(time=5000 + 2e8))
+        self.assertAlmostEqual(
+            rocket.velocity**2 / 2 - 6.674e-11 * earth.mass / rocket.r,
+            reference.velocity**2 / 2 - 6.674e-11 * earth.mass / reference.r,
+            3,
+        )
+        # thrust switches back to integration
+        thrust[0] = 1
+        rocket._dynamics(SimpleNamespace(time=2e8 + 5100))
+        self.assertIsNot(rocket._coastorbit[0], rocket.xyposition)
+        rocket.destroy()
+        reference.destroy()
+        # circular orbits, where the periapsis is only rounding error
+        mu = 6.674e-11 * earth.mass
+        r0 = earth.radius + 400000
+        v0 = (mu / r0) ** 0.5
+        for i in range(100):
+            angle = 2 * pi * i / 100
+            pos = (r0 * cos(angle), r0 * sin(angle))
+            for direction in (1, -1):
+                vel = (-direction * v0 * sin(angle), direction * v0 * cos(angle))
+                newpos, newvel = _orbitState(_orbit(pos, vel, mu))
+                for j in (0, 1):
+                    self.assertAlmostEqual(newpos[j], pos[j], 3)
+                    self.assertAlmostEqual(newvel[j], vel[j], 6)
+        rocket = Rocket(
+            earth, altitude=400000, velocity=v0, directiond=180, kepler=True
+        )
+        rocket._lasttime = 0
+        rocket._dynamics(SimpleNamespace(time=100))
+        self.assertIsNotNone(rocket._coastorbit)
+        self.assertAlmostEqual(rocket.r, r0, 3)
+        self.assertAlmostEqual(rocket.tanomaly, pi / 2 + 100 * v0 / r0, 9)
+        rocket.destroy()
+        Planet.destroy()
+
+    def test_controls(self):
+        earth = Planet(viewscale=0.00005)
+        calls = []
+
+        def control(value):
+            return lambda: calls.append(value) or value
+
+        rocket = Rocket(
+            earth,
+            altitude=400000,
+            velocity=7670,
+            heading=control(1),
+            thrust=control(10),
+            mass=control(5),
+            showstatus=False,
+        )
+        rocket._lasttime = 0
+        rocket._dynamics(SimpleNamespace(time=1))
+        # each control is read once per tick
+        self.assertEqual(sorted(calls), [1, 5, 10])
+        self.assertAlmostEqual(rocket.rotation, 1)
+        rocket.destroy()
+        Planet.destroy()
+
+    def test_gravity(self):
+        earth = Planet(viewscale=0.00005)
+        # the planet alone attracts as it does without an engine
+        rocket1 = Rocket(earth, altitude=400000, velocity=7670, showstatus=False)
+        rocket2 = Rocket(
+            earth,
+            altitude=400000,
+            velocity=7670,
+            showstatus=False,
+            gravity=Gravity([earth]),
+        )
+        rocket1._lasttime = rocket2._lasttime = 0
+        rocket1._dynamics(SimpleNamespace(time=10))
+        rocket2._dynamics(SimpleNamespace(time=10))
+        for i in (0, 1):
+            self.assertAlmostEqual(rocket1.xyposition[i], rocket2.xyposition[i], 3)
+        # many bodies, summed directly or through the quadtree
+        bodies = [Body(1e20, (1e7 * (i % 17), 3e6 * (i % 23))) for i in range(500)]
+        bodies.append(Body(1e21, lambda: (-5e6, 0)))
+        points = [(2e7 * i - 1e8, 2.1e7 * (i % 3)) for i in range(10)] + [(-5e6, 0)]
+        direct = Gravity(bodies, threshold=1000).acceleration(points)
+        exact = Gravity(bodies, theta=0, threshold=0).acceleration(points)
+        approximate = Gravity(bodies, threshold=0).acceleration(points)
+        for i in range(len(points)):
+            scale = (direct[i] ** 2).sum() ** 0.5
+            self.assertGreater(scale, 0)
+            for j in (0, 1):
+                self.assertAlmostEqual(exact[i][j] / scale, direct[i][j] / scale, 9)
+        # the approximation is close away from the bodies
+        for i in range(5):
+            error = ((approximate[i] - direct[i]) ** 2).sum() ** 0.5
+            self.assertLess(error, 0.05 * (direct[i] ** 2).sum() ** 0.5)
+        # a snapshot keeps the positions of the bodies when they move
+        moon = [(0, 1e8)]
+        engine = Gravity([earth, Body(7e22, lambda: moon[0])])
+        snapshot = engine.snapshot()
+        before = snapshot.acceleration(points)
+        moon[0] = (1e8, 0)
+        engine.update()
+        self.assertTrue((snapshot.acceleration(points) == before).all())
+        self.assertFalse((engine.acceleration(points) == before).all())
+        fleet = RocketFleet(
+            earth,
+            2,
+            altitude=400000,
+            velocity=7670,
+            show=False,
+            gravity=Gravity([earth]),
+        )
+        fleet.advance(10)
+        for i in (0, 1):
+            self.assertAlmostEqual(fleet.positions[1][i], rocket1.xyposition[i], 3)
+        for o in [rocket1, rocket2, fleet]:
+            o.destroy()
+        Planet.destroy()
+
+    def test_prediction(self):
+        earth = Planet(viewscale=0.00005)
+        earth.run()
+        r0 = earth.radius + 400000
+        v0 = (6.674e-11 * earth.mass / r0) ** 0.5
+        thrust = [0]
+        rocket = Rocket(
+            earth,
+            altitude=400000,
+            velocity=v0,
+            directiond=180,
+            thrust=lambda: thrust[0],
+            prediction=3000,
+            showstatus=False,
+        )
+        prediction = rocket.prediction
+        prediction.step()
+        prediction.wait()
+        self.assertFalse(prediction.pending)
+        path = prediction.positions()
+        self.assertEqual(len(path), 201)
+        self.assertEqual(path[0], tuple(rocket.xyposition))
+        # a circular orbit, half way round
+        for x, y in path:
+            self.assertAlmostEqual((x**2 + y**2) ** 0.5 / r0, 1, 4)
+        self.assertAlmostEqual(path[-1][1] / r0, -1, 1)
+        # nothing changes, so the prediction is kept
+        version = prediction._version
+        for i in range(5):
+            time.sleep(1 / 60)
+            earth.step()
+        prediction.wait()
+        self.assertEqual(prediction._version, version)
+        # a change of thrust is predicted again
+        thrust[0] = 1
+        earth.step()
+        prediction.wait()
+        self.assertEqual(prediction._version, version + 1)
+        self.assertNotEqual(prediction.positions()[-1], path[-1])
+        # a prediction that fails is dropped and requested again
+        path = prediction.positions()
+
+        def fail(*args):
+            raise ArithmeticError
+
+        predictpath = astro._predictPath
+        astro._predictPath = fail
+        try:
+            thrust[0] = 2
+            earth.step()
+            prediction.wait()
+            self.assertFalse(prediction.pending)
+            self.assertEqual(prediction.positions(), path)
+        finally:
+            astro._predictPath = predictpath
+        earth.step()
+        prediction.wait()
+        self.assertEqual(prediction._version, version + 2)
+        rocket.destroy()
         Planet.destroy()
 
 
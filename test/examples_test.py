@@ -35,6 +35,9 @@ import examples.inputpointinputimagebutton
 # Label Examples
 import examples.labellabel
 
+# Plot Examples
+import examples.plotfunctionplot
+
 # Timer Examples
 import examples.timertimer
 
@@ -1,5 +1,7 @@
 import unittest
-from ggame.logic import BoolSRFF, BoolAND, BoolNAND, BoolNOR, BoolNOT
+from ggame.logic import BoolSRFF, BoolAND, BoolNAND, BoolNOR, BoolNOT, Circuit
+from ggame.logic import BoolDFF, BoolRegister, BoolCounter, Clock, Waveform
+from ggame.logic import _BoolMultiInput
 from ggame.mathapp import MathApp
 from ggame.inputpoint import MetalToggle, GlassButton
 from ggame.indicator import LEDIndicator
@@ -71,6 +73,203 @@ class TestLogicMethods(unittest.TestCase):
         for o in [IC1, Inv1, Inv2, b1, b2, d1, d2]:
             o.destroy()
 
+    def test_circuit(self):
+        reads = []
+        x = [True]
+
+        def source():
+            reads.append(1)
+            return x[0]
+
+        # each NAND of a gate with itself inverts it; without the circuit
+        # the input would be read 2**20 times
+        gates = [BoolNOT()]
+        gates[0].inp = source
+        for i in range(20):
+            gate = BoolNAND()
+            gate.inp = gates[-1], gates[-1]
+            gates.append(gate)
+        top = BoolAND()
+        top.inp = gates[-1], gates[-2]
+        Circuit(top, gates[-1])
+        self.assertEqual(gates[-1](), False)
+        self.assertEqual(top(), False)
+        # read once when compiled and once per settle
+        self.assertEqual(len(reads), 3)
+        x[0] = False
+        self.assertEqual(gates[-1](), True)
+        self.assertEqual(top(), False)
+        # changing an input recompiles the circuit
+        top.inp = gates[-1], gates[-3]
+        self.assertEqual(top(), True)
+        x[0] = True
+        self.assertEqual(top(), False)
+        for gate in gates + [top]:
+            gate.destroy()
+
+    def test_SRcircuit(self):
+        inputs = {"R": False, "S": False}
+        ff = BoolSRFF()
+        ff.setinput("R", lambda: inputs["R"])
+        ff.setinput("S", lambda: inputs["S"])
+        Circuit(ff, ff.ic2)
+        inputs["S"] = True
+        self.assertEqual((ff.q(), ff.q_()), (True, False))
+        inputs["S"] = False
+        self.assertEqual((ff.q(), ff.q_()), (True, False))
+        inputs["R"] = True
+        self.assertEqual((ff.q(), ff.q_()), (False, True))
+        inputs["R"] = False
+        self.assertEqual((ff.q(), ff.q_()), (False, True))
+        for gate in [ff, ff.ic1, ff.ic2]:
+            gate.destroy()
+
+    def test_framecache(self):
+        reads = []
+        x = [True]
+
+        def source():
+            reads.append(x[0])
+            return x[0]
+
+        inv = BoolNOT()
+        inv.inp = source
+        gates = []
+        for i in range(10):
+            gate = BoolNAND()
+            gate.inp = inv, inv
+            gates.append(gate)
+        leds = [LEDIndicator((0, i / 10), gate) for i, gate in enumerate(gates)]
+        ma = MathApp()
+        ma.run()
+        ma.step()
+        del reads[:]
+        ma.step()
+        # the shared gate is evaluated once per frame
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(gates[0](), True)
+        x[0] = False
+        self.assertEqual(gates[0](), False)
+        del reads[:]
+        ma.step()
+        self.assertEqual(len(reads), 1)
+        for o in gates + leds + [inv]:
+            o.destroy()
+
+    def test_truthtable(self):
+        def a():
+            return False
+
+        def b():
+            return False
+
+        def c():
+            return True
+
+        # a XOR b from four NANDs, and from NOTs, ANDs and a NOR
+        n1 = BoolNAND()
+        n1.inp = a, b
+        n2 = BoolNAND()
+        n2.inp = a, n1
+        n3 = BoolNAND()
+        n3.inp = b, n1
+        xor1 = BoolNAND()
+        xor1.inp = n2, n3
+        nota = BoolNOT()
+        nota.inp = a
+        notb = BoolNOT()
+        notb.inp = b
+        and1 = BoolAND()
+        and1.inp = a, b
+        and2 = BoolAND()
+        and2.inp = nota, notb
+        xor2 = BoolNOR()
+        xor2.inp = and1, and2
+        and3 = BoolAND()
+        and3.inp = xor1, c
+        circuit1 = Circuit(xor1, and3)
+        circuit2 = Circuit(xor2)
+        # combinations are (a, b) = 00, 10, 01, 11; c keeps its state
+        self.assertEqual(circuit1.truthTable([a, b]), [0b0110, 0b0110])
+        self.assertEqual(circuit1.truthTable([b, a, c]), [0b01100110, 0b01100000])
+        self.assertEqual(circuit2.truthTable([a, b]), [0b0110])
+        self.assertTrue(Circuit(xor1).equivalent(circuit2, [a, b]))
+        self.assertFalse(Circuit(and1).equivalent(circuit2, [a, b]))
+        self.assertEqual(
+            circuit1.truthTable([a, b, c], processes=2), [0b01100110, 0b01100000]
+        )
+        # the gates are still evaluated one vector at a time
+        self.assertEqual(xor1(), False)
+        gates = [n1, n2, n3, xor1, nota, notb, and1, and2, xor2, and3]
+        for gate in gates:
+            gate.destroy()
+
+    def test_truthtablecustom(self):
+        class BoolXOR(_BoolMultiInput):
+            def _evaluate(self, states):
+                return sum(bool(state) for state in states) % 2 == 1
+
+        def a():
+            return False
+
+        def b():
+            return True
+
+        xor = BoolXOR()
+        xor.inp = a, b
+        nand = BoolNAND()
+        nand.inp = xor, b
+        circuit = Circuit(xor, nand)
+        self.assertEqual(xor(), True)
+        # a device without a bitwise form is evaluated one vector at a time
+        self.assertEqual(circuit.truthTable([a, b]), [0b0110, 0b1011])
+        for gate in [xor, nand]:
+            gate.destroy()
+
+    def test_truthtablefeedback(self):
+        ff = BoolSRFF()
+        ff.setinput("R", lambda: False)
+        ff.setinput("S", lambda: False)
+        with self.assertRaises(ValueError):
+            Circuit(ff).truthTable()
+        for gate in [ff, ff.ic1, ff.ic2]:
+            gate.destroy()
+
+    def test_clocked(self):
+        clock = Clock()
+        # a DFF fed by its own inverse divides the clock by two
+        dff = BoolDFF(clock)
+        inv = BoolNOT()
+        inv.inp = dff
+        dff.inp = inv
+        counter = BoolCounter(3, clock, initial=6)
+        register = BoolRegister(3, clock)
+        register.inp = counter.q
+        self.assertEqual(counter.value(), 6)
+        clock.tick()
+        self.assertEqual((dff(), counter.value(), register.value()), (True, 7, 6))
+        clock.tick()
+        self.assertEqual((dff(), counter.value(), register.value()), (False, 0, 7))
+        enable = [False]
+        counter.inp = lambda: enable[0]
+        clock.tick()
+        self.assertEqual((dff(), counter.value(), register.value()), (True, 0, 0))
+        enable[0] = True
+        circuit = Circuit(dff, *counter.q, *register.q)
+        waveform = Waveform([("d", dff), ("q0", counter.q[0]), ("en", counter.inp)])
+        circuit.run(100, clock, waveform)
+        self.assertEqual(clock.cycles, 103)
+        self.assertEqual((dff(), counter.value(), register.value()), (True, 4, 3))
+        self.assertEqual(len(waveform), 100)
+        self.assertEqual(waveform["d"][:4], [True, False, True, False])
+        self.assertEqual(waveform["q0"][:4], [False, True, False, True])
+        vcd = waveform.vcd()
+        self.assertIn("$var wire 1 ! d $end", vcd)
+        self.assertIn('#0\n$dumpvars\n1!\n0"\n1#\n$end\n#1\n0!\n1"\n', vcd)
+        for o in [dff, inv, counter, register]:
+            o.destroy()
+        self.assertEqual(clock._devices, [])
+
 
 if __name__ == "__main__":
     unittest.main()
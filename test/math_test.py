@@ -13,7 +13,14 @@ from ggame import Color, LineStyle, ImageAsset, Frame
 from ggame.inputpoint import GlassButton, MetalToggle
 from ggame.indicator import LEDIndicator
 from ggame.timer import Timer
+from ggame.plot import FunctionPlot
+from ggame.trail import Trail
+from ggame.clip import clipCircle
+from ggame.asset import PolygonAsset
+from ggame.logic import BoolNOT
+import math
 import time
+from types import SimpleNamespace
 
 
 class TestMathMethods(unittest.TestCase):
@@ -95,6 +102,323 @@ class TestMathMethods(unittest.TestCase):
         self.l1.destroy()
         self.l2.destroy()
 
+    def test_dependencies(self):
+        p1 = Point((0, 0))
+        p1.movable = True
+        p2 = Point(p1)
+        slider = Slider((100, 150), 0, 1, 0.5, positioning="physical")
+        c1 = Circle((0, 0), slider)
+        steps = []
+
+        def countsteps(obj):
+            steps.append(obj)
+            type(obj).step(obj)
+
+        p2.step = lambda: countsteps(p2)
+        c1.step = lambda: countsteps(c1)
+        ma = MathApp()
+        ma.step()
+        steps.clear()
+        # nothing upstream has changed
+        ma.step()
+        ma.step()
+        self.assertEqual(steps, [])
+        # only the subgraph downstream of the change is stepped
+        p1.translate((10, 0))
+        ma.step()
+        self.assertEqual(steps, [p2])
+        self.assertEqual(p2(), p1())
+        self.assertEqual(p2.position, p1.position)
+        slider.value = 0.8
+        ma.step()
+        ma.step()
+        self.assertEqual(steps, [p2, c1])
+        self.assertEqual(c1._snposinputs.radius, 0.8)
+        # a rebound input no longer follows its old source
+        gate = BoolNOT()
+        gate.inp = p1
+        self.assertIn(gate, p1._sinks)
+        gate.inp = lambda: True
+        p2.translate((0, 10))
+        self.assertEqual(p1._sinks, ())
+        steps.clear()
+        p1.translate((10, 0))
+        self.assertFalse(p2._stale or gate._stale)
+        ma.step()
+        self.assertEqual(steps, [])
+
+        gate.destroy()
+        c1.destroy()
+        slider.destroy()
+        p2.destroy()
+        p1.destroy()
+        self.assertEqual(p1._sinks, ())
+
+    def test_inplaceupdates(self):
+        p1 = Point((0, 0))
+        p1.movable = True
+        p2 = Point((1, 0))
+        p2.movable = True
+        l1 = LineSegment(p1, p2)
+        slider = Slider((100, 150), 0.1, 1, 0.5, positioning="physical")
+        c1 = Circle(p1, slider)
+        ma = MathApp()
+        ma.step()
+        pgfx, lgfx, cgfx = p1.gfx, l1.gfx, c1.gfx
+        # a drag only moves the point
+        p1.translate((10, 5))
+        ma.step()
+        self.assertIs(p1.gfx, pgfx)
+        self.assertEqual(p1.position, MathApp.logicalToPhysical(p1()))
+        # the segment and circle are redrawn in place
+        self.assertIs(l1.gfx, lgfx)
+        self.assertEqual(l1.position, p1.position)
+        self.assertEqual(l1.asset.delta_x, p2.x - p1.x)
+        self.assertIs(c1.gfx, cgfx)
+        self.assertEqual(c1.position, p1.position)
+        slider.value = 1
+        ma.step()
+        self.assertIs(c1.gfx, cgfx)
+        self.assertEqual(c1.asset.radius, MathApp.scale)
+        # a new style builds a new asset
+        p1._stdinputs = p1._stdinputs._replace(size=p1.eval(10))
+        p1.touchAsset()
+        self.assertIsNot(p1.gfx, pgfx)
+
+        c1.destroy()
+        slider.destroy()
+        l1.destroy()
+        p2.destroy()
+        p1.destroy()
+
+    def test_viewtransform(self):
+        ma = MathApp(100)
+        points = [(0, 0), (1.25, -0.5), (-3.3, 2.7)]
+        physical = [MathApp.logicalToPhysical(p) for p in points]
+        self.assertEqual(
+            [tuple(p) for p in MathApp.logicalToPhysicalArray(points).tolist()],
+            physical,
+        )
+        self.assertEqual(
+            MathApp.physicalToLogicalArray(physical).tolist(),
+            [list(MathApp.physicalToLogical(p)) for p in physical],
+        )
+        self.assertEqual(MathApp.logicalToPhysicalArray([]).shape, (0, 2))
+        # the cached view follows pans and zooms
+        ma.view_position = (1, 2)
+        self.assertEqual(
+            MathApp.logicalToPhysical((1, 2)), (ma.width // 2, ma.height // 2)
+        )
+        MathApp.scale = 50
+        self.assertEqual(MathApp.physicalToLogical((ma.width / 2 + 50, 0))[0], 2)
+        MathApp.destroy()
+        # with no window, coordinates are unchanged
+        self.assertEqual(MathApp.logicalToPhysical((1, 2)), (1, 2))
+        MathApp.scale = MathApp._DEFAULTSCALE
+        ma.view_position = (0, 0)
+
+    def test_spatialindex(self):
+        points = [Point((i % 10 * 0.5 - 2, i // 10 * 0.5 - 2)) for i in range(100)]
+        for p in points:
+            p.movable = True
+            p.selectable = True
+        slider = Slider((10, 10), 0, 1, 0.5, positioning="physical")
+        ma = MathApp()
+        ma.view_position = (0, 0)
+        ma.step()
+        target = points[37]
+        x, y = target.position
+        candidates = MathApp._mathSelectableIndex.query((x, y))
+        self.assertIn(target, candidates)
+        self.assertLess(len(candidates), 10)
+        # the index follows moves and pans
+        target.translate((200, 0))
+        self.assertNotIn(target, MathApp._mathMovableIndex.query((x, y)))
+        self.assertIn(target, MathApp._mathMovableIndex.query((x + 200, y)))
+        ma.view_position = (1, 0)
+        self.assertEqual(
+            [p for p in points if p.physicalPointTouching((x, y))],
+            [
+                p
+                for p in MathApp._mathSelectableIndex.query((x, y))
+                if p.physicalPointTouching((x, y))
+            ],
+        )
+        self.assertTrue(any(p.physicalPointTouching((x, y)) for p in points))
+        ma._handleMouseClick(SimpleNamespace(x=x, y=y))
+        self.assertEqual(
+            [p for p in points if p.selected],
+            [p for p in points if p.physicalPointTouching((x, y))],
+        )
+        self.assertEqual(MathApp._mathStrokableIndex.query((15, 12)), [slider])
+        slider.destroy()
+        for p in points:
+            p.destroy()
+        self.assertEqual(len(MathApp._mathSelectableIndex), 0)
+        ma.view_position = (0, 0)
+        MathApp.destroy()
+
+    def test_panzoom(self):
+        p1 = Point((0, 0))
+        p2 = Point((1, 0.5))
+        l1 = LineSegment(p1, p2)
+        c1 = Circle(p1, 0.25)
+        ma = MathApp()
+        ma.view_position = (0, 0)
+        ma.step()
+        gfx = [v.gfx for v in (p1, p2, l1, c1)]
+        # a pan moves the existing assets
+        ma.view_position = (0.5, 0.25)
+        self.assertEqual([v.gfx for v in (p1, p2, l1, c1)], gfx)
+        self.assertEqual(p2.position, MathApp.logicalToPhysical(p2()))
+        self.assertEqual(l1.position, p1.position)
+        self.assertEqual(c1.position, p1.position)
+        # a zoom is previewed by scaling, then redrawn after the debounce time
+        deltax = l1.asset.delta_x
+        ma._handleMouseWheel(SimpleNamespace(wheeldelta=10))
+        self.assertEqual(p2.position, MathApp.logicalToPhysical(p2()))
+        self.assertEqual(l1.position, p1.position)
+        self.assertAlmostEqual(l1.scale, 1.1)
+        self.assertAlmostEqual(c1.scale, 1.1)
+        self.assertEqual(l1.asset.delta_x, deltax)
+        ma.step()
+        self.assertAlmostEqual(l1.scale, 1.1)
+        MathApp.zoomdebounce = 0
+        ma.step()
+        MathApp.zoomdebounce = 0.25
+        self.assertEqual(l1.scale, 1)
+        self.assertEqual(c1.scale, 1)
+        self.assertEqual(l1.asset.delta_x, p2.x - p1.x)
+        self.assertEqual(c1.asset.radius, 0.25 * MathApp.scale)
+        self.assertEqual([v.gfx for v in (p1, p2, l1, c1)], gfx)
+        # a circle at the center of the view is redrawn too
+        c2 = Circle((0.5, 0.25), 0.5)
+        ma._handleMouseWheel(SimpleNamespace(wheeldelta=-10))
+        MathApp.zoomdebounce = 0
+        ma.step()
+        MathApp.zoomdebounce = 0.25
+        self.assertEqual(c2.scale, 1)
+        self.assertEqual(c2.asset.radius, 0.5 * MathApp.scale)
+        c2.destroy()
+
+        ma.view_position = (0, 0)
+        c1.destroy()
+        l1.destroy()
+        p2.destroy()
+        p1.destroy()
+        MathApp.destroy()
+
+    def test_functionplot(self):
+        slider = Slider((10, 10), 1, 2, 1, positioning="physical")
+        cubic = FunctionPlot(lambda x, a: a * x**3 - x, params=slider)
+        root = FunctionPlot(lambda x: math.sqrt(x), xmax=0.25)
+        ma = MathApp()
+        ma.view_position = (0, 0)
+        ma.step()
+        self.assertTrue(cubic._vectorized)
+        self.assertFalse(root._vectorized)
+        # the samples follow the function to within the tolerance
+        xs, ys = cubic._xs, cubic._ys
+        tolerance = 0.5 / MathApp.scale
+        for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:]):
+            xmid = (x0 + x1) / 2
+            self.assertLessEqual(abs(xmid**3 - xmid - (y0 + y1) / 2), tolerance)
+        self.assertLess(xs[2] - xs[1], xs[len(xs) // 2 + 1] - xs[len(xs) // 2])
+        # no samples where the function is undefined
+        self.assertTrue(all(math.isnan(y) for x, y in zip(root._xs, root._ys) if x < 0))
+        self.assertEqual(root._xs[-1], 0.25)
+        # a small pan moves the plot, a larger one extends the samples
+        gfx = cubic.gfx
+        ma.view_position = (1 / MathApp.scale, 0)
+        self.assertIs(cubic._xs, xs)
+        self.assertEqual(cubic.position, MathApp.logicalToPhysical((0, 0)))
+        ma.view_position = (ma.width / MathApp.scale, 0)
+        self.assertIs(cubic.gfx, gfx)
+        lo, hi = cubic._covered
+        self.assertEqual(
+            cubic._xs, [x for x in cubic._sample(lo, hi)[0] if lo <= x <= hi]
+        )
+        self.assertLessEqual(cubic._xs[0], ma.width / MathApp.scale / 2)
+        # the plot follows its parameter
+        slider.value = 2
+        ma.step()
+        for x, y in zip(cubic._xs, cubic._ys):
+            self.assertAlmostEqual(y, 2 * x**3 - x)
+
+        ma.view_position = (0, 0)
+        root.destroy()
+        cubic.destroy()
+        slider.destroy()
+        MathApp.destroy()
+
+    def test_trail(self):
+        p1 = Point((0, 0))
+        trail = Trail(p1, capacity=8, threshold=2.5)
+        ma = MathApp()
+        ma.view_position = (0, 0)
+        ma.step()
+        gfx = trail.gfx
+        # positions are added every 3 pixels, and only the last 8 are kept
+        for i in range(39):
+            p1.translate((1, 0))
+            ma.step()
+        positions = trail.positions()
+        self.assertEqual(len(positions), 8)
+        self.assertEqual(positions[-1], p1())
+        self.assertAlmostEqual((positions[-1][0] - positions[0][0]) * MathApp.scale, 21)
+        self.assertIs(trail.gfx, gfx)
+        self.assertLessEqual(len(trail.asset.path), 9)
+        self.assertEqual(trail.asset.path[-1], (p1()[0] * MathApp.scale, 0))
+        # the trail is redrawn to scale after a zoom
+        ma._handleMouseWheel(SimpleNamespace(wheeldelta=10))
+        p1.translate((10, 0))
+        ma.step()
+        MathApp.zoomdebounce = 0
+        ma.step()
+        MathApp.zoomdebounce = 0.25
+        self.assertEqual(trail.scale, 1)
+        self.assertEqual(trail.asset.path[-1], (p1()[0] * MathApp.scale, 0))
+        self.assertEqual(len(trail.asset.path), 8)
+        trail.clear()
+        self.assertEqual(trail.positions(), [])
+
+        ma.view_position = (0, 0)
+        trail.destroy()
+        p1.destroy()
+        MathApp.destroy()
+
+    def test_clip(self):
+        rect = (0, 0, 100, 80)
+        self.assertIsNone(clipCircle((50, 40), 10, rect))
+        self.assertEqual(clipCircle((500, 40), 10, rect), ())
+        self.assertEqual(
+            clipCircle((50, 40), 1000, rect), ((0, 0), (100, 0), (100, 80), (0, 80))
+        )
+        poly = clipCircle((0, 0), 60, rect)
+        self.assertIs(clipCircle((0, 0), 60, rect), poly)
+        for x, y in poly:
+            self.assertTrue(0 <= x <= 100 and 0 <= y <= 80)
+            self.assertLessEqual(x * x + y * y, 60 * 60 + 1e-6)
+        self.assertIn((0, 0), poly)
+        self.assertIn((60, 0), poly)
+        self.assertIn((0, 60), poly)
+        # a planet sized circle is drawn as a polygon covering the window
+        ma = MathApp(0.001)
+        ma.view_position = (0, 6.371e6)
+        planet = Circle((0, 0), 6.371e6)
+        self.assertIsInstance(planet.asset, PolygonAsset)
+        gfx = planet.gfx
+        ma.view_position = (1000, 6.371e6)
+        self.assertIs(planet.gfx, gfx)
+        x, y = planet.position
+        for px, py in planet.asset.path:
+            self.assertTrue(-2 <= px + x <= ma.width + 2)
+            self.assertTrue(-2 <= py + y <= ma.height + 2)
+
+        ma.view_position = (0, 0)
+        planet.destroy()
+        MathApp.destroy()
+
     def test_fancycontrols(self):
         self.imgbutton = InputImageButton(
             "images/button-round.png",
@@ -147,6 +471,58 @@ class TestMathMethods(unittest.TestCase):
 
         self.timer.destroy()
 
+    def test_timerhandles(self):
+        ma = MathApp()
+        timer = Timer()
+        calls = []
+        timer.callAfter(0.3, lambda t: calls.append("after"))
+        cancelled = timer.callAfter(0.2, lambda t: calls.append("cancelled"))
+        periodic = timer.callEvery(0.25, lambda t: calls.append("every"))
+        timer.callAt(0.1, lambda t: calls.append("at"))
+        cancelled.cancel()
+        self.assertTrue(cancelled.cancelled)
+        for now in (0.15, 0.22, 0.35, 0.45, 1.1):
+            ma._starttime = time.time() - now
+            ma.step()
+        # the periodic callback keeps to its schedule (0.25, 0.5, 0.75,
+        # 1.0...), skipping periods that were missed
+        self.assertEqual(calls, ["at", "every", "after", "every"])
+        self.assertEqual(periodic.time, 1.25)
+        periodic.cancel()
+        ma._starttime = time.time() - 2
+        ma.step()
+        self.assertEqual(len(calls), 4)
+        timer.destroy()
+        MathApp.destroy()
+
+    def test_timerwheel(self):
+        ma = MathApp()
+        timers = [Timer() for i in range(100)]
+        calls = []
+        timers[10].callAfter(500, lambda t: calls.append("late"))
+        timers[20].callAfter(0.02, lambda t: calls.append("second"))
+        timers[30].callAfter(0.01, lambda t: calls.append("first"))
+        # idle timers are not stepped; a timer used as an input is
+        label = Label((0, 0), timers[40])
+        text = label.asset.text
+        self.assertNotIn(timers[0], MathApp._mathDynamicList)
+        self.assertIn(timers[40], MathApp._mathDynamicList)
+        ma._starttime = time.time() - 1
+        ma.step()
+        self.assertEqual(calls, ["first", "second"])
+        self.assertNotEqual(label.asset.text, text)
+        ma._starttime = time.time() - 499
+        ma.step()
+        self.assertEqual(len(calls), 2)
+        ma._starttime = time.time() - 501
+        ma.step()
+        self.assertEqual(calls[-1], "late")
+        label.destroy()
+        self.assertNotIn(timers[40], MathApp._mathDynamicList)
+        for timer in timers:
+            timer.destroy()
+        MathApp.destroy()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import unittest
 from ggame import ImageAsset, Frame, Color, LineStyle, RectangleAsset
 from ggame import CircleAsset, EllipseAsset, PolygonAsset, LineAsset, TextAsset
@@ -80,6 +83,44 @@ class TestSpriteMethods(unittest.TestCase):
         s6.destroy()
         s7.destroy()
 
+    def test_textreuse(self):
+        # a reused text render starts untransformed (the null backend
+        # supports transforming text)
+        env = dict(os.environ, GGAME_BACKEND="null")
+        code = (
+            "from ggame.asset import TextAsset\n"
+            "from ggame.sprite import Sprite\n"
+            "s1 = Sprite(TextAsset('reused'), (10, 20))\n"
+            "s1.rotation = 1.0\n"
+            "s1.scale = 2\n"
+            "s1.center = (0.5, 0.5)\n"
+            "gfx = s1.gfx\n"
+            "s1.destroy()\n"
+            "s2 = Sprite(TextAsset('reused'))\n"
+            "assert s2.gfx is gfx\n"
+            "assert (s2.rotation, s2.scale, s2.center) == (0, 1, (0, 0))\n"
+            "assert s2.position == (0, 0) and s2.visible\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        self.assertEqual(out.returncode, 0, out.stderr)
+
+    def test_textrendercount(self):
+        cache = TextAsset.rendercache
+        cache.clear()
+        asset = TextAsset("counted")
+        # one render for the sprite's copy, none for the asset itself
+        s1 = Sprite(asset)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        s1.destroy()
+        s2 = Sprite(asset)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 0)
+        s2.destroy()
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+
     def test_advancedspritecollision(self):
         class SpriteChild(Sprite):
             pass